@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Validate and benchmark the pure-Python fuzzy scorers in src/matching/score.py.
+
+Slim images run without rapidfuzz, so scoring falls back to `_py_ratio` /
+`_py_partial_ratio` (bit-parallel LCS). This script checks those against
+rapidfuzz scores recorded in a fixture (and against a live rapidfuzz when it
+is installed), then times them against the previous difflib fallback:
+
+    # Validate + benchmark (works without rapidfuzz)
+    python3 -m src.bench.bench_fuzzy
+
+    # Re-record the fixture from the catalog (needs rapidfuzz)
+    python3 -m src.bench.bench_fuzzy --record --pairs 600
+"""
+from __future__ import annotations
+import argparse
+import difflib
+import json
+import os
+import random
+import time
+from typing import Callable, Dict, List, Tuple
+
+from src.matching.score import _py_partial_ratio, _py_ratio
+from src.utils.normalize import normalize_for_match
+
+try:
+    import rapidfuzz as _rf  # type: ignore
+    from rapidfuzz import fuzz as _rf_fuzz  # type: ignore
+except Exception:  # pragma: no cover - rapidfuzz optional
+    _rf = None
+    _rf_fuzz = None
+
+
+DEFAULT_FIXTURE = os.path.join(os.path.dirname(__file__), 'fixtures', 'fuzzy_pairs.jsonl')
+SUFFIXES = ['', ' ep 3', ' full hd', ' 完整版', ' 第12集', ' 1080p eng sub', ' trailer reaction']
+
+
+def difflib_ratio(a: str, b: str) -> float:
+    return difflib.SequenceMatcher(None, a, b).ratio() * 100.0
+
+
+def difflib_partial_ratio(a: str, b: str) -> float:
+    # The sliding-window fallback this repo used before _py_partial_ratio
+    if not a or not b:
+        return 0.0
+    if len(a) < len(b):
+        a, b = b, a
+    best = 0.0
+    window = len(b)
+    for i in range(len(a) - window + 1):
+        best = max(best, difflib_ratio(a[i : i + window], b))
+        if best >= 99.0:
+            break
+    return best
+
+
+def build_pairs(data_path: str, count: int, seed: int = 0) -> List[Tuple[str, str]]:
+    """(title, alias) pairs shaped like real candidates: decorated, truncated, shuffled or unrelated titles."""
+    with open(data_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    aliases = sorted({normalize_for_match(a['name']) for a in data.get('aliases', []) if a.get('name')} - {''})
+    rng = random.Random(seed)
+    pairs = []
+    for _ in range(count):
+        alias = rng.choice(aliases)
+        kind = rng.random()
+        if kind < 0.3:
+            title = alias + rng.choice(SUFFIXES)
+        elif kind < 0.5:
+            title = ''.join(ch for ch in alias if rng.random() > 0.2) + rng.choice(SUFFIXES)
+        elif kind < 0.65:
+            tokens = alias.split()
+            rng.shuffle(tokens)
+            title = ' '.join(tokens) + rng.choice(SUFFIXES)
+        elif kind < 0.8:
+            title = rng.choice(aliases) + ' ' + alias[: max(1, len(alias) // 2)]
+        else:
+            title = rng.choice(aliases) + rng.choice(SUFFIXES)
+        pairs.append((title, alias))
+    return pairs
+
+
+def record(path: str, pairs: List[Tuple[str, str]]) -> None:
+    if _rf_fuzz is None:
+        raise SystemExit('--record needs rapidfuzz installed')
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        for title, alias in pairs:
+            f.write(json.dumps({
+                'title': title,
+                'alias': alias,
+                'ratio': _rf_fuzz.ratio(title, alias),
+                'partial_ratio': _rf_fuzz.partial_ratio(title, alias),
+                'rapidfuzz': _rf.__version__,
+            }, ensure_ascii=False) + '\n')
+    print(f'Recorded {len(pairs)} pairs to {path} (rapidfuzz {_rf.__version__})')
+
+
+def load_fixture(path: str) -> List[Dict]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def validate(name: str, expected: List[float], actual: List[float], tolerance: float) -> bool:
+    diffs = [abs(e - a) for e, a in zip(expected, actual)]
+    worst = max(diffs) if diffs else 0.0
+    exact = sum(1 for d in diffs if d == 0.0)
+    ok = worst <= tolerance
+    print(f'  {name}: {exact}/{len(diffs)} identical, max abs diff {worst:.6f} ({"ok" if ok else "FAIL"})')
+    return ok
+
+
+def _time(fn: Callable[[str, str], float], pairs: List[Tuple[str, str]]) -> float:
+    started = time.perf_counter()
+    for title, alias in pairs:
+        fn(title, alias)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate and benchmark the pure-Python fuzzy scorers.')
+    parser.add_argument('--data', default=os.environ.get('DATA_JSON', 'data/data.json'))
+    parser.add_argument('--fixture', default=DEFAULT_FIXTURE)
+    parser.add_argument('--record', action='store_true', help='Write the fixture from rapidfuzz and exit')
+    parser.add_argument('--pairs', type=int, default=1500, help='Pairs to record / benchmark')
+    parser.add_argument('--tolerance', type=float, default=0.5, help='Allowed abs diff vs rapidfuzz')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    if args.record:
+        record(args.fixture, build_pairs(args.data, args.pairs, args.seed))
+        return
+
+    ok = True
+    if os.path.exists(args.fixture):
+        fixture = load_fixture(args.fixture)
+        print(f'Fixture {args.fixture}: {len(fixture)} pairs (rapidfuzz {fixture[0]["rapidfuzz"] if fixture else "?"})')
+        ok &= validate('ratio', [r['ratio'] for r in fixture], [_py_ratio(r['title'], r['alias']) for r in fixture], args.tolerance)
+        ok &= validate(
+            'partial_ratio',
+            [r['partial_ratio'] for r in fixture],
+            [_py_partial_ratio(r['title'], r['alias']) for r in fixture],
+            args.tolerance,
+        )
+
+    pairs = build_pairs(args.data, args.pairs, args.seed + 1)
+    if _rf_fuzz is not None:
+        print(f'Live rapidfuzz {_rf.__version__} on {len(pairs)} fresh pairs:')
+        ok &= validate('ratio', [_rf_fuzz.ratio(t, a) for t, a in pairs], [_py_ratio(t, a) for t, a in pairs], args.tolerance)
+        ok &= validate(
+            'partial_ratio',
+            [_rf_fuzz.partial_ratio(t, a) for t, a in pairs],
+            [_py_partial_ratio(t, a) for t, a in pairs],
+            args.tolerance,
+        )
+
+    print(f'Timing on {len(pairs)} pairs:')
+    timings = [
+        ('difflib partial_ratio (previous fallback)', difflib_partial_ratio),
+        ('_py_partial_ratio', _py_partial_ratio),
+        ('_py_partial_ratio, score_cutoff=70 (as the pruned scorer calls it)', lambda a, b: _py_partial_ratio(a, b, 70.0)),
+        ('difflib ratio (previous fallback)', difflib_ratio),
+        ('_py_ratio', _py_ratio),
+    ]
+    if _rf_fuzz is not None:
+        timings += [('rapidfuzz partial_ratio', _rf_fuzz.partial_ratio), ('rapidfuzz ratio', _rf_fuzz.ratio)]
+    for name, fn in timings:
+        seconds = _time(fn, pairs)
+        print(f'  {name}: {seconds:.3f}s ({seconds / len(pairs) * 1e6:.1f}us/pair)')
+
+    if not ok:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for src/utils/normalize.py.
+
+Compares the previous uncompiled implementation (kept below as the
+reference) against the current compiled + memoized one on a title corpus,
+checks that both give identical output, and prints the memo hit rate:
+
+    python3 -m src.bench.bench_normalize --titles 200000
+
+The corpus is built from data.json aliases dressed up like upload titles
+(episode markers, quality tags, punctuation), drawn from a pool of
+`--distinct` titles to mimic how often the same titles come back across
+terms and runs; `--csv` adds the `title` column of a report file.
+"""
+from __future__ import annotations
+import argparse
+import csv
+import json
+import os
+import random
+import re
+import time
+import unicodedata
+from typing import Callable, List
+
+from src.utils.normalize import clear_normalize_cache, normalize_cache_stats, normalize_for_match, normalize_text
+
+
+_REF_APOSTROPHES = {"’": "'", "`": "'", "´": "'", "‘": "'", "ʻ": "'"}
+
+
+def reference_normalize_text(s: str) -> str:
+    if s is None:
+        return ""
+    s = unicodedata.normalize("NFKC", str(s))
+    for k, v in _REF_APOSTROPHES.items():
+        s = s.replace(k, v)
+    s = re.sub(r"\s+", " ", s)
+    return s.strip()
+
+
+def reference_normalize_for_match(s: str) -> str:
+    s = reference_normalize_text(s)
+    s = s.casefold()
+    s = re.sub(r"[　\s]+", " ", s)
+    s = re.sub(r"[\.,;:!\?\-_/\\\(\)\[\]\{\}\|\*\^\$`~\"'“”‘’·]+", " ", s)
+    s = re.sub(r"\s+", " ", s).strip()
+    return s
+
+
+DECORATIONS = [
+    '{} EP{}', '{} 第{}集', '【{}】 Episode {} (1080p)', '{} - Ep.{} | Full HD', '{}  全集 {}',
+    '“{}” ‘part {}’', '{} ตอนที่ {}', '{}　完整版 {}', '{} [Eng Sub] E{}', '{}/{}',
+]
+
+
+def build_corpus(data_path: str, size: int, distinct: int, csv_path: str = '', seed: int = 0) -> List[str]:
+    with open(data_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    names = [a['name'] for a in data.get('aliases', []) if a.get('name')]
+    if csv_path and os.path.exists(csv_path):
+        with open(csv_path, 'r', encoding='utf-8') as f:
+            names.extend(row['title'] for row in csv.DictReader(f) if row.get('title'))
+    rng = random.Random(seed)
+    pool = [rng.choice(DECORATIONS).format(rng.choice(names), rng.randint(1, 40)) for _ in range(max(1, distinct))]
+    return [rng.choice(pool) for _ in range(size)]
+
+
+def _time(fn: Callable[[str], str], corpus: List[str]) -> float:
+    started = time.perf_counter()
+    for s in corpus:
+        fn(s)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark text normalization.')
+    parser.add_argument('--data', default=os.environ.get('DATA_JSON', 'data/data.json'))
+    parser.add_argument('--csv', default='', help='Optional report CSV whose titles join the corpus')
+    parser.add_argument('--titles', type=int, default=200000, help='Corpus size')
+    parser.add_argument('--distinct', type=int, default=20000, help='Distinct titles the corpus is drawn from')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.data, args.titles, args.distinct, args.csv, args.seed)
+    print(f'Corpus: {len(corpus)} titles, {len(set(corpus))} distinct')
+
+    mismatches = sum(
+        1 for s in set(corpus)
+        if normalize_for_match(s) != reference_normalize_for_match(s) or normalize_text(s) != reference_normalize_text(s)
+    )
+    print(f'Output mismatches vs reference: {mismatches}')
+
+    for name, ref, new in (
+        ('normalize_text', reference_normalize_text, normalize_text),
+        ('normalize_for_match', reference_normalize_for_match, normalize_for_match),
+    ):
+        clear_normalize_cache()
+        before = _time(ref, corpus)
+        cold = _time(new, corpus)
+        warm = _time(new, corpus)
+        stats = normalize_cache_stats()[name]
+        rate = stats['hits'] / max(1, stats['hits'] + stats['misses']) * 100.0
+        print(
+            f'{name}: reference {before:.3f}s, compiled+memo {cold:.3f}s ({before / cold:.1f}x), '
+            f'warm memo {warm:.3f}s ({before / warm:.1f}x); memo {rate:.1f}% hits, size {stats["size"]}'
+        )
+
+if __name__ == '__main__':
+    main()
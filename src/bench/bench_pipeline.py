@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+End-to-end pipeline benchmark against the local Dailymotion stand-in.
+
+Starts the stand-in in-process, points DAILYMOTION_API_BASE at it, runs the
+detection pipeline (and optionally the recheck) in a scratch directory, and
+prints wall time, throughput and server-side latency percentiles:
+
+    python3 -m src.bench.bench_pipeline --series 10 --latency-ms 80 --jitter-ms 40 \\
+        --quota-rps 20 --recheck
+
+Any DAILYMOTION_* variables already in the environment (concurrency, cache,
+prefetch, ...) apply to the run, so configurations can be compared directly.
+The Supabase variants are not covered because they need a database.
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from src.bench.dailymotion_standin import add_standin_args, config_from_args, start_standin
+
+
+def _series_ids(data_path: str, count: int) -> list:
+    with open(data_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return [s['series_id'] for s in data.get('series', []) if s.get('series_id')][:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the detection pipeline against a local stand-in.')
+    parser.add_argument('--data', default=os.environ.get('DATA_JSON', 'data/data.json'))
+    parser.add_argument('--series', type=int, default=10, help='Number of series to search (0 = all)')
+    parser.add_argument('--recheck', action='store_true', help='Also run recheck_videos on the new state')
+    add_standin_args(parser)
+    args = parser.parse_args()
+
+    server = start_standin(config_from_args(args))
+    workdir = tempfile.mkdtemp(prefix='dm-bench-')
+    os.environ['DAILYMOTION_API_BASE'] = server.base_url
+    os.environ['DATA_JSON'] = os.path.abspath(args.data)
+    os.environ['STATE_DIR'] = os.path.join(workdir, 'state')
+    os.environ['REPORT_DIR'] = os.path.join(workdir, 'reports')
+    os.environ.setdefault('DAILYMOTION_SLEEP_SEC', '0')
+    os.environ.setdefault('DAILYMOTION_RECHECK_SLEEP_SEC', '0')
+    os.environ.setdefault('DAILYMOTION_GEO_SLEEP_SEC', '0')
+    if args.series > 0:
+        os.environ['DAILYMOTION_SERIES_IDS'] = ','.join(_series_ids(args.data, args.series))
+
+    # Imported after DAILYMOTION_API_BASE is set, since the client reads it at import time
+    from src.pipeline import recheck_videos, run_dailymotion
+    from src.matching.score import format_scoring_stats
+    from src.platforms.dailymotion import format_request_stats, get_request_stats
+
+    timings = {}
+    started = time.perf_counter()
+    run_dailymotion.main()
+    timings['run_dailymotion'] = time.perf_counter() - started
+    if args.recheck:
+        started = time.perf_counter()
+        recheck_videos.main()
+        timings['recheck_videos'] = time.perf_counter() - started
+
+    server.shutdown()
+    summary = server.state.summary()
+    client_requests = sum(c['requests'] for c in get_request_stats().values())
+    total = sum(timings.values())
+
+    print('\n=== Benchmark ===')
+    print(f'Scratch dir: {workdir}')
+    for name, seconds in timings.items():
+        print(f'{name}: {seconds:.2f}s')
+    if total:
+        print(f'Client requests: {client_requests} ({client_requests / total:.1f} req/s overall)')
+    print(
+        f"Server: {summary['requests']} requests, status {summary['status_counts']}, "
+        f"p50 {summary['p50_ms']}ms, p95 {summary['p95_ms']}ms, p99 {summary['p99_ms']}ms, max {summary['max_ms']}ms"
+    )
+    print(format_request_stats())
+    print(format_scoring_stats())
+
+
+if __name__ == '__main__':
+    main()
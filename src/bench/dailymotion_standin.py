@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the Dailymotion API (`/videos` and `/video/{id}`).
+
+Serves synthetic responses, replays responses recorded from the real API,
+or records them by proxying to an upstream. Latency, 5xx errors and 429
+throttling can be injected so the pipelines can be benchmarked offline:
+
+    # Synthetic data, 80ms +/- 40ms latency, 429 above 4 req/s, 1% errors
+    python3 -m src.bench.dailymotion_standin --port 8765 --latency-ms 80 \\
+        --jitter-ms 40 --quota-rps 4 --error-rate 0.01
+
+    # Record real responses once, then replay them
+    python3 -m src.bench.dailymotion_standin --record fixtures/dm.jsonl
+    python3 -m src.bench.dailymotion_standin --replay fixtures/dm.jsonl
+
+    DAILYMOTION_API_BASE=http://127.0.0.1:8765 python3 -m src.pipeline.run_dailymotion
+"""
+from __future__ import annotations
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+
+from src.platforms.cache import normalize_url
+
+
+TITLE_SUFFIXES = [' EP1', ' Full HD', ' 完整版', ' 全集', ' ep 12', ' 1080p', '']
+NOISE_TITLES = ['funny cats compilation', 'cooking show', 'news today', 'music mix 2024', 'trailer reaction']
+
+
+def _key(path_and_query: str) -> str:
+    # Recordings are keyed host-independently so they replay against any base URL
+    return normalize_url(f'http://standin{path_and_query}')
+
+
+class StandinConfig:
+    """Knobs for the stand-in. Rates are probabilities per request."""
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        quota_rps: float = 0.0,
+        retry_after: float = 1.0,
+        max_pages: int = 3,
+        match_rate: float = 0.6,
+        removed_rate: float = 0.1,
+        private_rate: float = 0.05,
+        seed: int = 0,
+        replay: Optional[str] = None,
+        record: Optional[str] = None,
+        upstream: str = 'https://api.dailymotion.com',
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.quota_rps = quota_rps
+        self.retry_after = retry_after
+        self.max_pages = max_pages
+        self.match_rate = match_rate
+        self.removed_rate = removed_rate
+        self.private_rate = private_rate
+        self.seed = seed
+        self.replay = replay
+        self.record = record
+        self.upstream = upstream.rstrip('/')
+
+
+class StandinState:
+    """Shared server state: recordings, fault RNG and per-request service stats."""
+
+    def __init__(self, config: StandinConfig):
+        self.config = config
+        self.lock = threading.Lock()
+        self.rng = random.Random(config.seed)
+        self.recordings: Dict[str, Tuple[int, Dict]] = {}
+        self.latencies: List[float] = []
+        self.status_counts: Dict[int, int] = {}
+        # Server-side quota bucket (one second of burst), like the real API's rate limit
+        self._quota_tokens = max(1.0, config.quota_rps)
+        self._quota_last = time.monotonic()
+        if config.replay and os.path.exists(config.replay):
+            with open(config.replay, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        rec = json.loads(line)
+                        self.recordings[rec['key']] = (rec['status'], rec['body'])
+
+    def roll(self) -> float:
+        with self.lock:
+            return self.rng.random()
+
+    def over_quota(self) -> bool:
+        if self.config.quota_rps <= 0:
+            return False
+        with self.lock:
+            now = time.monotonic()
+            capacity = max(1.0, self.config.quota_rps)
+            self._quota_tokens = min(capacity, self._quota_tokens + (now - self._quota_last) * self.config.quota_rps)
+            self._quota_last = now
+            if self._quota_tokens >= 1.0:
+                self._quota_tokens -= 1.0
+                return False
+            return True
+
+    def observe(self, status: int, elapsed: float) -> None:
+        with self.lock:
+            self.latencies.append(elapsed)
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+
+    def save_recording(self, key: str, status: int, body: Dict) -> None:
+        with self.lock:
+            self.recordings[key] = (status, body)
+            with open(self.config.record, 'a', encoding='utf-8') as f:
+                f.write(json.dumps({'key': key, 'status': status, 'body': body}, ensure_ascii=False) + '\n')
+
+    def summary(self) -> Dict:
+        with self.lock:
+            lat = sorted(self.latencies)
+            counts = dict(self.status_counts)
+
+        def pct(p: float) -> float:
+            if not lat:
+                return 0.0
+            return lat[min(len(lat) - 1, int(round(p / 100.0 * (len(lat) - 1))))] * 1000.0
+
+        return {
+            'requests': len(lat),
+            'status_counts': counts,
+            'p50_ms': round(pct(50), 1),
+            'p95_ms': round(pct(95), 1),
+            'p99_ms': round(pct(99), 1),
+            'max_ms': round(lat[-1] * 1000.0, 1) if lat else 0.0,
+        }
+
+
+def _digest(*parts: object) -> str:
+    return hashlib.sha1('|'.join(str(p) for p in parts).encode('utf-8')).hexdigest()
+
+
+def synthetic_search(config: StandinConfig, query: Dict[str, str]) -> Dict:
+    term = query.get('search', '')
+    page = max(1, int(query.get('page', 1) or 1))
+    limit = max(1, min(100, int(query.get('limit', 10) or 10)))
+    created_after = int(query['created_after']) if query.get('created_after') else None
+    rng = random.Random(_digest(config.seed, term, page))
+    now = int(time.time())
+
+    items = []
+    for i in range(limit):
+        vid = 'x' + _digest(term, page, i)[:7]
+        if rng.random() < config.match_rate:
+            title = term + rng.choice(TITLE_SUFFIXES)
+        else:
+            title = rng.choice(NOISE_TITLES)
+        created = now - rng.randint(0, 90 * 86400)
+        if created_after is not None and created <= created_after:
+            continue
+        items.append({
+            'id': vid,
+            'title': title,
+            'url': f'https://www.dailymotion.com/video/{vid}',
+            'owner.username': f'user{rng.randint(1, 500)}',
+            'owner.id': f'u{rng.randint(1, 500)}',
+            'duration': rng.choice([120, 600, 1500, 2700, 5400]),
+            'created_time': created,
+            'views_total': rng.randint(0, 100000),
+        })
+    return {'page': page, 'limit': limit, 'list': items, 'has_more': page < config.max_pages}
+
+
+def synthetic_video(config: StandinConfig, video_id: str) -> Tuple[int, Dict]:
+    roll = int(_digest(config.seed, video_id)[:8], 16) / 0xFFFFFFFF
+    if roll < config.removed_rate:
+        return 404, {'error': {'code': 404, 'message': 'Not found'}}
+    if roll < config.removed_rate + config.private_rate:
+        return 403, {'error': {'code': 403, 'message': 'Forbidden'}}
+    return 200, {
+        'id': video_id,
+        'private': False,
+        'password_protected': False,
+        'status': 'ready',
+        'published': True,
+        'geoblocking': ['deny', 'CN'] if roll > 0.9 else ['allow'],
+        'views_total': 1000,
+        'updated_time': int(time.time()),
+        'duration': 2700,
+    }
+
+
+def synthetic_response(config: StandinConfig, path: str, query: Dict[str, str]) -> Tuple[int, Dict]:
+    if path.rstrip('/') == '/videos':
+        if query.get('ids'):
+            items = []
+            for vid in query['ids'].split(','):
+                status, body = synthetic_video(config, vid)
+                if status == 200:
+                    items.append(body)
+            return 200, {'page': 1, 'limit': len(items), 'list': items, 'has_more': False}
+        return 200, synthetic_search(config, query)
+    if path.startswith('/video/'):
+        return synthetic_video(config, path[len('/video/'):].strip('/'))
+    return 404, {'error': {'code': 404, 'message': f'Unknown endpoint {path}'}}
+
+
+class StandinHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server: 'StandinServer'
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+    def _send(self, status: int, body: Dict, headers: Optional[Dict[str, str]] = None) -> None:
+        payload = json.dumps(body, ensure_ascii=False).encode('utf-8')
+        if 'gzip' in (self.headers.get('Accept-Encoding') or ''):
+            payload = gzip.compress(payload)
+            headers = dict(headers or {}, **{'Content-Encoding': 'gzip'})
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _upstream(self, key: str) -> Tuple[int, Dict]:
+        state = self.server.state
+        req = urllib.request.Request(
+            f'{state.config.upstream}{self.path}', headers={'User-Agent': 'col-piracy/0.1 (+standin-record)'}
+        )
+        try:
+            with urllib.request.urlopen(req, timeout=30) as resp:
+                status, body = resp.status, json.loads(resp.read().decode('utf-8'))
+        except urllib.error.HTTPError as e:
+            status = e.code
+            try:
+                body = json.loads(e.read().decode('utf-8'))
+            except ValueError:
+                body = {'error': {'code': e.code}}
+        if status != 429 and status < 500:
+            state.save_recording(key, status, body)
+        return status, body
+
+    def do_GET(self) -> None:
+        started = time.monotonic()
+        state = self.server.state
+        config = state.config
+
+        delay = config.latency_ms + (state.roll() * 2 - 1) * config.jitter_ms
+        if delay > 0:
+            time.sleep(delay / 1000.0)
+
+        if state.over_quota() or state.roll() < config.throttle_rate:
+            status, body = 429, {'error': {'code': 429, 'message': 'Too Many Requests'}}
+            self._send(status, body, {'Retry-After': f'{config.retry_after:g}'})
+            state.observe(status, time.monotonic() - started)
+            return
+        if state.roll() < config.error_rate:
+            status, body = 503, {'error': {'code': 503, 'message': 'Service Unavailable'}}
+            self._send(status, body)
+            state.observe(status, time.monotonic() - started)
+            return
+
+        parts = urllib.parse.urlsplit(self.path)
+        key = _key(self.path)
+        if key in state.recordings:
+            status, body = state.recordings[key]
+        elif config.record:
+            status, body = self._upstream(key)
+        else:
+            query = dict(urllib.parse.parse_qsl(parts.query))
+            status, body = synthetic_response(config, parts.path, query)
+
+        self._send(status, body)
+        state.observe(status, time.monotonic() - started)
+
+
+class StandinServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], config: StandinConfig):
+        super().__init__(address, StandinHandler)
+        self.state = StandinState(config)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f'http://{host}:{port}'
+
+
+def start_standin(config: StandinConfig, host: str = '127.0.0.1', port: int = 0) -> StandinServer:
+    """Start a stand-in on a background thread and return it (use .base_url / .shutdown())."""
+    server = StandinServer((host, port), config)
+    thread = threading.Thread(target=server.serve_forever, name='dailymotion-standin', daemon=True)
+    thread.start()
+    return server
+
+
+def add_standin_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--latency-ms', type=float, default=0.0, help='Mean injected latency per request')
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help='Uniform +/- jitter around the latency')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Probability of a 503 response')
+    parser.add_argument('--throttle-rate', type=float, default=0.0, help='Probability of a random 429 response')
+    parser.add_argument('--quota-rps', type=float, default=0.0, help='Answer 429 when clients exceed this rate (0 = off)')
+    parser.add_argument('--retry-after', type=float, default=1.0, help='Retry-After seconds sent with 429s')
+    parser.add_argument('--max-pages', type=int, default=3, help='Search pages per term before has_more=false')
+    parser.add_argument('--match-rate', type=float, default=0.6, help='Share of synthetic titles containing the term')
+    parser.add_argument('--removed-rate', type=float, default=0.1, help='Share of video ids answering 404')
+    parser.add_argument('--private-rate', type=float, default=0.05, help='Share of video ids answering 403')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for synthetic data and fault injection')
+    parser.add_argument('--replay', help='JSONL recording to serve (misses fall back to synthetic data)')
+    parser.add_argument('--record', help='Proxy misses to --upstream and append responses to this JSONL file')
+    parser.add_argument('--upstream', default='https://api.dailymotion.com', help='Upstream API for --record')
+
+
+def config_from_args(args: argparse.Namespace) -> StandinConfig:
+    return StandinConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        quota_rps=args.quota_rps,
+        retry_after=args.retry_after,
+        max_pages=args.max_pages,
+        match_rate=args.match_rate,
+        removed_rate=args.removed_rate,
+        private_rate=args.private_rate,
+        seed=args.seed,
+        replay=args.replay or args.record,
+        record=args.record,
+        upstream=args.upstream,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local Dailymotion API stand-in for offline benchmarks.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    add_standin_args(parser)
+    args = parser.parse_args()
+
+    server = StandinServer((args.host, args.port), config_from_args(args))
+    print(f'Dailymotion stand-in listening on {server.base_url} (set DAILYMOTION_API_BASE to this)')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(json.dumps(server.state.summary(), ensure_ascii=False))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,7 @@
 """Supabase database operations for piracy detection system."""
 import os
 from datetime import date
-from typing import List, Dict, Iterable
+from typing import List, Dict, Iterable, Iterator
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
@@ -78,6 +78,51 @@ def _chunked(items: Iterable, size: int):
         yield buf
 
 
+def iter_videos(
+    columns: str = '*',
+    platform: str = 'dailymotion',
+    page_size: int = 1000,
+) -> Iterator[List[Dict]]:
+    """
+    Yield pages of videos ordered by video_id, using keyset pagination.
+
+    Each page starts after the last video_id of the previous one, so the query
+    cost does not grow with depth the way offset pagination does, and rows
+    updated while iterating do not shift later pages. `columns` must include
+    video_id.
+    """
+    client = get_client()
+    last_id = None
+    while True:
+        query = client.table('videos').select(columns).eq('platform', platform)
+        if last_id is not None:
+            query = query.gt('video_id', last_id)
+        response = query.order('video_id', desc=False).limit(page_size).execute()
+        if not response.data:
+            break
+        yield response.data
+        if len(response.data) < page_size:
+            break
+        last_id = response.data[-1]['video_id']
+
+
+def upsert_video_scores(rows: List[Dict], batch_size: int = 500) -> int:
+    """
+    Write raw_score/score back for existing videos in batched upserts. Returns count written.
+
+    Rows carry the primary key (platform, video_id) plus first_seen, which is
+    NOT NULL in the schema and must be sent even though only the scores change.
+    """
+    if not rows:
+        return 0
+    client = get_client()
+    total = 0
+    for batch in _chunked(rows, batch_size):
+        client.table('videos').upsert(batch, on_conflict='platform,video_id').execute()
+        total += len(batch)
+    return total
+
+
 def set_ignore_reason(video_ids: List[str], reason: str, platform: str = 'dailymotion', batch_size: int = 500) -> int:
     """Mark a list of videos with an ignore reason. Returns count updated."""
     if not video_ids:
@@ -149,6 +194,21 @@ def update_video_status(video_id: str, api_status: str, platform: str = 'dailymo
     }).eq('platform', platform).eq('video_id', video_id).execute()
 
 
+def update_video_statuses(video_ids: List[str], api_status: str, platform: str = 'dailymotion', batch_size: int = 500) -> int:
+    """Set the same status on many videos after recheck. Returns count updated."""
+    if not video_ids:
+        return 0
+    client = get_client()
+    total = 0
+    for batch in _chunked(video_ids, batch_size):
+        response = client.table('videos').update({
+            'api_status': api_status,
+            'api_last_checked': date.today().isoformat()
+        }).eq('platform', platform).in_('video_id', batch).execute()
+        total += len(response.data) if response.data else 0
+    return total
+
+
 def delete_removed_videos() -> int:
     """Delete videos that are permanently removed (404). Private videos are kept for follow-up. Returns count deleted."""
     client = get_client()
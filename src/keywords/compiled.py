@@ -0,0 +1,172 @@
+from __future__ import annotations
+import hashlib
+import json
+import os
+from typing import Collection, Dict, List, Optional, Tuple
+
+from src.keywords.expand import build_series_keywords
+from src.matching.score import SeriesMatcher, build_series_matchers
+from src.utils.normalize import normalize_for_match
+
+
+# Bump when build_series_keywords or normalization change what a plan holds
+PLAN_VERSION = 1
+
+
+def plan_key(
+    data_bytes: bytes,
+    *,
+    include_ep_patterns: bool,
+    max_aliases: Optional[int],
+    min_alias_length: int,
+    low_yield_terms: Collection[str] = (),
+    low_yield_mode: str = 'demote',
+) -> str:
+    """Hash of the catalog file contents plus the settings (and low-yield terms) that shape the compiled plan."""
+    h = hashlib.sha1(data_bytes)
+    h.update(f'|v{PLAN_VERSION}|ep={int(include_ep_patterns)}|max={max_aliases}|min={min_alias_length}'.encode('utf-8'))
+    if low_yield_terms:
+        h.update(f'|{low_yield_mode}|'.encode('utf-8'))
+        h.update('\x1e'.join(sorted(low_yield_terms)).encode('utf-8'))
+    return h.hexdigest()
+
+
+class CompiledSearchPlan:
+    """
+    Everything the pipelines derive from data.json before searching.
+
+    Holds the search terms and filtered aliases from build_series_keywords,
+    the aliases' normalized match forms (so SeriesMatcher skips normalizing
+    them), canonical titles and the whitelist. It is stored as JSON in
+    STATE_DIR under `key` (plan_key) and reused while neither the catalog
+    nor the alias settings change.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        keywords_by_sid: Dict[str, List[str]],
+        aliases_by_sid: Dict[str, List[str]],
+        norms_by_sid: Dict[str, List[str]],
+        titles_by_sid: Dict[str, str],
+        whitelist: List[Dict],
+    ):
+        self.key = key
+        self.keywords_by_sid = keywords_by_sid
+        self.aliases_by_sid = aliases_by_sid
+        self.norms_by_sid = norms_by_sid
+        self.titles_by_sid = titles_by_sid
+        self.whitelist = whitelist
+
+    def matchers(self, aliases_by_sid: Optional[Dict[str, List[str]]] = None) -> Dict[str, SeriesMatcher]:
+        """SeriesMatchers for `aliases_by_sid` (default: every series), built from the stored match forms."""
+        return build_series_matchers(self.aliases_by_sid if aliases_by_sid is None else aliases_by_sid, self.norms_by_sid)
+
+    def to_dict(self) -> Dict:
+        return {
+            'key': self.key,
+            'keywords_by_sid': self.keywords_by_sid,
+            'aliases_by_sid': self.aliases_by_sid,
+            'norms_by_sid': self.norms_by_sid,
+            'titles_by_sid': self.titles_by_sid,
+            'whitelist': self.whitelist,
+        }
+
+    @classmethod
+    def from_dict(cls, raw: Dict) -> 'CompiledSearchPlan':
+        return cls(
+            raw['key'],
+            raw['keywords_by_sid'],
+            raw['aliases_by_sid'],
+            raw['norms_by_sid'],
+            raw['titles_by_sid'],
+            raw.get('whitelist') or [],
+        )
+
+
+def compile_search_plan(
+    data: Dict,
+    key: str,
+    *,
+    include_ep_patterns: bool,
+    max_aliases: Optional[int],
+    min_alias_length: int,
+    low_yield_terms: Collection[str] = (),
+    low_yield_mode: str = 'demote',
+) -> CompiledSearchPlan:
+    keywords_by_sid, aliases_by_sid = build_series_keywords(
+        data,
+        include_ep_patterns=include_ep_patterns,
+        max_aliases=max_aliases,
+        min_alias_length=min_alias_length,
+        low_yield_terms=low_yield_terms,
+        low_yield_mode=low_yield_mode,
+    )
+    norms_by_sid = {
+        sid: [n for n in dict.fromkeys(normalize_for_match(a) for a in aliases) if n]
+        for sid, aliases in aliases_by_sid.items()
+    }
+    titles_by_sid = {
+        item['series_id']: item.get('canonical_title') or ''
+        for item in data.get('series', [])
+        if item.get('series_id')
+    }
+    return CompiledSearchPlan(key, keywords_by_sid, aliases_by_sid, norms_by_sid, titles_by_sid, data.get('whitelist', []))
+
+
+def load_search_plan(
+    data_path: str,
+    state_dir: str,
+    *,
+    include_ep_patterns: bool,
+    max_aliases: Optional[int],
+    min_alias_length: int,
+    low_yield_terms: Collection[str] = (),
+    low_yield_mode: str = 'demote',
+    enabled: bool = True,
+) -> Tuple[CompiledSearchPlan, bool]:
+    """
+    Compiled plan for `data_path` and the alias settings, as (plan, loaded_from_cache).
+
+    Reads STATE_DIR/search_plan.json when its key matches the catalog hash and
+    settings; otherwise compiles the plan from data.json and rewrites the file
+    (unless `enabled` is False, in which case nothing is read or written).
+    `low_yield_terms` / `low_yield_mode` are passed to build_series_keywords
+    and are part of the key.
+    """
+    with open(data_path, 'rb') as f:
+        data_bytes = f.read()
+    key = plan_key(
+        data_bytes,
+        include_ep_patterns=include_ep_patterns,
+        max_aliases=max_aliases,
+        min_alias_length=min_alias_length,
+        low_yield_terms=low_yield_terms,
+        low_yield_mode=low_yield_mode,
+    )
+    path = os.path.join(state_dir, 'search_plan.json')
+    if enabled and os.path.exists(path):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+            if raw.get('key') == key:
+                return CompiledSearchPlan.from_dict(raw), True
+        except (OSError, ValueError, KeyError):
+            pass  # Unreadable or partial plan: recompile below
+
+    plan = compile_search_plan(
+        json.loads(data_bytes.decode('utf-8')),
+        key,
+        include_ep_patterns=include_ep_patterns,
+        max_aliases=max_aliases,
+        min_alias_length=min_alias_length,
+        low_yield_terms=low_yield_terms,
+        low_yield_mode=low_yield_mode,
+    )
+    if enabled:
+        os.makedirs(state_dir, exist_ok=True)
+        tmp = f'{path}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(plan.to_dict(), f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp, path)
+    return plan, False
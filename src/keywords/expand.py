@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Collection, Dict, Iterable, List, Optional, Tuple
 
 from src.utils.normalize import normalize_text
 
@@ -126,8 +126,19 @@ def build_series_keywords(
     include_ep_patterns: bool = False,
     max_aliases: Optional[int] = None,
     min_alias_length: int = 0,
+    low_yield_terms: Optional[Collection[str]] = None,
+    low_yield_mode: str = "demote",
 ) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
-    """Return (search_terms_by_series, alias_terms_by_series)."""
+    """
+    Return (search_terms_by_series, alias_terms_by_series).
+
+    `low_yield_terms` (e.g. TermYieldLedger.zero_yield_terms) are moved behind
+    a series' other search terms with low_yield_mode="demote", so they lose
+    the primary-term depth, or dropped with "skip" (a series always keeps at
+    least one term). Alias terms used for scoring are never affected.
+    """
+    if low_yield_mode not in ("demote", "skip"):
+        raise ValueError(f"Unknown low_yield_mode: {low_yield_mode}")
 
     canonical_lookup = _canonical_map(data)
 
@@ -200,6 +211,13 @@ def build_series_keywords(
         else:
             search_terms = alias_terms
 
+        if low_yield_terms:
+            kept = [t for t in search_terms if t not in low_yield_terms]
+            if low_yield_mode == "skip":
+                search_terms = kept or search_terms[:1]
+            else:
+                search_terms = kept + [t for t in search_terms if t in low_yield_terms]
+
         alias_map[sid] = alias_terms
         keywords[sid] = search_terms
 
@@ -0,0 +1,112 @@
+from __future__ import annotations
+import hashlib
+import json
+import math
+from typing import Dict, List, Optional, Tuple
+
+from src.utils.normalize import normalize_for_match
+
+
+def query_key(term: str) -> str:
+    """Key under which identical search queries are collapsed across series."""
+    return normalize_for_match(term) or term
+
+
+class QueryPlan:
+    """
+    Cross-series search plan where every distinct normalized term runs once.
+
+    A term is owned by the first series (in catalog order) that asks for it
+    and is queried with the largest per-term limit any interested series
+    wants. Hits from that query fan out to every interested series, so later
+    series that share the alias still get those candidates for scoring.
+    """
+
+    def __init__(self) -> None:
+        # sid -> [(term, limit)] queries this series runs itself, in order
+        self.series_terms: Dict[str, List[Tuple[str, int]]] = {}
+        # query key -> series that want its results (owner first)
+        self.interested: Dict[str, List[str]] = {}
+        # (sid, term, limit, key) queries skipped because another series owns the key
+        self.duplicates: List[Tuple[str, str, int, str]] = []
+        self._hits_by_key: Dict[str, int] = {}
+
+    def shared_terms(self, sid: str) -> int:
+        return sum(1 for dup_sid, _, _, _ in self.duplicates if dup_sid == sid)
+
+    def groups(self, sid: str) -> List[Tuple[int, List[str]]]:
+        """Consecutive runs of this series' own terms that share a limit, as (limit, terms)."""
+        out: List[Tuple[int, List[str]]] = []
+        for term, limit in self.series_terms.get(sid, []):
+            if out and out[-1][0] == limit:
+                out[-1][1].append(term)
+            else:
+                out.append((limit, [term]))
+        return out
+
+    def fan_out(self, hits: List[Dict]) -> None:
+        """Tag hits with `__series_ids` (all interested series) and count hits per query."""
+        for h in hits:
+            key = query_key(h.get('__source_term') or '')
+            h['__series_ids'] = list(self.interested.get(key, []))
+            self._hits_by_key[key] = self._hits_by_key.get(key, 0) + 1
+
+    def fingerprint(self) -> str:
+        """Hash of what the plan queries: each series' own (term, limit) pairs and who shares which term."""
+        payload = json.dumps([self.series_terms, self.interested], ensure_ascii=False, sort_keys=True)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+    def saved_calls(self) -> int:
+        """Estimate API page requests avoided by the collapsed queries."""
+        saved = 0
+        for _, _, limit, key in self.duplicates:
+            page_size = min(limit, 100)
+            hits = min(self._hits_by_key.get(key, 0), limit)
+            saved += max(1, math.ceil(hits / page_size))
+        return saved
+
+
+def build_query_plan(
+    keywords_by_sid: Dict[str, List[str]],
+    *,
+    primary_aliases: int,
+    primary_per_term_limit: int,
+    per_term_limit: int,
+    series_order: Optional[List[str]] = None,
+) -> QueryPlan:
+    """
+    Collapse identical normalized search terms across series.
+
+    Args:
+        keywords_by_sid: Search terms per series (from build_series_keywords)
+        primary_aliases: Number of leading terms per series that use the primary limit
+        primary_per_term_limit: Result limit for primary terms
+        per_term_limit: Result limit for the remaining terms
+        series_order: Optional explicit series order (defaults to dict order)
+
+    Returns:
+        QueryPlan
+    """
+    plan = QueryPlan()
+    owner: Dict[str, Tuple[str, int]] = {}  # key -> (sid, index into series_terms[sid])
+
+    for sid in series_order if series_order is not None else list(keywords_by_sid):
+        own: List[Tuple[str, int]] = []
+        plan.series_terms[sid] = own
+        for idx, term in enumerate(keywords_by_sid.get(sid, [])):
+            limit = primary_per_term_limit if idx < primary_aliases else per_term_limit
+            key = query_key(term)
+            interested = plan.interested.setdefault(key, [])
+            if sid not in interested:
+                interested.append(sid)
+            if key not in owner:
+                owner[key] = (sid, len(own))
+                own.append((term, limit))
+                continue
+            owner_sid, pos = owner[key]
+            owned_term, owned_limit = plan.series_terms[owner_sid][pos]
+            if limit > owned_limit:
+                plan.series_terms[owner_sid][pos] = (owned_term, limit)
+            plan.duplicates.append((sid, term, limit, key))
+
+    return plan
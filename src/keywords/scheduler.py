@@ -0,0 +1,176 @@
+from __future__ import annotations
+import datetime as dt
+import heapq
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+from src.keywords.planner import QueryPlan
+
+
+# Dailymotion list endpoints return at most 100 items per page
+PAGE_SIZE = 100
+
+# Smoothing for detection rates: a term or series without history counts as
+# 1 new detection per 10 pages, so it is neither starved nor favored
+_PRIOR_NEW = 1.0
+_PRIOR_PAGES = 10.0
+
+
+def _rate(pages: int, new: int) -> float:
+    return (new + _PRIOR_NEW) / (pages + _PRIOR_PAGES)
+
+
+def _freshness(first_date: Optional[str], today: dt.date, half_life_days: float, boost: float) -> Tuple[float, int]:
+    """(weight multiplier, age in days) of a series first searched on `first_date` (None = never)."""
+    age = 0
+    if first_date:
+        try:
+            age = max(0, (today - dt.date.fromisoformat(first_date)).days)
+        except ValueError:
+            age = 0
+    return 1.0 + boost * 0.5 ** (age / half_life_days), age
+
+
+def _apportion(weights: Dict[str, float], caps: Dict[str, int], total: int, start: Dict[str, int]) -> Dict[str, int]:
+    """
+    Hand out `total` units one at a time to the key with the largest weight / (units + 1)
+    (D'Hondt), never beyond its cap. Units are proportional to the weights, in integers.
+    """
+    units = dict(start)
+    heap = [(-w / (units[k] + 1), k) for k, w in weights.items() if units[k] < caps[k]]
+    heapq.heapify(heap)
+    while total > 0 and heap:
+        _, k = heapq.heappop(heap)
+        units[k] += 1
+        total -= 1
+        if units[k] < caps[k]:
+            heapq.heappush(heap, (-weights[k] / (units[k] + 1), k))
+    return units
+
+
+def budget_from_deadline(deadline_sec: float, pages_per_sec: float) -> int:
+    """Page requests that fit before a wall-clock deadline at the expected request rate."""
+    return max(0, int(deadline_sec * pages_per_sec))
+
+
+def schedule_query_plan(
+    plan: QueryPlan,
+    keywords_by_sid: Dict[str, List[str]],
+    *,
+    budget_pages: int,
+    min_pages_per_series: int = 2,
+    max_term_limit: int = 1000,
+    history: Optional[Dict[str, Tuple[int, int, str]]] = None,
+    today: Optional[dt.date] = None,
+    fresh_half_life_days: float = 30.0,
+    fresh_boost: float = 2.0,
+) -> Dict:
+    """
+    Spread a page budget over the series and terms of a query plan (in place).
+
+    Every series first gets `min_pages_per_series` pages (or all its terms can
+    use, if fewer), even if that overruns the budget. The rest of the budget
+    goes to series in proportion to their weight: recent new detections per
+    page (from TermYieldLedger.history, smoothed so series without history
+    still get a share) times a freshness boost that halves every
+    `fresh_half_life_days` since the series was first searched. Within a
+    series, every term gets one page before any gets a second, in order of
+    its own detection rate; deeper pages follow the same proportional rule.
+    Each term's limit becomes pages * 100 (at most `max_term_limit`); terms
+    left without pages are dropped from the plan.
+
+    Args:
+        plan: QueryPlan from build_query_plan (its per-term limits are replaced)
+        keywords_by_sid: Search terms per series (maps ledger terms to series)
+        budget_pages: Total search page requests for the run
+        min_pages_per_series: Guaranteed pages per series
+        max_term_limit: Deepest result limit a single term may get
+        history: term -> (pages, new_detections, first_run_date)
+        today: Reference date for freshness (defaults to today)
+
+    Returns:
+        Audit record of the schedule: budget, pages planned and per-series
+        weight inputs, pages and (term, limit) pairs
+    """
+    history = history or {}
+    today = today or dt.date.today()
+    max_term_pages = max(1, max_term_limit // PAGE_SIZE)
+
+    weights: Dict[str, float] = {}
+    caps: Dict[str, int] = {}
+    start: Dict[str, int] = {}
+    audit_series: Dict[str, Dict] = {}
+    for sid, own in plan.series_terms.items():
+        pages = new = 0
+        first_dates = []
+        for term in keywords_by_sid.get(sid, []):
+            if term in history:
+                t_pages, t_new, t_first = history[term]
+                pages += t_pages
+                new += t_new
+                first_dates.append(t_first)
+        fresh, age = _freshness(min(first_dates) if first_dates else None, today, fresh_half_life_days, fresh_boost)
+        rate = _rate(pages, new)
+        weights[sid] = rate * fresh
+        caps[sid] = len(own) * max_term_pages
+        start[sid] = min(min_pages_per_series, caps[sid])
+        audit_series[sid] = {
+            'recent_pages': pages,
+            'recent_new': new,
+            'age_days': age if first_dates else None,
+            'rate': round(rate, 4),
+            'freshness': round(fresh, 3),
+            'weight': round(weights[sid], 4),
+        }
+
+    guaranteed = sum(start.values())
+    series_pages = _apportion(weights, caps, budget_pages - guaranteed, start)
+
+    for sid, own in plan.series_terms.items():
+        terms = [term for term, _ in own]
+        term_weights = {}
+        for idx, term in enumerate(terms):
+            t_pages, t_new, _ = history.get(term, (0, 0, ''))
+            # Earlier terms (higher alias priority) win ties
+            term_weights[term] = _rate(t_pages, t_new) * (1.0 - idx * 1e-6)
+        total = series_pages[sid]
+        first_pass = sorted(terms, key=lambda t: -term_weights[t])[:total]
+        term_pages = {t: (1 if t in first_pass else 0) for t in terms}
+        term_pages = _apportion(term_weights, {t: max_term_pages for t in terms}, total - len(first_pass), term_pages)
+
+        plan.series_terms[sid] = [(t, min(max_term_limit, term_pages[t] * PAGE_SIZE)) for t in terms if term_pages[t] > 0]
+        audit_series[sid]['pages'] = total
+        audit_series[sid]['terms'] = plan.series_terms[sid]
+
+    planned = sum(series_pages.values())
+    return {
+        'date': today.isoformat(),
+        'budget_pages': budget_pages,
+        'guaranteed_pages': guaranteed,
+        'planned_pages': planned,
+        'over_budget': max(0, planned - budget_pages),
+        'series': audit_series,
+    }
+
+
+def format_schedule(schedule: Dict, titles_by_sid: Dict[str, str], top: int = 5) -> str:
+    lines = [
+        f"Scheduled {schedule['planned_pages']} search pages (budget {schedule['budget_pages']}, "
+        f"{schedule['guaranteed_pages']} guaranteed across {len(schedule['series'])} series)"
+    ]
+    if schedule['over_budget']:
+        lines.append(f"  Warning: per-series minimums exceed the budget by {schedule['over_budget']} pages")
+    ranked = sorted(schedule['series'].items(), key=lambda item: -item[1]['pages'])
+    for sid, entry in ranked[:top]:
+        lines.append(
+            f"  {titles_by_sid.get(sid) or sid}: {entry['pages']} pages "
+            f"(rate {entry['rate']}, freshness x{entry['freshness']})"
+        )
+    return '\n'.join(lines)
+
+
+def save_schedule(schedule: Dict, path: str) -> None:
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(schedule, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Per-term search yield ledger.
+
+Every detection run records, for each search term it queried: pages
+fetched, raw hits, hits that passed the score/duration filters and new
+detections. build_series_keywords can then demote or skip terms that have
+found nothing new for several runs. Print the per-term totals with:
+
+    python3 -m src.keywords.term_yield --runs 7
+"""
+from __future__ import annotations
+import argparse
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+class TermYieldLedger:
+    """
+    SQLite ledger of per-term, per-run search yield.
+
+    One row per (term, run): `pages`, `raw_hits` (before dedupe), `passing`
+    (unique videos that passed the filters) and `new_detections` (passing
+    videos not seen before). A video found by several terms counts for each
+    of them.
+
+    Args:
+        path: SQLite file (parent directory created if missing)
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS term_runs ('
+            ' term TEXT NOT NULL, run_id INTEGER NOT NULL, run_date TEXT NOT NULL,'
+            ' pages INTEGER NOT NULL, raw_hits INTEGER NOT NULL, passing INTEGER NOT NULL,'
+            ' new_detections INTEGER NOT NULL, PRIMARY KEY (term, run_id)) WITHOUT ROWID'
+        )
+        self._conn.commit()
+
+    def record_run(
+        self,
+        run_date: str,
+        queried_terms: Iterable[str],
+        hits: Iterable[Dict],
+        passing_keys: Set[str],
+        new_keys: Set[str],
+    ) -> int:
+        """
+        Record one run from its raw hits (tagged `__source_term` / `__page`) and the
+        `dailymotion:{id}` keys that passed the filters / were new. Returns the run id.
+
+        Only `queried_terms` are recorded: pass the terms whose queries completed,
+        so a failed query does not count as a page without new detections.
+        """
+        run_id = int(time.time() * 1000)
+        stats: Dict[str, List] = {term: [1, 0, set()] for term in queried_terms}
+        for h in hits:
+            entry = stats.get(h.get('__source_term'))
+            if entry is None:
+                continue
+            entry[0] = max(entry[0], h.get('__page') or 1)
+            entry[1] += 1
+            if h.get('id'):
+                entry[2].add(f'dailymotion:{h["id"]}')
+        self._conn.executemany(
+            'INSERT OR REPLACE INTO term_runs (term, run_id, run_date, pages, raw_hits, passing, new_detections)'
+            ' VALUES (?, ?, ?, ?, ?, ?, ?)',
+            [
+                (term, run_id, run_date, pages, raw, len(keys & passing_keys), len(keys & new_keys))
+                for term, (pages, raw, keys) in stats.items()
+            ],
+        )
+        self._conn.commit()
+        return run_id
+
+    def zero_yield_terms(self, runs: int, since: Optional[str] = None, metric: str = 'new_detections') -> Set[str]:
+        """
+        Terms whose last `runs` recorded runs (at least that many) all had zero `metric`.
+
+        With `since` (ISO date), terms not queried on or after that date are left
+        out, so a term that was skipped gets queried (and measured) again once
+        its last run is old enough.
+        """
+        if runs <= 0:
+            return set()
+        if metric not in ('new_detections', 'passing'):
+            raise ValueError(f'Unknown yield metric: {metric}')
+        rows = self._conn.execute(
+            f'SELECT term, COUNT(*), MAX({metric}), MAX(run_date) FROM ('
+            '  SELECT term, run_date, passing, new_detections,'
+            '   ROW_NUMBER() OVER (PARTITION BY term ORDER BY run_id DESC) AS recency'
+            '  FROM term_runs'
+            ') WHERE recency <= ? GROUP BY term',
+            (runs,),
+        )
+        return {
+            term for term, count, best, last_date in rows
+            if count >= runs and not best and (since is None or last_date >= since)
+        }
+
+    def totals(self, runs: Optional[int] = None) -> List[Tuple[str, int, int, int, int, int]]:
+        """(term, runs, pages, raw_hits, passing, new_detections) over each term's last `runs` runs, best first."""
+        rows = self._conn.execute(
+            'SELECT term, COUNT(*), SUM(pages), SUM(raw_hits), SUM(passing), SUM(new_detections) FROM ('
+            '  SELECT *, ROW_NUMBER() OVER (PARTITION BY term ORDER BY run_id DESC) AS recency FROM term_runs'
+            ') WHERE recency <= ? GROUP BY term ORDER BY SUM(new_detections) DESC, SUM(passing) DESC, term',
+            (runs if runs else 1 << 62,),
+        )
+        return [tuple(r) for r in rows]
+
+    def history(self, runs: int) -> Dict[str, Tuple[int, int, str]]:
+        """term -> (pages, new_detections) over its last `runs` runs, plus the date it was first queried."""
+        first = dict(self._conn.execute('SELECT term, MIN(run_date) FROM term_runs GROUP BY term'))
+        return {
+            term: (pages, new, first[term])
+            for term, _, pages, _, _, new in self.totals(runs)
+        }
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def open_term_yield(state_dir: str, enabled: bool = True) -> Optional[TermYieldLedger]:
+    """Ledger at STATE_DIR/term_yield.sqlite, or None when disabled."""
+    if not enabled:
+        return None
+    return TermYieldLedger(os.path.join(state_dir, 'term_yield.sqlite'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Per-term search yield totals.')
+    parser.add_argument('--state-dir', default=os.environ.get('STATE_DIR', 'state'))
+    parser.add_argument('--runs', type=int, default=0, help='Only the last N runs of each term (0 = all)')
+    parser.add_argument('--zero', action='store_true', help='Only terms without new detections in those runs')
+    args = parser.parse_args()
+
+    ledger = open_term_yield(args.state_dir)
+    rows = ledger.totals(args.runs or None)
+    if args.zero:
+        rows = [r for r in rows if not r[5]]
+    print(f'{"runs":>5} {"pages":>6} {"raw":>7} {"passing":>8} {"new":>6}  term')
+    for term, runs, pages, raw, passing, new in rows:
+        print(f'{runs:>5} {pages:>6} {raw:>7} {passing:>8} {new:>6}  {term}')
+    ledger.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+from __future__ import annotations
+from typing import Dict, List, Set, Tuple
+
+from src.matching.score import SeriesMatcher
+from src.utils.normalize import normalize_for_match
+
+
+def _grams(text: str, n: int) -> Set[str]:
+    # Spaces are dropped so token order and spacing variants share grams
+    compact = text.replace(" ", "")
+    if len(compact) <= n:
+        return {compact} if compact else set()
+    return {compact[i : i + n] for i in range(len(compact) - n + 1)}
+
+
+class AliasNgramIndex:
+    """
+    Inverted character n-gram index over the normalized aliases of every series.
+
+    shortlist() ranks series by how much of their best alias is contained in a
+    title (shared grams / alias grams), touching only the postings of the
+    title's own grams instead of comparing the title with every alias. It is a
+    cheap pre-filter: the shortlisted series are then scored for real.
+    """
+
+    def __init__(self, matchers: Dict[str, SeriesMatcher], n: int = 2):
+        self.n = n
+        self._postings: Dict[str, List[int]] = {}
+        self._alias_sizes: List[int] = []
+        self._alias_sids: List[List[str]] = []
+        alias_ids: Dict[str, int] = {}
+        for sid, matcher in matchers.items():
+            for a_norm in matcher.norms:
+                aid = alias_ids.get(a_norm)
+                if aid is None:
+                    aid = alias_ids[a_norm] = len(self._alias_sizes)
+                    grams = _grams(a_norm, n)
+                    self._alias_sizes.append(len(grams))
+                    self._alias_sids.append([])
+                    for g in grams:
+                        self._postings.setdefault(g, []).append(aid)
+                if sid not in self._alias_sids[aid]:
+                    self._alias_sids[aid].append(sid)
+
+    def __len__(self) -> int:
+        return len(self._alias_sizes)
+
+    def candidates(self, title: str, min_overlap: float = 0.5) -> List[Tuple[str, float]]:
+        """(series_id, containment) for every series with an alias at least `min_overlap` contained, best first."""
+        shared: Dict[int, int] = {}
+        for g in _grams(normalize_for_match(title), self.n):
+            for aid in self._postings.get(g, ()):
+                shared[aid] = shared.get(aid, 0) + 1
+
+        best: Dict[str, float] = {}
+        for aid, count in shared.items():
+            overlap = count / self._alias_sizes[aid]
+            if overlap < min_overlap:
+                continue
+            for sid in self._alias_sids[aid]:
+                if overlap > best.get(sid, 0.0):
+                    best[sid] = overlap
+        return sorted(best.items(), key=lambda item: -item[1])
+
+    def shortlist(self, title: str, k: int, min_overlap: float = 0.5) -> List[str]:
+        """Top-k plausible series for a title (may be fewer, or none)."""
+        if k <= 0:
+            return []
+        return [sid for sid, _ in self.candidates(title, min_overlap)[:k]]
@@ -0,0 +1,114 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.matching.score import (
+    SeriesMatcher,
+    build_series_matchers,
+    get_scoring_stats,
+    merge_scoring_stats,
+    pick_best,
+    series_scores,
+)
+from src.matching.score_cache import ScoreCache, title_key
+
+
+Candidate = Tuple[str, Sequence[str]]
+
+# Alias matchers built once per worker process by the pool initializer
+_WORKER_MATCHERS: Dict[str, SeriesMatcher] = {}
+
+
+def _init_worker(aliases_by_sid: Dict[str, List[str]]) -> None:
+    global _WORKER_MATCHERS
+    _WORKER_MATCHERS = build_series_matchers(aliases_by_sid)
+
+
+def _score_chunk(chunk: List[Tuple[str, Tuple[str, ...]]]) -> Tuple[List[Dict[str, float]], Dict[str, int]]:
+    before = get_scoring_stats()
+    results = series_scores(chunk, _WORKER_MATCHERS)
+    after = get_scoring_stats()
+    return results, {k: after[k] - before.get(k, 0) for k in after}
+
+
+def _series_scores(
+    candidates: Sequence[Candidate],
+    aliases_by_sid: Dict[str, List[str]],
+    matchers: Dict[str, SeriesMatcher],
+    workers: int,
+    min_parallel: int,
+    chunk_size: int,
+) -> List[Dict[str, float]]:
+    if workers <= 1 or len(candidates) < min_parallel:
+        return series_scores(candidates, matchers)
+
+    chunks = [
+        [(title, tuple(sids)) for title, sids in candidates[i : i + chunk_size]]
+        for i in range(0, len(candidates), chunk_size)
+    ]
+    # Workers only need the series that some candidate can be attributed to
+    needed = {sid for _, sids in candidates for sid in sids}
+    payload = {sid: aliases for sid, aliases in aliases_by_sid.items() if sid in needed}
+
+    results: List[Dict[str, float]] = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(payload,)) as pool:
+        for chunk_results, stats in pool.map(_score_chunk, chunks):
+            results.extend(chunk_results)
+            merge_scoring_stats(stats)
+    return results
+
+
+def score_candidates(
+    candidates: Sequence[Candidate],
+    aliases_by_sid: Dict[str, List[str]],
+    *,
+    matchers: Optional[Dict[str, SeriesMatcher]] = None,
+    workers: int = 0,
+    min_parallel: int = 2000,
+    chunk_size: int = 500,
+    cache: Optional[ScoreCache] = None,
+) -> List[Tuple[Optional[str], float]]:
+    """
+    best_series_scores for (title, series_ids) pairs, optionally on a process pool.
+
+    With `workers` > 1 and at least `min_parallel` candidates, compact
+    (title, series_ids) chunks go to worker processes that each build the
+    alias matchers once at start-up; otherwise scoring runs in-process.
+    With a `cache`, (title, series) pairs scored in earlier runs are read
+    from it and only the rest are scored (and then stored). Results are
+    returned in input order and are the same either way; fuzzy-call stats
+    from workers are merged into this process' get_scoring_stats().
+    """
+    if matchers is None:
+        matchers = build_series_matchers(aliases_by_sid)
+
+    if cache is None:
+        per_series = _series_scores(candidates, aliases_by_sid, matchers, workers, min_parallel, chunk_size)
+        return [pick_best(sids, scores) for (_, sids), scores in zip(candidates, per_series)]
+
+    keys: List[Dict[str, Tuple[str, str]]] = []
+    for title, sids in candidates:
+        t_hash = title_key(title)
+        keys.append({sid: (t_hash, matchers[sid].fingerprint) for sid in sids if sid in matchers})
+    found = cache.get_many(key for per_title in keys for key in per_title.values())
+
+    per_series: List[Dict[str, float]] = []
+    pending: List[Tuple[str, List[str]]] = []
+    pending_idx: List[int] = []
+    for idx, ((title, sids), per_title) in enumerate(zip(candidates, keys)):
+        known = {sid: found[key] for sid, key in per_title.items() if key in found}
+        per_series.append(known)
+        missing = [sid for sid in dict.fromkeys(sids) if sid not in known]
+        if missing:
+            pending.append((title, missing))
+            pending_idx.append(idx)
+
+    fresh: Dict[Tuple[str, str], float] = {}
+    scored = _series_scores(pending, aliases_by_sid, matchers, workers, min_parallel, chunk_size)
+    for idx, scores in zip(pending_idx, scored):
+        per_series[idx].update(scores)
+        for sid, score in scores.items():
+            if sid in keys[idx]:
+                fresh[keys[idx][sid]] = score
+    cache.put_many(fresh)
+    return [pick_best(sids, scores) for (_, sids), scores in zip(candidates, per_series)]
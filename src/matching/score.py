@@ -1,7 +1,9 @@
 from __future__ import annotations
-import re
-from typing import Iterable
+import hashlib
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
+from src.matching.automaton import KeywordAutomaton
 from src.utils.normalize import normalize_for_match
 
 
@@ -10,40 +12,151 @@ try:
 except Exception:  # pragma: no cover - rapidfuzz optional
     _rf_fuzz = None
 
+try:
+    # Matrix scoring needs rapidfuzz>=3 (processor=None defaults, same as the scalar calls) and numpy
+    import numpy as _np  # type: ignore
+    import rapidfuzz as _rf  # type: ignore
 
-def _ratio(a: str, b: str) -> float:
-    if _rf_fuzz is not None:
-        return float(_rf_fuzz.ratio(a, b))
-    import difflib
-    return difflib.SequenceMatcher(None, a, b).ratio() * 100.0
+    if int(_rf.__version__.split('.')[0]) < 3:
+        raise ImportError('rapidfuzz<3')
+    from rapidfuzz import process as _rf_process  # type: ignore
+except Exception:  # pragma: no cover - rapidfuzz/numpy optional
+    _np = None
+    _rf_process = None
 
 
-def _partial_ratio(a: str, b: str) -> float:
-    if _rf_fuzz is not None:
-        return float(_rf_fuzz.partial_ratio(a, b))
-    if not a or not b:
-        return 0.0
-    # Ensure a is longer so sliding windows are minimal
+def _lcs_masks(needle: str) -> Dict[str, int]:
+    # Bit i of masks[c] is set where needle[i] == c
+    masks: Dict[str, int] = {}
+    for i, ch in enumerate(needle):
+        masks[ch] = masks.get(ch, 0) | (1 << i)
+    return masks
+
+
+def _lcs_len(masks: Dict[str, int], m: int, text: str) -> int:
+    """Length of the longest common subsequence of the needle behind `masks` (length m) and text."""
+    # Bit-parallel LCS (Hyyrö): one big-int step per character of text
+    full = (1 << m) - 1
+    v = full
+    for ch in text:
+        u = v & masks.get(ch, 0)
+        v = ((v + u) | (v - u)) & full
+    return m - bin(v).count("1")
+
+
+def _indel_similarity(lcs: int, total: int) -> float:
+    # Same float expression as rapidfuzz (1 - normalized distance), so results agree to the last bit
+    return (1.0 - (total - 2 * lcs) / total) * 100.0
+
+
+def _py_ratio(a: str, b: str) -> float:
+    """Indel similarity, 200 * LCS / (len(a) + len(b)); same numbers as rapidfuzz's fuzz.ratio."""
+    total = len(a) + len(b)
+    if not total:
+        return 100.0
     if len(a) < len(b):
         a, b = b, a
+    if not b:
+        return 0.0
+    return _indel_similarity(_lcs_len(_lcs_masks(b), len(b), a), total)
+
+
+def _lcs_prefix_lens(masks: Dict[str, int], m: int, text: str) -> List[int]:
+    # out[k] = LCS(needle, text[:k]) for every k, in one pass
+    full = (1 << m) - 1
+    v = full
+    out = [0]
+    for ch in text:
+        u = v & masks.get(ch, 0)
+        v = ((v + u) | (v - u)) & full
+        out.append(m - bin(v).count("1"))
+    return out
+
+
+def _py_partial_ratio_needle(needle: str, haystack: str, score_cutoff: float = 0.0) -> float:
+    # Best ratio of the needle against every haystack window of its length, plus the
+    # shorter windows hanging off either end, like rapidfuzz. Windows whose edge
+    # character does not occur in the needle cannot be the best one and are dropped.
+    # The rest are visited best-bound first, where a window's LCS is bounded by the
+    # LCS of the needle with the haystack up to its end and from its start, and by
+    # its character overlap with the needle; the search stops once no bound can win.
+    n, h = len(needle), len(haystack)
+    masks = _lcs_masks(needle)
+    prefix = _lcs_prefix_lens(masks, n, haystack)
+    # suffix[k] = LCS(needle, haystack[k:]), via the reversed strings
+    suffix = _lcs_prefix_lens(_lcs_masks(needle[::-1]), n, haystack[::-1])[::-1]
+    need = Counter(needle)
+
+    def overlap_of(start: int, stop: int) -> int:
+        have = Counter(haystack[start:stop])
+        return sum(min(c, need[ch]) for ch, c in have.items())
+
+    windows: List[Tuple[float, int, int]] = []
+
+    def push(start: int, stop: int) -> None:
+        lcs_bound = min(prefix[stop], suffix[start], stop - start)
+        bound = _indel_similarity(lcs_bound, n + stop - start)
+        if bound >= score_cutoff:
+            windows.append((bound, start, stop))
+
+    for stop in range(1, n):
+        if haystack[stop - 1] in masks:
+            push(0, stop)
+    for start in range(h - n):
+        if haystack[start + n - 1] in masks:
+            push(start, start + n)
+    for start in range(h - n, h):
+        if haystack[start] in masks:
+            push(start, h)
+
     best = 0.0
-    window = len(b)
-    for i in range(len(a) - window + 1):
-        segment = a[i : i + window]
-        best = max(best, _ratio(segment, b))
-        if best >= 99.0:
+    windows.sort(key=lambda w: -w[0])
+    for bound, start, stop in windows:
+        if bound <= best:
+            break
+        total = n + stop - start
+        if _indel_similarity(overlap_of(start, stop), total) <= best:
+            continue
+        best = max(best, _indel_similarity(_lcs_len(masks, n, haystack[start:stop]), total))
+        if best == 100.0:
             break
+    return best if best >= score_cutoff else 0.0
+
+
+def _py_partial_ratio(a: str, b: str, score_cutoff: float = 0.0) -> float:
+    """Pure-Python partial_ratio with the same results as rapidfuzz's fuzz.partial_ratio (incl. score_cutoff)."""
+    if len(a) > len(b):
+        a, b = b, a
+    if not a or not b:
+        return 100.0 if len(a) == len(b) else 0.0
+    best = _py_partial_ratio_needle(a, b, score_cutoff)
+    if best != 100.0 and len(a) == len(b):
+        best = max(best, _py_partial_ratio_needle(b, a, score_cutoff))
     return best
 
 
-def _token_sort_ratio(a: str, b: str) -> float:
+def _ratio(a: str, b: str, score_cutoff: float = 0.0) -> float:
     if _rf_fuzz is not None:
-        return float(_rf_fuzz.token_sort_ratio(a, b))
+        return float(_rf_fuzz.ratio(a, b, score_cutoff=score_cutoff))
+    score = _py_ratio(a, b)
+    return score if score >= score_cutoff else 0.0
+
+
+def _partial_ratio(a: str, b: str, score_cutoff: float = 0.0) -> float:
+    """partial_ratio; scores below `score_cutoff` come back as 0 (rapidfuzz semantics)."""
+    if _rf_fuzz is not None:
+        return float(_rf_fuzz.partial_ratio(a, b, score_cutoff=score_cutoff))
+    return _py_partial_ratio(a, b, score_cutoff)
+
+
+def _token_sort_ratio(a: str, b: str, score_cutoff: float = 0.0) -> float:
+    if _rf_fuzz is not None:
+        return float(_rf_fuzz.token_sort_ratio(a, b, score_cutoff=score_cutoff))
     a_tokens = sorted(a.split())
     b_tokens = sorted(b.split())
     if not a_tokens or not b_tokens:
-        return _ratio(a, b)
-    return _ratio(" ".join(a_tokens), " ".join(b_tokens))
+        return _ratio(a, b, score_cutoff)
+    return _ratio(" ".join(a_tokens), " ".join(b_tokens), score_cutoff)
 
 
 def _best_similarity(a: str, b: str) -> float:
@@ -51,39 +164,32 @@ def _best_similarity(a: str, b: str) -> float:
     return max(sims)
 
 
+# Bump when the scoring rules change in a way BOOST_WORDS and the aliases do not capture;
+# persisted scores (see src/matching/score_cache.py) are keyed on it
+SCORING_VERSION = 1
+
 BOOST_WORDS = [
     'full', '完整版', '完整', '全集', '1080p', '720p', 'hd', 'ep', 'episode', '第',
     'capítulo', 'episodio', 'épisode', 'folge', '화', '話', 'ตอน',
 ]
 
 
-def _contains_keyword(text: str, keyword: str) -> bool:
-    if not keyword:
-        return False
-    # ASCII/latin keywords benefit from word boundaries; CJK simply check substring
-    if keyword.isascii() and keyword.replace(' ', '').isalnum():
-        return re.search(rf"\b{re.escape(keyword)}\b", text) is not None
-    return keyword in text
+def _is_word_char(ch: str) -> bool:
+    # Same characters as `\w` in a str regex
+    return ch.isalnum() or ch == '_'
 
 
-def compute_score(title: str, aliases: Iterable[str]) -> float:
-    t_norm = normalize_for_match(title)
-    score = 0.0
-    best = 0.0
-    exact_match = False
+def _word_bounded(keyword: str) -> bool:
+    # ASCII/latin keywords need word boundaries (`\bkw\b`); CJK/Thai simply match as substrings
+    return keyword.isascii() and keyword.replace(' ', '').isalnum()
+
+
+_BOOST_PATTERNS = [w.casefold() for w in BOOST_WORDS]
+_BOOST_BOUNDED = [_word_bounded(kw) for kw in _BOOST_PATTERNS]
 
-    for alias in aliases:
-        a_norm = normalize_for_match(alias)
-        if not a_norm:
-            continue
-        if t_norm == a_norm:
-            exact_match = True
-            best = max(best, 100.0)
-            continue
-        if a_norm in t_norm:
-            best = max(best, 98.0)
-        best = max(best, _best_similarity(t_norm, a_norm))
 
+def _bucket_score(best: float, exact_match: bool, boosts: int) -> float:
+    score = 0.0
     if best >= 95:
         score += 1.5
     elif best >= 90:
@@ -96,9 +202,297 @@ def compute_score(title: str, aliases: Iterable[str]) -> float:
     if exact_match:
         score += 0.2
 
-    for w in BOOST_WORDS:
-        kw = w.casefold()
-        if _contains_keyword(t_norm, kw):
-            score += 0.1
+    for _ in range(boosts):
+        score += 0.1
 
     return score
+
+
+# Lower edges of the similarity buckets that add score in _bucket_score
+_BUCKETS = (70.0, 80.0, 90.0, 95.0)
+# Float slack so a bound computed differently from the scorer never prunes a real hit
+_BOUND_SLACK = 1e-6
+
+_SCORING_STATS: Dict[str, int] = {'fuzzy_calls': 0, 'fuzzy_skipped': 0}
+
+
+def _next_bucket(best: float) -> Optional[float]:
+    for edge in _BUCKETS:
+        if best < edge:
+            return edge
+    return None
+
+
+def get_scoring_stats() -> Dict[str, int]:
+    """Fuzzy scorer calls made and skipped by pruning in this process."""
+    return dict(_SCORING_STATS)
+
+
+def merge_scoring_stats(stats: Dict[str, int]) -> None:
+    """Add counters gathered elsewhere (e.g. in scoring worker processes)."""
+    for key, value in stats.items():
+        _SCORING_STATS[key] = _SCORING_STATS.get(key, 0) + value
+
+
+def format_scoring_stats() -> str:
+    stats = get_scoring_stats()
+    total = stats['fuzzy_calls'] + stats['fuzzy_skipped']
+    if not total:
+        return 'Scoring: no fuzzy comparisons'
+    return (
+        f"Scoring: {stats['fuzzy_calls']} fuzzy comparisons, {stats['fuzzy_skipped']} skipped by pruning "
+        f"({stats['fuzzy_skipped'] / total * 100.0:.1f}%)"
+    )
+
+
+class SeriesMatcher:
+    """
+    Pre-normalized alias set of one series, built once and reused for every candidate.
+
+    Holds the normalized aliases (deduplicated, empty ones dropped), their
+    token-sorted forms, lengths and character counts, so scoring never
+    re-normalizes an alias. With `prune` (the default) fuzzy comparisons
+    whose character-overlap bound cannot lift the title into a higher score
+    bucket are skipped; scores are identical either way.
+    """
+
+    def __init__(
+        self,
+        aliases: Iterable[str],
+        series_id: Optional[str] = None,
+        prune: bool = True,
+        norms: Optional[Iterable[str]] = None,
+    ):
+        self.series_id = series_id
+        self.aliases: List[str] = list(aliases)
+        self.norms: List[str] = []
+        # `norms` are already-normalized aliases (e.g. from a compiled search plan)
+        for a_norm in norms if norms is not None else map(normalize_for_match, self.aliases):
+            if a_norm and a_norm not in self.norms:
+                self.norms.append(a_norm)
+        self.norm_set = frozenset(self.norms)
+        self.sorted_norms: List[str] = [" ".join(sorted(a.split())) for a in self.norms]
+        self.lengths: List[int] = [len(a) for a in self.norms]
+        self.counts: List[Counter] = [Counter(a) for a in self.norms]
+        self.prune = prune
+        self._fingerprint: Optional[str] = None
+        # Boost words and aliases share one automaton: a single pass over the title finds both
+        self._automaton = KeywordAutomaton(_BOOST_PATTERNS + self.norms)
+
+    def __len__(self) -> int:
+        return len(self.norms)
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash of everything a score depends on besides the title: aliases, boost words, scoring version."""
+        if self._fingerprint is None:
+            payload = "\x1f".join([str(SCORING_VERSION), "\x1e".join(BOOST_WORDS)] + sorted(self.norms))
+            self._fingerprint = hashlib.sha1(payload.encode("utf-8")).hexdigest()
+        return self._fingerprint
+
+    def _token_sort(self, idx: int, t_norm: str, t_sorted: str, score_cutoff: float = 0.0) -> float:
+        if _rf_fuzz is not None:
+            return _token_sort_ratio(t_norm, self.norms[idx], score_cutoff)
+        # Pure-Python fallback: the title's tokens are sorted once, the alias' at build time
+        if not t_sorted:
+            return _ratio(t_norm, self.norms[idx], score_cutoff)
+        return _ratio(t_sorted, self.sorted_norms[idx], score_cutoff)
+
+    def best_similarity(self, t_norm: str, floor: float = 0.0) -> float:
+        """
+        Best fuzzy similarity of a normalized title against any alias, starting from `floor`.
+
+        With pruning on, the returned value can stay below the true maximum, but only
+        when the maximum cannot reach a higher score bucket (70/80/90/95) than the
+        value returned, so the score computed from it is always the same. Scorers
+        are called with the next bucket edge as `score_cutoff`.
+        """
+        t_sorted = " ".join(sorted(t_norm.split()))
+        best = floor
+        if not self.prune:
+            for idx, a_norm in enumerate(self.norms):
+                best = max(
+                    best, _ratio(t_norm, a_norm), _partial_ratio(t_norm, a_norm), self._token_sort(idx, t_norm, t_sorted)
+                )
+            _SCORING_STATS['fuzzy_calls'] += 3 * len(self.norms)
+            return best
+
+        calls = skipped = 0
+        target = _next_bucket(best)
+        t_counts: Optional[Counter] = None
+        lt = len(t_norm)
+        for idx, a_norm in enumerate(self.norms):
+            if target is None:
+                skipped += 3 * (len(self.norms) - idx)
+                break
+            if t_counts is None:
+                t_counts = Counter(t_norm)
+            # Upper bounds from the character overlap h: ratio and token_sort_ratio
+            # are at most 2h/(lt+la), partial_ratio at most 2h/(short+h)
+            la = self.lengths[idx]
+            h = sum(min(n, t_counts[ch]) for ch, n in self.counts[idx].items() if ch in t_counts)
+            short = min(lt, la)
+            partial_ub = 200.0 * h / (short + h) if h else 0.0
+            full_ub = 200.0 * h / (lt + la) if h else 0.0
+            if partial_ub + _BOUND_SLACK < target:
+                skipped += 3
+                continue
+            # Scorers get the next bucket edge as cutoff: anything below it cannot change the score
+            checks = (
+                (full_ub, lambda cutoff: _ratio(t_norm, a_norm, cutoff)),
+                (full_ub, lambda cutoff: self._token_sort(idx, t_norm, t_sorted, cutoff)),
+                (partial_ub, lambda cutoff: _partial_ratio(t_norm, a_norm, cutoff)),
+            )
+            for ub, scorer in checks:
+                if target is None or ub + _BOUND_SLACK < target:
+                    skipped += 1
+                    continue
+                calls += 1
+                value = scorer(target)
+                if value > best:
+                    best = value
+                    target = _next_bucket(best)
+        _SCORING_STATS['fuzzy_calls'] += calls
+        _SCORING_STATS['fuzzy_skipped'] += skipped
+        return best
+
+    def scan(self, t_norm: str) -> Tuple[int, bool]:
+        """Return (number of distinct boost words present, whether any alias is a substring)."""
+        n_boost = len(_BOOST_PATTERNS)
+        boosts = set()
+        alias_hit = False
+        end = len(t_norm)
+        for start, pid in self._automaton.iter_matches(t_norm):
+            if pid >= n_boost:
+                alias_hit = True
+                continue
+            if pid in boosts:
+                continue
+            if _BOOST_BOUNDED[pid]:
+                stop = start + len(_BOOST_PATTERNS[pid])
+                if start > 0 and _is_word_char(t_norm[start - 1]):
+                    continue
+                if stop < end and _is_word_char(t_norm[stop]):
+                    continue
+            boosts.add(pid)
+        return len(boosts), alias_hit
+
+    def score(self, title: str) -> float:
+        return self.score_normalized(normalize_for_match(title))
+
+    def score_normalized(self, t_norm: str) -> float:
+        boosts, alias_hit = self.scan(t_norm)
+        # The substring floor covers exact matches too: identical strings score 100 on every scorer
+        best = self.best_similarity(t_norm, floor=98.0 if alias_hit else 0.0)
+        return _bucket_score(best, t_norm in self.norm_set, boosts)
+
+    def scores(self, titles: Sequence[str]) -> List[float]:
+        """
+        Score many titles; same results as score() per title.
+
+        Titles that normalize identically are scored once. With rapidfuzz>=3
+        and numpy the fuzzy scores come from one `process.cdist` matrix per
+        scorer instead of a Python loop per pair.
+        """
+        t_norms = [normalize_for_match(t) for t in titles]
+        unique = list(dict.fromkeys(t_norms))
+        if self.norms and unique and _rf_process is not None and _rf_fuzz is not None:
+            fuzzy = _best_matrix(unique, self.norms)
+            _SCORING_STATS['fuzzy_calls'] += 3 * len(unique) * len(self.norms)
+            by_norm = {}
+            for t, fz in zip(unique, fuzzy):
+                boosts, alias_hit = self.scan(t)
+                by_norm[t] = _bucket_score(max(98.0 if alias_hit else 0.0, fz), t in self.norm_set, boosts)
+        else:
+            by_norm = {t: self.score_normalized(t) for t in unique}
+        return [by_norm[t] for t in t_norms]
+
+
+def build_series_matchers(
+    aliases_by_sid: Dict[str, List[str]],
+    norms_by_sid: Optional[Dict[str, List[str]]] = None,
+) -> Dict[str, SeriesMatcher]:
+    """One SeriesMatcher per series, from build_series_keywords' alias map (and pre-normalized aliases, if known)."""
+    norms_by_sid = norms_by_sid or {}
+    return {
+        sid: SeriesMatcher(aliases, series_id=sid, norms=norms_by_sid.get(sid))
+        for sid, aliases in aliases_by_sid.items()
+    }
+
+
+_EMPTY_MATCHER = SeriesMatcher([])
+
+
+def _as_matcher(aliases: Union[SeriesMatcher, Iterable[str]]) -> SeriesMatcher:
+    return aliases if isinstance(aliases, SeriesMatcher) else SeriesMatcher(aliases)
+
+
+def compute_score(title: str, aliases: Union[SeriesMatcher, Iterable[str]]) -> float:
+    """Raw match score of a title against a series (a SeriesMatcher, or raw aliases)."""
+    return _as_matcher(aliases).score(title)
+
+
+def _best_matrix(t_norms: List[str], a_norms: List[str]) -> List[float]:
+    """Row-wise max of ratio/partial_ratio/token_sort_ratio over all aliases, one cdist per scorer."""
+    best = None
+    for scorer in (_rf_fuzz.ratio, _rf_fuzz.partial_ratio, _rf_fuzz.token_sort_ratio):
+        m = _rf_process.cdist(t_norms, a_norms, scorer=scorer, dtype=_np.float64, workers=-1)
+        best = m if best is None else _np.maximum(best, m)
+    return [float(v) for v in best.max(axis=1)]
+
+
+def compute_scores(titles: Sequence[str], aliases: Union[SeriesMatcher, Iterable[str]]) -> List[float]:
+    """Score many titles against one series; same results as compute_score per title."""
+    return _as_matcher(aliases).scores(titles)
+
+
+def best_series_score(
+    title: str, series_ids: Iterable[str], matchers: Dict[str, SeriesMatcher]
+) -> Tuple[Optional[str], float]:
+    """Score a title against each candidate series; return (best_sid, raw_score). Ties keep the first sid."""
+    best_sid: Optional[str] = None
+    best_score = 0.0
+    for sid in series_ids:
+        score = matchers.get(sid, _EMPTY_MATCHER).score(title)
+        if best_sid is None or score > best_score:
+            best_sid, best_score = sid, score
+    return best_sid, best_score
+
+
+def series_scores(
+    candidates: Sequence[Tuple[str, Sequence[str]]], matchers: Dict[str, SeriesMatcher]
+) -> List[Dict[str, float]]:
+    """
+    Raw score of every (title, series_ids) candidate against each of its series, in input order.
+
+    Titles are grouped per series and scored with one SeriesMatcher.scores call per series.
+    """
+    by_sid: Dict[str, List[int]] = {}
+    for idx, (_, sids) in enumerate(candidates):
+        for sid in dict.fromkeys(sids):
+            by_sid.setdefault(sid, []).append(idx)
+
+    out: List[Dict[str, float]] = [{} for _ in candidates]
+    for sid, idxs in by_sid.items():
+        batch = matchers.get(sid, _EMPTY_MATCHER).scores([candidates[i][0] for i in idxs])
+        for i, score in zip(idxs, batch):
+            out[i][sid] = score
+    return out
+
+
+def pick_best(series_ids: Sequence[str], scores: Dict[str, float]) -> Tuple[Optional[str], float]:
+    """(best_sid, raw_score) from per-series scores; ties keep the first sid, as best_series_score does."""
+    best_sid: Optional[str] = None
+    best_score = 0.0
+    for sid in series_ids:
+        score = scores[sid]
+        if best_sid is None or score > best_score:
+            best_sid, best_score = sid, score
+    return best_sid, best_score
+
+
+def best_series_scores(
+    candidates: Sequence[Tuple[str, Sequence[str]]], matchers: Dict[str, SeriesMatcher]
+) -> List[Tuple[Optional[str], float]]:
+    """Batch form of best_series_score for (title, series_ids) pairs; same results, in input order."""
+    return [pick_best(sids, scores) for (_, sids), scores in zip(candidates, series_scores(candidates, matchers))]
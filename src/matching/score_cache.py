@@ -0,0 +1,114 @@
+from __future__ import annotations
+import hashlib
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+from src.utils.normalize import normalize_for_match
+
+
+def title_key(title: str) -> str:
+    """Cache key of a title: hash of its normalized form (scores only depend on that)."""
+    return hashlib.sha1(normalize_for_match(title).encode('utf-8')).hexdigest()
+
+
+class ScoreCache:
+    """
+    Persistent SQLite cache of raw match scores across runs.
+
+    Rows are keyed by (normalized title hash, alias-set fingerprint), where the
+    fingerprint (SeriesMatcher.fingerprint) covers the series' normalized
+    aliases, BOOST_WORDS and SCORING_VERSION. Changing any of those changes
+    the key, so stale scores are never read; they just stop being used and
+    age out. `used_at` is the LRU clock: when the table grows past
+    `max_rows`, the least recently used rows are deleted first.
+
+    Args:
+        path: SQLite file (parent directory created if missing)
+        max_rows: Size bound of the cache
+    """
+
+    # Key pairs per lookup query (two bound parameters each, under SQLite's limit)
+    _BATCH = 400
+
+    def __init__(self, path: str, max_rows: int = 200000):
+        self.path = path
+        self.max_rows = max_rows
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS scores ('
+            ' title_hash TEXT NOT NULL, alias_hash TEXT NOT NULL, score REAL NOT NULL,'
+            ' used_at INTEGER NOT NULL, PRIMARY KEY (title_hash, alias_hash)) WITHOUT ROWID'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS scores_used_at ON scores (used_at)')
+        self._conn.commit()
+
+    def get_many(self, keys: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], float]:
+        """Cached scores for (title_hash, alias_hash) keys; marks the hits as used now."""
+        wanted = list(dict.fromkeys(keys))
+        found: Dict[Tuple[str, str], float] = {}
+        for i in range(0, len(wanted), self._BATCH):
+            batch = wanted[i : i + self._BATCH]
+            clause = ' OR '.join(['(title_hash = ? AND alias_hash = ?)'] * len(batch))
+            params = [v for key in batch for v in key]
+            for title_hash, alias_hash, score in self._conn.execute(
+                f'SELECT title_hash, alias_hash, score FROM scores WHERE {clause}', params
+            ):
+                found[(title_hash, alias_hash)] = score
+        self.hits += len(found)
+        self.misses += len(wanted) - len(found)
+        if found:
+            now = int(time.time())
+            self._conn.executemany(
+                'UPDATE scores SET used_at = ? WHERE title_hash = ? AND alias_hash = ?',
+                [(now, t, a) for t, a in found],
+            )
+            self._conn.commit()
+        return found
+
+    def put_many(self, entries: Dict[Tuple[str, str], float]) -> None:
+        if not entries:
+            return
+        now = int(time.time())
+        self._conn.executemany(
+            'INSERT OR REPLACE INTO scores (title_hash, alias_hash, score, used_at) VALUES (?, ?, ?, ?)',
+            [(t, a, score, now) for (t, a), score in entries.items()],
+        )
+        self._conn.commit()
+        self._evict()
+
+    def _evict(self) -> None:
+        count = self._conn.execute('SELECT COUNT(*) FROM scores').fetchone()[0]
+        if count <= self.max_rows:
+            return
+        # Drop to 90% of the bound so eviction does not run on every write
+        excess = count - int(self.max_rows * 0.9)
+        self._conn.execute(
+            'DELETE FROM scores WHERE (title_hash, alias_hash) IN '
+            '(SELECT title_hash, alias_hash FROM scores ORDER BY used_at LIMIT ?)',
+            (excess,),
+        )
+        self._conn.commit()
+
+    def size(self) -> int:
+        return self._conn.execute('SELECT COUNT(*) FROM scores').fetchone()[0]
+
+    def summary(self) -> str:
+        total = self.hits + self.misses
+        rate = self.hits / total * 100.0 if total else 0.0
+        return f'Score cache: {self.hits} hits, {self.misses} misses ({rate:.1f}% hit), {self.size()} rows'
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def open_score_cache(state_dir: str, enabled: bool = True, max_rows: int = 200000) -> Optional[ScoreCache]:
+    """Score cache at STATE_DIR/score_cache.sqlite, or None when disabled."""
+    if not enabled:
+        return None
+    return ScoreCache(os.path.join(state_dir, 'score_cache.sqlite'), max_rows=max_rows)
+
@@ -0,0 +1,87 @@
+from __future__ import annotations
+import json
+import os
+from typing import Dict, List, Optional
+
+from src.pipeline.shards import Shard, shard_state_name
+
+
+class SearchCheckpoint:
+    """
+    Append-only JSONL checkpoint of the search phase.
+
+    The first line records the run date and the plan hash (search plan key +
+    QueryPlan.fingerprint()); every later line holds one completed series'
+    raw hits and how paging of each of its terms ended:
+
+        {"run_date": "2025-01-31", "plan_hash": "<sha1>"}
+        {"series_id": "<sid>", "hits": [...], "outcomes": {"<term>": "complete"}}
+
+    Opening a checkpoint with the same date and plan hash resumes it:
+    `completed` maps the series already searched to their hits and
+    `outcomes` collects their terms' outcomes. Any other
+    file (another day, another plan, or unreadable) is started over. A line
+    cut short by a crash is ignored, so that series is searched again.
+    """
+
+    def __init__(self, path: str, run_date: str, plan_hash: str):
+        self.path = path
+        self.run_date = run_date
+        self.plan_hash = plan_hash
+        self.outcomes: Dict[str, str] = {}
+        self.completed: Dict[str, List[Dict]] = self._load()
+        if not self.completed:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'run_date': run_date, 'plan_hash': plan_hash}) + '\n')
+
+    def _load(self) -> Dict[str, List[Dict]]:
+        if not os.path.exists(self.path):
+            return {}
+        completed: Dict[str, List[Dict]] = {}
+        with open(self.path, 'rb') as f:
+            try:
+                header = json.loads(f.readline())
+            except ValueError:
+                return {}
+            if header.get('run_date') != self.run_date or header.get('plan_hash') != self.plan_hash:
+                return {}
+            good = f.tell()
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                completed[entry['series_id']] = entry['hits']
+                self.outcomes.update(entry.get('outcomes') or {})
+                good = f.tell()
+        if good < os.path.getsize(self.path):
+            # Drop a line torn by an interrupted write so appends start on a clean line
+            with open(self.path, 'r+b') as f:
+                f.truncate(good)
+        return completed
+
+    def append(self, series_id: str, hits: List[Dict], outcomes: Optional[Dict[str, str]] = None) -> None:
+        """Record a completed series; flushed and synced so it survives the process dying."""
+        entry = {'series_id': series_id, 'hits': hits, 'outcomes': outcomes or {}}
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self.completed[series_id] = hits
+        self.outcomes.update(outcomes or {})
+
+    def clear(self) -> None:
+        """Remove the checkpoint once the run has finished."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def open_search_checkpoint(
+    state_dir: str, run_date: str, plan_hash: str, enabled: bool = True, shard: Optional[Shard] = None,
+) -> Optional[SearchCheckpoint]:
+    """Checkpoint at STATE_DIR/search_checkpoint.jsonl (search_checkpoint_{i}of{n}.jsonl per shard), or None when disabled."""
+    if not enabled:
+        return None
+    path = os.path.join(state_dir, shard_state_name('search_checkpoint.jsonl', shard))
+    return SearchCheckpoint(path, run_date, plan_hash)
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Merge the candidate files of sharded run_dailymotion_db runs into one day's detections (Supabase)."""
+from __future__ import annotations
+import argparse
+import datetime as dt
+import os
+import re
+
+from src.pipeline.run_dailymotion_db import store_detections
+from src.pipeline.search_phase import load_catalog
+from src.pipeline.shards import find_shards, merge_shards
+
+
+_SHARD_NAME = re.compile(r'dailymotion_shard_(\d+)of(\d+)_')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Merge sharded Dailymotion detection runs.')
+    parser.add_argument('paths', nargs='*', help='Shard files (default: REPORT_DIR/dailymotion_shard_*of*_<date>.jsonl)')
+    parser.add_argument('--date', default=dt.date.today().isoformat(), help='Run date of the shards (YYYY-MM-DD)')
+    parser.add_argument('--allow-missing', action='store_true', help='Merge even if some of the n shards are missing')
+    args = parser.parse_args()
+
+    out_dir = os.environ.get('REPORT_DIR', 'reports')
+    os.makedirs(out_dir, exist_ok=True)
+    paths = args.paths or find_shards(out_dir, args.date)
+    if not paths:
+        raise SystemExit(f'No shard files for {args.date} in {out_dir}')
+
+    found = {}
+    for path in paths:
+        m = _SHARD_NAME.search(os.path.basename(path))
+        if m:
+            found.setdefault(int(m.group(2)), set()).add(int(m.group(1)))
+    for count, indexes in found.items():
+        missing = sorted(set(range(1, count + 1)) - indexes)
+        if missing:
+            note = f'Missing shards {missing} of {count}'
+            if not args.allow_missing:
+                raise SystemExit(f'{note}; rerun them or pass --allow-missing')
+            print(f'Warning: {note}')
+
+    candidates = merge_shards(paths)
+    print(f'Merged {len(paths)} shard files into {len(candidates)} unique candidates')
+
+    # Same settings (and low-yield terms) as the detection runs, so the cached search plan is reused
+    catalog, term_yield = load_catalog(os.environ.get('DATA_JSON', 'data/data.json'), os.environ.get('STATE_DIR', 'state'))
+    if term_yield is not None:
+        term_yield.close()
+    store_detections(candidates, catalog.titles_by_sid, out_dir, args.date)
+
+
+if __name__ == '__main__':
+    main()
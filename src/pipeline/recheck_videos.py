@@ -2,8 +2,9 @@
 """
 Recheck status of known pirated videos.
 
-Queries the Dailymotion API directly for each video ID in state
-to determine current status (removed, private, geo-blocked, etc.)
+Queries the Dailymotion API for the video IDs in state (batched, up to
+100 ids per request) to determine current status (removed, private,
+geo-blocked, etc.)
 """
 from __future__ import annotations
 import csv
@@ -13,7 +14,7 @@ import os
 import time
 from typing import Dict, List
 
-from src.platforms.dailymotion import get_video_status, parse_geoblocking
+from src.platforms.dailymotion import STATUS_BATCH_SIZE, get_video_statuses, format_request_stats
 
 
 def _int_env(name: str, default: int) -> int:
@@ -36,6 +37,13 @@ def _float_env(name: str, default: float) -> float:
         return default
 
 
+def _bool_env(name: str, default: bool = False) -> bool:
+    val = os.environ.get(name)
+    if val is None:
+        return default
+    return val.strip().lower() in {"1", "true", "yes", "y"}
+
+
 def infer_action_needed(api_status: str, days_since_detection: int) -> str:
     """
     Infer what action is needed based on video status and time.
@@ -78,6 +86,8 @@ def main():
 
     recheck_days = _int_env('DAILYMOTION_RECHECK_DAYS', 30)
     sleep_sec = _float_env('DAILYMOTION_RECHECK_SLEEP_SEC', 0.5)
+    # Private videos can be missing from batch responses; confirm missing ids one by one
+    verify_missing = _bool_env('DAILYMOTION_RECHECK_VERIFY_MISSING', True)
 
     # Load state
     if not os.path.exists(state_path):
@@ -113,19 +123,29 @@ def main():
 
     print(f'Rechecking {len(videos_to_check)} videos detected within last {recheck_days} days')
 
-    # Recheck each video
+    # Recheck videos in batches (one API call per STATUS_BATCH_SIZE ids)
     errors = []
-    for idx, (key, video_info) in enumerate(videos_to_check.items(), 1):
-        video_id = video_info.get('video_id')
-        if not video_id:
-            continue
-
-        if idx % 10 == 0:
-            print(f'  Progress: {idx}/{len(videos_to_check)}')
+    pending = [
+        (key, video_info) for key, video_info in videos_to_check.items() if video_info.get('video_id')
+    ]
+    for start in range(0, len(pending), STATUS_BATCH_SIZE):
+        batch = pending[start:start + STATUS_BATCH_SIZE]
+        batch_ids = [video_info['video_id'] for _, video_info in batch]
+        print(f'  Progress: {start + len(batch)}/{len(pending)}')
 
         try:
-            # Get video status from API
-            response = get_video_status(video_id)
+            # Get video statuses from API
+            responses = get_video_statuses(batch_ids, verify_missing=verify_missing)
+        except Exception as e:
+            errors.extend((vid, str(e)) for vid in batch_ids)
+            continue
+
+        for key, video_info in batch:
+            response = responses.get(video_info['video_id'])
+            if response is None:
+                # Lookup failed; keep the previous status and retry on the next recheck
+                errors.append((video_info['video_id'], 'status lookup failed'))
+                continue
 
             # Update state based on API response
             if not response.get('exists'):
@@ -146,11 +166,7 @@ def main():
             # Update last checked time
             video_info['api_last_checked'] = today_s
 
-            time.sleep(sleep_sec)
-
-        except Exception as e:
-            errors.append((video_id, str(e)))
-            continue
+        time.sleep(sleep_sec)
 
     print(f'Recheck completed')
 
@@ -248,4 +264,7 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    try:
+        main()
+    finally:
+        print(format_request_stats())
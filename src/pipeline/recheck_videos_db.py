@@ -4,11 +4,12 @@ import csv
 import datetime as dt
 import os
 import time
+from typing import Dict, List
 
-from src.platforms.dailymotion import get_video_status
+from src.platforms.dailymotion import STATUS_BATCH_SIZE, get_video_statuses, format_request_stats
 from src.database.supabase_db import (
     get_videos_to_recheck,
-    update_video_status,
+    update_video_statuses,
     get_all_videos_for_report,
     count_videos
 )
@@ -34,6 +35,13 @@ def _float_env(name: str, default: float) -> float:
         return default
 
 
+def _bool_env(name: str, default: bool = False) -> bool:
+    val = os.environ.get(name)
+    if val is None:
+        return default
+    return val.strip().lower() in {"1", "true", "yes", "y"}
+
+
 def infer_action_needed(api_status: str, days_since_detection: int) -> str:
     """Infer action needed based on status and time."""
     if api_status == 'removed':
@@ -61,6 +69,8 @@ def main():
     recheck_min_days = _int_env('DAILYMOTION_RECHECK_MIN_DAYS', 2)
     recheck_max_days = _int_env('DAILYMOTION_RECHECK_MAX_DAYS', 30)
     sleep_sec = _float_env('DAILYMOTION_RECHECK_SLEEP_SEC', 0.2)
+    # Private videos can be missing from batch responses; confirm missing ids one by one
+    verify_missing = _bool_env('DAILYMOTION_RECHECK_VERIFY_MISSING', True)
 
     # Get videos to recheck (between 2-30 days old, active status)
     videos = get_videos_to_recheck(min_days=recheck_min_days, max_days=recheck_max_days)
@@ -71,38 +81,54 @@ def main():
 
     print(f'Rechecking {len(videos)} videos (days {recheck_min_days}-{recheck_max_days})...')
 
-    # Recheck each video
+    # Recheck in batches (one API call per STATUS_BATCH_SIZE ids), grouped per platform
     errors = []
-    for idx, video in enumerate(videos, 1):
-        video_id = video['video_id']
-        platform = video['platform']
-
-        if idx % 10 == 0:
-            print(f'  Progress: {idx}/{len(videos)}')
-
-        try:
-            response = get_video_status(video_id)
+    ids_by_platform: Dict[str, List[str]] = {}
+    for video in videos:
+        ids_by_platform.setdefault(video['platform'], []).append(video['video_id'])
+
+    checked = 0
+    for platform, video_ids in ids_by_platform.items():
+        for start in range(0, len(video_ids), STATUS_BATCH_SIZE):
+            batch_ids = video_ids[start:start + STATUS_BATCH_SIZE]
+            checked += len(batch_ids)
+            print(f'  Progress: {checked}/{len(videos)}')
+
+            try:
+                responses = get_video_statuses(batch_ids, verify_missing=verify_missing)
+            except Exception as e:
+                errors.extend((vid, str(e)) for vid in batch_ids)
+                continue
 
             # Determine status
-            if not response.get('exists'):
-                status = 'removed'
-            elif response.get('private'):
-                status = 'private'
-            elif response.get('password_protected'):
-                status = 'password_protected'
-            elif response.get('status') == 'rejected':
-                status = 'rejected'
-            else:
-                status = 'active'
-
-            # Update database
-            update_video_status(video_id, status, platform)
+            ids_by_status: Dict[str, List[str]] = {}
+            for video_id in batch_ids:
+                response = responses.get(video_id)
+                if response is None:
+                    # Lookup failed; keep the stored status and retry on the next recheck
+                    errors.append((video_id, 'status lookup failed'))
+                    continue
+                if not response.get('exists'):
+                    status = 'removed'
+                elif response.get('private'):
+                    status = 'private'
+                elif response.get('password_protected'):
+                    status = 'password_protected'
+                elif response.get('status') == 'rejected':
+                    status = 'rejected'
+                else:
+                    status = 'active'
+                ids_by_status.setdefault(status, []).append(video_id)
+
+            # Update database (one update per status value)
+            for status, status_ids in ids_by_status.items():
+                try:
+                    update_video_statuses(status_ids, status, platform)
+                except Exception as e:
+                    errors.extend((vid, str(e)) for vid in status_ids)
 
             time.sleep(sleep_sec)
 
-        except Exception as e:
-            errors.append((video_id, str(e)))
-
     print(f'Recheck completed')
 
     if errors:
@@ -178,4 +204,7 @@ def main():
 
 
 if __name__ == '__main__':
-    main()
+    try:
+        main()
+    finally:
+        print(format_request_stats())
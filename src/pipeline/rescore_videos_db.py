@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Re-score every stored video against the current catalog and scoring settings (Supabase)."""
+from __future__ import annotations
+import os
+import time
+from typing import Dict, List, Optional
+
+from src.matching.parallel import score_candidates
+from src.matching.score import format_scoring_stats
+from src.matching.score_cache import open_score_cache
+from src.pipeline.search_phase import _bool_env, _float_env, _int_env, _normalize_score, load_catalog
+from src.database.supabase_db import iter_videos, upsert_video_scores
+
+
+COLUMNS = 'platform,video_id,title,series_id,raw_score,score,first_seen'
+# Normalized score histogram edges: [0,1), [1,2), ... [9,10]
+BUCKET_EDGES = list(range(1, 10))
+
+
+def _bucket(score: Optional[float]) -> str:
+    if score is None:
+        return 'none'
+    for edge in BUCKET_EDGES:
+        if score < edge:
+            return f'{edge - 1}-{edge}'
+    return '9-10'
+
+
+def format_distribution(before: Dict[str, int], after: Dict[str, int], min_score: float) -> str:
+    labels = ['none'] + [f'{e - 1}-{e}' for e in BUCKET_EDGES] + ['9-10']
+    lines = ['Score distribution (before -> after):']
+    for label in labels:
+        b, a = before.get(label, 0), after.get(label, 0)
+        if b or a:
+            lines.append(f'  {label:>5}: {b:>7} -> {a:>7} ({a - b:+d})')
+    lines.append(f'  >= {min_score}: {before.get("pass", 0)} -> {after.get("pass", 0)}')
+    return '\n'.join(lines)
+
+
+def main():
+    data_path = os.environ.get('DATA_JSON', 'data/data.json')
+    state_dir = os.environ.get('STATE_DIR', 'state')
+
+    # Same alias selection and scoring settings as run_dailymotion_db, so stored
+    # scores end up as a fresh detection run would compute them (and the cached
+    # search plan keeps the detection run's key)
+    catalog, term_yield = load_catalog(data_path, state_dir)
+    if term_yield is not None:
+        term_yield.close()
+    aliases_by_sid = catalog.aliases_by_sid
+    raw_filter = os.environ.get('DAILYMOTION_SERIES_IDS')
+    if raw_filter:
+        series_filter = {s.strip() for s in raw_filter.split(',') if s.strip()}
+        if series_filter:
+            aliases_by_sid = {sid: aliases for sid, aliases in aliases_by_sid.items() if sid in series_filter}
+
+    score_scale = _float_env('DAILYMOTION_SCORE_SCALE', 6.0, minimum=0.1)
+    min_score = _float_env('DAILYMOTION_MIN_SCORE', 5.5, minimum=0.0)
+    scoring_workers = _int_env('DAILYMOTION_SCORING_WORKERS', 0, minimum=0)
+    scoring_parallel_min = _int_env('DAILYMOTION_SCORING_PARALLEL_MIN', 2000, minimum=0)
+    score_cache_enabled = _bool_env('DAILYMOTION_SCORE_CACHE', True)
+    score_cache_max_rows = _int_env('DAILYMOTION_SCORE_CACHE_MAX_ROWS', 200000)
+    page_size = _int_env('DAILYMOTION_RESCORE_PAGE_SIZE', 1000)
+    write_batch_size = _int_env('DAILYMOTION_RESCORE_BATCH_SIZE', 500)
+    dry_run = _bool_env('DAILYMOTION_RESCORE_DRY_RUN', False)
+
+    matchers = catalog.matchers(aliases_by_sid)
+    score_cache = open_score_cache(state_dir, score_cache_enabled, score_cache_max_rows)
+
+    before: Dict[str, int] = {}
+    after: Dict[str, int] = {}
+    pending: List[Dict] = []
+    seen = changed = written = skipped = 0
+    started = time.time()
+    print(f'Re-scoring stored videos against {len(matchers)} series (scale {score_scale}){" [dry run]" if dry_run else ""}')
+
+    try:
+        for page in iter_videos(COLUMNS, page_size=page_size):
+            seen += len(page)
+            rows = [r for r in page if r.get('series_id') in matchers]
+            skipped += len(page) - len(rows)
+            # One batch per page: titles are grouped per series and scored together
+            attributed = score_candidates(
+                [(r.get('title') or '', [r['series_id']]) for r in rows], aliases_by_sid, matchers=matchers,
+                workers=scoring_workers, min_parallel=scoring_parallel_min, cache=score_cache,
+            )
+            for row, (_, raw) in zip(rows, attributed):
+                raw_score = round(raw, 3)
+                score = round(_normalize_score(raw, score_scale), 3)
+                old_score = row.get('score')
+                before[_bucket(old_score)] = before.get(_bucket(old_score), 0) + 1
+                after[_bucket(score)] = after.get(_bucket(score), 0) + 1
+                if old_score is not None and old_score >= min_score:
+                    before['pass'] = before.get('pass', 0) + 1
+                if score >= min_score:
+                    after['pass'] = after.get('pass', 0) + 1
+                if row.get('raw_score') == raw_score and old_score == score:
+                    continue
+                changed += 1
+                pending.append({
+                    'platform': row['platform'],
+                    'video_id': row['video_id'],
+                    'first_seen': row['first_seen'],
+                    'raw_score': raw_score,
+                    'score': score,
+                })
+            if len(pending) >= write_batch_size:
+                if not dry_run:
+                    written += upsert_video_scores(pending, batch_size=write_batch_size)
+                pending = []
+            print(f'  {seen} rows read, {changed} changed')
+        if pending and not dry_run:
+            written += upsert_video_scores(pending, batch_size=write_batch_size)
+    finally:
+        if score_cache is not None:
+            print(score_cache.summary())
+            score_cache.close()
+
+    print(f'Re-scored {seen - skipped} videos in {time.time() - started:.1f}s: {changed} changed, {written} written')
+    if skipped:
+        print(f'  - Skipped {skipped} whose series is not in the current catalog')
+    print(format_distribution(before, after, min_score))
+    print(format_scoring_stats())
+
+
+if __name__ == '__main__':
+    main()
@@ -7,14 +7,14 @@ import os
 import time
 from typing import Dict, List, Optional, Set
 
-from src.keywords.expand import build_series_keywords
-from src.matching.score import compute_score
-from src.platforms.dailymotion import search_videos, get_video_status, parse_geoblocking
-
-
-def load_data(path: str) -> Dict:
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+from src.matching.score import format_scoring_stats
+from src.platforms.dailymotion import (
+    format_request_stats,
+    STATUS_BATCH_SIZE,
+    get_video_statuses,
+    parse_geoblocking,
+)
+from src.pipeline.search_phase import SearchPhase, dedupe_hits, load_catalog
 
 
 def _int_env(name: str, default: int, minimum: int = 1) -> int:
@@ -55,18 +55,8 @@ def _normalize_score(raw: float, scale: float) -> float:
     return score
 
 
-def build_title_map(data: Dict) -> Dict[str, str]:
-    titles: Dict[str, str] = {}
-    for item in data.get('series', []):
-        sid = item.get('series_id')
-        title = item.get('canonical_title') or ''
-        if sid:
-            titles[sid] = title
-    return titles
-
-
-def is_whitelisted(uploader_name: str, data: Dict) -> bool:
-    for w in data.get('whitelist', []):
+def is_whitelisted(uploader_name: str, whitelist: List[Dict]) -> bool:
+    for w in whitelist:
         if w.get('platform') == 'dailymotion':
             # If we later add DM whitelist; for now none -> False
             pass
@@ -84,19 +74,10 @@ def main():
     os.makedirs(state_dir, exist_ok=True)
     state_path = os.path.join(state_dir, 'dailymotion_videos.json')
 
-    data = load_data(data_path)
-    max_aliases = _int_env('DAILYMOTION_MAX_ALIASES', 10)
-    include_ep_patterns = _bool_env('DAILYMOTION_INCLUDE_EP_PATTERNS', False)
-    min_alias_length = _int_env('DAILYMOTION_MIN_ALIAS_LENGTH', 6, minimum=0)
-    keywords_by_sid_raw, filtered_aliases_by_sid = build_series_keywords(
-        data,
-        include_ep_patterns=include_ep_patterns,
-        max_aliases=max_aliases,
-        min_alias_length=min_alias_length,
-    )
-    aliases_by_sid = filtered_aliases_by_sid
-    titles_by_sid = build_title_map(data)
-    keywords_by_sid = keywords_by_sid_raw
+    catalog, term_yield = load_catalog(data_path, state_dir)
+    aliases_by_sid = catalog.aliases_by_sid
+    titles_by_sid = catalog.titles_by_sid
+    keywords_by_sid = catalog.keywords_by_sid
 
     raw_filter = os.environ.get('DAILYMOTION_SERIES_IDS')
     series_filter: Optional[Set[str]] = None
@@ -113,12 +94,6 @@ def main():
                 sid: title for sid, title in titles_by_sid.items() if sid in keywords_by_sid
             }
 
-    per_term_limit = _int_env('DAILYMOTION_PER_TERM_LIMIT', 200)
-    primary_aliases = _int_env('DAILYMOTION_PRIMARY_ALIASES', 2, minimum=0)
-    primary_per_term_limit = _int_env(
-        'DAILYMOTION_PRIMARY_PER_TERM_LIMIT', max(per_term_limit, 1), minimum=1
-    )
-    sleep_sec = _float_env('DAILYMOTION_SLEEP_SEC', 0.3)
     score_scale = _float_env('DAILYMOTION_SCORE_SCALE', 6.0, minimum=0.1)
     min_duration_sec = _int_env('DAILYMOTION_MIN_DURATION_SEC', 300, minimum=0)
     min_score = _float_env('DAILYMOTION_MIN_SCORE', 5.0, minimum=0.0)
@@ -130,55 +105,24 @@ def main():
     geo_sleep_sec = _float_env('DAILYMOTION_GEO_SLEEP_SEC', 0.1)
 
     # Query Dailymotion
-    all_hits: List[Dict] = []
-    total_series = len(keywords_by_sid)
-    if total_series == 0:
+    if not keywords_by_sid:
         if series_filter:
             print('No series matched requested DAILYMOTION_SERIES_IDS; exiting.')
         else:
             print('No series available for querying; exiting.')
         return
-    print(
-        'Searching Dailymotion for '
-        f"{total_series} series (primary limit {primary_per_term_limit} for first {primary_aliases} aliases, "
-        f"default limit {per_term_limit} per term, sleep {sleep_sec:.2f}s)"
+    phase = SearchPhase(
+        catalog, keywords_by_sid, aliases_by_sid, titles_by_sid,
+        state_dir=state_dir,
+        out_dir=out_dir,
+        term_yield=term_yield,
+        per_term_limit=_int_env('DAILYMOTION_PER_TERM_LIMIT', 200),
+        sleep_sec=_float_env('DAILYMOTION_SLEEP_SEC', 0.3),
+        score_scale=score_scale,
+        min_score=min_score,
     )
-    for idx, (sid, terms) in enumerate(keywords_by_sid.items(), start=1):
-        aliases = aliases_by_sid.get(sid, [])
-        title_hint = titles_by_sid.get(sid) or (aliases[0] if aliases else sid)
-        print(f'[{idx}/{total_series}] {title_hint} -> {len(terms)} terms')
-        series_hits: List[Dict] = []
-        primary_terms: List[str] = []
-        secondary_terms: List[str] = terms
-        if primary_aliases > 0:
-            primary_terms = terms[:primary_aliases]
-            secondary_terms = terms[primary_aliases:]
-        if primary_terms:
-            series_hits.extend(
-                search_videos(primary_terms, per_term_limit=primary_per_term_limit, sleep_sec=sleep_sec)
-            )
-        if secondary_terms:
-            series_hits.extend(
-                search_videos(secondary_terms, per_term_limit=per_term_limit, sleep_sec=sleep_sec)
-            )
-        hits = series_hits
-        if hits:
-            print(f'  Retrieved {len(hits)} candidates')
-        for h in hits:
-            h['__series_id'] = sid
-        all_hits.extend(hits)
-    print(f'Collected {len(all_hits)} raw candidates before dedupe')
-
     # Deduplicate by (platform, video_id)
-    dedup: Dict[str, Dict] = {}
-    for h in all_hits:
-        vid = h.get('id')
-        if not vid:
-            continue
-        key = f'dailymotion:{vid}'
-        if key in dedup:
-            continue
-        dedup[key] = h
+    dedup = dedupe_hits(phase.search())
     print(f'{len(dedup)} unique candidates after dedupe')
 
     # Load previous state
@@ -187,36 +131,47 @@ def main():
         with open(state_path, 'r', encoding='utf-8') as f:
             prev_state = json.load(f)
 
-    # Geo-blocking check (efficient: uses geoblocking field from API)
+    # Geo-blocking check (efficient: uses geoblocking field from API, batched by id)
     if check_regions:
         print(f'Checking geo-blocking info for new videos')
+        # Only check geo for new videos (not already in state)
+        new_keys = [key for key, h in dedup.items() if h.get('id') and key not in prev_state]
         checked_count = 0
-        for key, h in dedup.items():
-            vid = h.get('id')
-            if not vid:
-                continue
-
-            # Only check geo for new videos (not already in state)
-            if key not in prev_state:
-                try:
-                    status_data = get_video_status(vid)
-                    geoblocking = status_data.get('geoblocking', [])
-                    blocked_regions, available_regions = parse_geoblocking(geoblocking)
-
-                    h['__geoblocking'] = geoblocking
-                    h['__blocked_regions'] = blocked_regions
-                    h['__available_regions'] = available_regions
-                    checked_count += 1
-
-                    time.sleep(geo_sleep_sec)
-                except Exception as e:
-                    print(f'  Warning: Failed to check geo for video {vid}: {e}')
+        unknown_count = 0
+        for start in range(0, len(new_keys), STATUS_BATCH_SIZE):
+            batch_keys = new_keys[start:start + STATUS_BATCH_SIZE]
+            try:
+                statuses = get_video_statuses([dedup[key]['id'] for key in batch_keys])
+            except Exception as e:
+                print(f'  Warning: Failed to check geo for {len(batch_keys)} videos: {e}')
+                statuses = {}
+
+            for key in batch_keys:
+                h = dedup[key]
+                status_data = statuses.get(h['id'])
+                # Unresolved, missing from the batch (private videos are left out) or
+                # forbidden: no geoblocking to read, so the geo status stays unknown
+                if not status_data or not status_data.get('exists') or status_data.get('status') == 'forbidden':
                     h['__geoblocking'] = []
                     h['__blocked_regions'] = []
                     h['__available_regions'] = []
+                    h['__geo_unknown'] = True
+                    unknown_count += 1
+                    continue
+                geoblocking = status_data.get('geoblocking', [])
+                blocked_regions, available_regions = parse_geoblocking(geoblocking)
+
+                h['__geoblocking'] = geoblocking
+                h['__blocked_regions'] = blocked_regions
+                h['__available_regions'] = available_regions
+                checked_count += 1
+
+            time.sleep(geo_sleep_sec)
 
         if checked_count > 0:
             print(f'  Geo-checked {checked_count} new videos')
+        if unknown_count > 0:
+            print(f'  Geo status unknown for {unknown_count} videos (private or missing from the batch response)')
 
     today = dt.date.today()
     today_s = today.isoformat()
@@ -224,13 +179,11 @@ def main():
     # Score and filter candidates
     new_state: Dict[str, Dict] = {}
     rows: List[List[str]] = []
-    for key, h in dedup.items():
+    attributed = phase.attribute(dedup)
+    for (key, h), (sid, raw_score) in zip(dedup.items(), attributed):
         title = h.get('title', '')
-        sid = h.get('__series_id')
-        aliases = aliases_by_sid.get(sid, [])
-        raw_score = compute_score(title, aliases)
         uploader = h.get('owner.username') or ''
-        whitelisted = is_whitelisted(uploader, data)
+        whitelisted = is_whitelisted(uploader, catalog.whitelist)
         if whitelisted:
             raw_score -= 2.0
         if raw_score < 0:
@@ -276,6 +229,8 @@ def main():
         # Determine geo_status
         if not check_regions:
             geo_status = 'N/A'
+        elif is_new and h.get('__geo_unknown'):
+            geo_status = '未知'
         elif blocked_regions:
             geo_status = f"{','.join(blocked_regions)}屏蔽"
         else:
@@ -288,6 +243,9 @@ def main():
             'new' if is_new else 'existing'
         ])
 
+    passing_keys = set(new_state)
+    new_keys = {key for key, v in new_state.items() if v['is_new']}
+
     # Carry over previously seen videos that weren't re-detected today
     # They stay in state but won't appear in today's CSV (recheck will handle them)
     seen_keys = set(new_state.keys())
@@ -327,6 +285,12 @@ def main():
                 w.writerow(r)
         print(f'Wrote {new_csv} with {len(new_rows)} new detections (for operations team)')
 
+    phase.finish(today_s, passing_keys, new_keys)
+
 
 if __name__ == '__main__':
-    main()
+    try:
+        main()
+    finally:
+        print(format_request_stats())
+        print(format_scoring_stats())
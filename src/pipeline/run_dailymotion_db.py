@@ -3,22 +3,16 @@
 from __future__ import annotations
 import csv
 import datetime as dt
-import json
 import os
-import time
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Set
 
-from src.keywords.expand import build_series_keywords
-from src.matching.score import compute_score
-from src.platforms.dailymotion import search_videos
+from src.matching.score import format_scoring_stats
+from src.platforms.dailymotion import format_request_stats
+from src.pipeline.search_phase import SearchPhase, dedupe_hits, load_catalog
+from src.pipeline.shards import parse_shard, shard_of, write_shard
 from src.database.supabase_db import get_existing_video_ids, insert_videos, count_videos
 
 
-def load_data(path: str) -> Dict:
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
-
-
 def _int_env(name: str, default: int, minimum: int = 1) -> int:
     raw = os.environ.get(name)
     if raw is None:
@@ -41,154 +35,13 @@ def _float_env(name: str, default: float, minimum: float = 0.0) -> float:
         return default
 
 
-def _bool_env(name: str, default: bool = False) -> bool:
-    raw = os.environ.get(name)
-    if raw is None:
-        return default
-    return raw.strip().lower() in {"1", "true", "yes", "y"}
-
-
 def _normalize_score(raw: float, scale: float) -> float:
     score = raw * scale
     return max(0.0, min(10.0, score))
 
 
-def build_title_map(data: Dict) -> Dict[str, str]:
-    titles = {}
-    for item in data.get('series', []):
-        sid = item.get('series_id')
-        title = item.get('canonical_title') or ''
-        if sid:
-            titles[sid] = title
-    return titles
-
-
-def main():
-    data_path = os.environ.get('DATA_JSON', 'data/data.json')
-    out_dir = os.environ.get('REPORT_DIR', 'reports')
-    os.makedirs(out_dir, exist_ok=True)
-
-    data = load_data(data_path)
-    max_aliases = _int_env('DAILYMOTION_MAX_ALIASES', 10)
-    include_ep_patterns = _bool_env('DAILYMOTION_INCLUDE_EP_PATTERNS', False)
-    min_alias_length = _int_env('DAILYMOTION_MIN_ALIAS_LENGTH', 6, minimum=0)
-
-    keywords_by_sid_raw, filtered_aliases_by_sid = build_series_keywords(
-        data,
-        include_ep_patterns=include_ep_patterns,
-        max_aliases=max_aliases,
-        min_alias_length=min_alias_length,
-    )
-
-    aliases_by_sid = filtered_aliases_by_sid
-    titles_by_sid = build_title_map(data)
-    keywords_by_sid = keywords_by_sid_raw
-
-    # Optional series filter
-    raw_filter = os.environ.get('DAILYMOTION_SERIES_IDS')
-    if raw_filter:
-        series_filter = {s.strip() for s in raw_filter.split(',') if s.strip()}
-        if series_filter:
-            keywords_by_sid = {sid: terms for sid, terms in keywords_by_sid.items() if sid in series_filter}
-            aliases_by_sid = {sid: aliases for sid, aliases in aliases_by_sid.items() if sid in keywords_by_sid}
-            titles_by_sid = {sid: title for sid, title in titles_by_sid.items() if sid in keywords_by_sid}
-
-    # Config
-    per_term_limit = _int_env('DAILYMOTION_PER_TERM_LIMIT', 300)
-    primary_aliases = _int_env('DAILYMOTION_PRIMARY_ALIASES', 2, minimum=0)
-    primary_per_term_limit = _int_env('DAILYMOTION_PRIMARY_PER_TERM_LIMIT', max(per_term_limit, 1), minimum=1)
-    sleep_sec = _float_env('DAILYMOTION_SLEEP_SEC', 0.2)
-    score_scale = _float_env('DAILYMOTION_SCORE_SCALE', 6.0, minimum=0.1)
-    min_duration_sec = _int_env('DAILYMOTION_MIN_DURATION_SEC', 1000, minimum=0)
-    min_score = _float_env('DAILYMOTION_MIN_SCORE', 5.5, minimum=0.0)
-
-    # Search Dailymotion
-    total_series = len(keywords_by_sid)
-    if total_series == 0:
-        print('No series available; exiting.')
-        return
-
-    print(f'Searching Dailymotion for {total_series} series (limit {per_term_limit}/term, sleep {sleep_sec:.2f}s)')
-
-    all_hits: List[Dict] = []
-    for idx, (sid, terms) in enumerate(keywords_by_sid.items(), start=1):
-        aliases = aliases_by_sid.get(sid, [])
-        title_hint = titles_by_sid.get(sid) or (aliases[0] if aliases else sid)
-        print(f'[{idx}/{total_series}] {title_hint} -> {len(terms)} terms')
-
-        series_hits = []
-        # Primary terms get higher limit
-        primary_terms = terms[:primary_aliases] if primary_aliases > 0 else []
-        secondary_terms = terms[primary_aliases:] if primary_aliases > 0 else terms
-
-        if primary_terms:
-            series_hits.extend(search_videos(primary_terms, per_term_limit=primary_per_term_limit, sleep_sec=sleep_sec))
-        if secondary_terms:
-            series_hits.extend(search_videos(secondary_terms, per_term_limit=per_term_limit, sleep_sec=sleep_sec))
-
-        if series_hits:
-            print(f'  Retrieved {len(series_hits)} candidates')
-
-        for h in series_hits:
-            h['__series_id'] = sid
-
-        all_hits.extend(series_hits)
-
-    print(f'Collected {len(all_hits)} raw candidates')
-
-    # Deduplicate by video_id
-    dedup: Dict[str, Dict] = {}
-    for h in all_hits:
-        vid = h.get('id')
-        if not vid:
-            continue
-        key = f'dailymotion:{vid}'
-        if key not in dedup:
-            dedup[key] = h
-
-    print(f'{len(dedup)} unique candidates after dedupe')
-
-    # Score and filter FIRST (before checking database)
-    today = dt.date.today()
-    today_s = today.isoformat()
-
-    filtered_candidates = []
-    duration_filtered = 0
-    score_filtered = 0
-
-    for key, h in dedup.items():
-        title = h.get('title', '')
-        sid = h.get('__series_id')
-        aliases = aliases_by_sid.get(sid, [])
-        raw_score = compute_score(title, aliases)
-        score = _normalize_score(raw_score, score_scale)
-
-        # Apply filters
-        duration = h.get('duration', 0) or 0
-        if min_duration_sec > 0 and duration < min_duration_sec:
-            duration_filtered += 1
-            continue
-
-        if min_score > 0.0 and score < min_score:
-            score_filtered += 1
-            continue
-
-        # Passed all filters
-        filtered_candidates.append({
-            'key': key,
-            'video': h,
-            'raw_score': raw_score,
-            'score': score,
-            'sid': sid,
-            'aliases': aliases
-        })
-
-    print(f'After filtering: {len(filtered_candidates)} candidates remain')
-    if duration_filtered:
-        print(f'  - Duration < {min_duration_sec}s: {duration_filtered}')
-    if score_filtered:
-        print(f'  - Score < {min_score}: {score_filtered}')
-
+def store_detections(filtered_candidates: List[Dict], titles_by_sid: Dict[str, str], out_dir: str, today_s: str) -> Set[str]:
+    """Insert the new videos among filtered candidates and write the CSV reports. Returns keys of new videos."""
     # Now batch check existing videos (only filtered ones)
     filtered_video_ids = [c['video']['id'] for c in filtered_candidates if c['video'].get('id')]
     print(f'Checking which {len(filtered_video_ids)} videos already exist in database...')
@@ -269,6 +122,115 @@ def main():
             w.writerows(new_sorted)
         print(f'Wrote {new_csv} with {len(new_rows)} new detections')
 
+    return {f"dailymotion:{v['video_id']}" for v in videos_to_insert}
+
+
+def main():
+    data_path = os.environ.get('DATA_JSON', 'data/data.json')
+    out_dir = os.environ.get('REPORT_DIR', 'reports')
+    os.makedirs(out_dir, exist_ok=True)
+    state_dir = os.environ.get('STATE_DIR', 'state')
+
+    catalog, term_yield = load_catalog(data_path, state_dir)
+    aliases_by_sid = catalog.aliases_by_sid
+    titles_by_sid = catalog.titles_by_sid
+    keywords_by_sid = catalog.keywords_by_sid
+
+    # Optional series filter
+    raw_filter = os.environ.get('DAILYMOTION_SERIES_IDS')
+    if raw_filter:
+        series_filter = {s.strip() for s in raw_filter.split(',') if s.strip()}
+        if series_filter:
+            keywords_by_sid = {sid: terms for sid, terms in keywords_by_sid.items() if sid in series_filter}
+            aliases_by_sid = {sid: aliases for sid, aliases in aliases_by_sid.items() if sid in keywords_by_sid}
+            titles_by_sid = {sid: title for sid, title in titles_by_sid.items() if sid in keywords_by_sid}
+
+    # Sharded runs search a stable subset of series; candidates are still
+    # attributed against every series, so shards merge into one run's result
+    shard = parse_shard(os.environ.get('DAILYMOTION_SHARD'))
+    if shard is not None:
+        keywords_by_sid = {sid: terms for sid, terms in keywords_by_sid.items() if shard_of(sid, shard[1]) == shard[0]}
+        print(f'Shard {shard[0]}/{shard[1]}: {len(keywords_by_sid)} series')
+
+    score_scale = _float_env('DAILYMOTION_SCORE_SCALE', 6.0, minimum=0.1)
+    min_duration_sec = _int_env('DAILYMOTION_MIN_DURATION_SEC', 1000, minimum=0)
+    min_score = _float_env('DAILYMOTION_MIN_SCORE', 5.5, minimum=0.0)
+
+    if not keywords_by_sid:
+        print('No series available; exiting.')
+        if shard is not None:
+            # An empty shard file still tells the merge step this shard finished
+            write_shard([], out_dir, dt.date.today().isoformat(), shard)
+        return
+
+    phase = SearchPhase(
+        catalog, keywords_by_sid, aliases_by_sid, titles_by_sid,
+        state_dir=state_dir,
+        out_dir=out_dir,
+        term_yield=term_yield,
+        per_term_limit=_int_env('DAILYMOTION_PER_TERM_LIMIT', 300),
+        sleep_sec=_float_env('DAILYMOTION_SLEEP_SEC', 0.2),
+        score_scale=score_scale,
+        min_score=min_score,
+        shard=shard,
+    )
+    dedup = dedupe_hits(phase.search())
+    print(f'{len(dedup)} unique candidates after dedupe')
+
+    # Score and filter FIRST (before checking database)
+    today = dt.date.today()
+    today_s = today.isoformat()
+
+    filtered_candidates = []
+    duration_filtered = 0
+    score_filtered = 0
+
+    attributed = phase.attribute(dedup)
+    for (key, h), (sid, raw_score) in zip(dedup.items(), attributed):
+        aliases = aliases_by_sid.get(sid, [])
+        score = _normalize_score(raw_score, score_scale)
+
+        # Apply filters
+        duration = h.get('duration', 0) or 0
+        if min_duration_sec > 0 and duration < min_duration_sec:
+            duration_filtered += 1
+            continue
+
+        if min_score > 0.0 and score < min_score:
+            score_filtered += 1
+            continue
+
+        # Passed all filters
+        filtered_candidates.append({
+            'key': key,
+            'video': h,
+            'raw_score': raw_score,
+            'score': score,
+            'sid': sid,
+            'aliases': aliases
+        })
+
+    print(f'After filtering: {len(filtered_candidates)} candidates remain')
+    if duration_filtered:
+        print(f'  - Duration < {min_duration_sec}s: {duration_filtered}')
+    if score_filtered:
+        print(f'  - Score < {min_score}: {score_filtered}')
+
+    if shard is not None:
+        # Shards only report their candidates; merge_shards_db inserts and writes the CSVs
+        path = write_shard(filtered_candidates, out_dir, today_s, shard)
+        print(f'Wrote {path} with {len(filtered_candidates)} candidates (shard {shard[0]}/{shard[1]})')
+        existing_ids = get_existing_video_ids([c['video']['id'] for c in filtered_candidates], platform='dailymotion')
+        new_keys = {c['key'] for c in filtered_candidates if c['video']['id'] not in existing_ids}
+    else:
+        new_keys = store_detections(filtered_candidates, titles_by_sid, out_dir, today_s)
+
+    phase.finish(today_s, {c['key'] for c in filtered_candidates}, new_keys)
+
 
 if __name__ == '__main__':
-    main()
+    try:
+        main()
+    finally:
+        print(format_request_stats())
+        print(format_scoring_stats())
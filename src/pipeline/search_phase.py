@@ -0,0 +1,414 @@
+"""
+Search phase shared by run_dailymotion and run_dailymotion_db.
+
+Both pipelines compile the search plan, plan and schedule the queries,
+search series by series (checkpointed, so a crashed run resumes), dedupe
+the hits and attribute every candidate to a series. What they do with the
+attributed candidates (state JSON vs Supabase) stays in the pipelines.
+"""
+from __future__ import annotations
+import datetime as dt
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.keywords.compiled import CompiledSearchPlan, load_search_plan
+from src.keywords.planner import build_query_plan, query_key
+from src.keywords.scheduler import budget_from_deadline, format_schedule, save_schedule, schedule_query_plan
+from src.keywords.term_yield import TermYieldLedger, open_term_yield
+from src.matching.index import AliasNgramIndex
+from src.matching.parallel import score_candidates
+from src.matching.score import best_series_scores
+from src.matching.score_cache import open_score_cache
+from src.platforms.dailymotion import get_rate_limiter, search_videos, submit_search
+from src.platforms.watermarks import WatermarkStore
+from src.pipeline.checkpoint import open_search_checkpoint
+from src.pipeline.shards import Shard, shard_state_name
+
+
+def _int_env(name: str, default: int, minimum: int = 1) -> int:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+        return value if value >= minimum else minimum
+    except ValueError:
+        return default
+
+
+def _float_env(name: str, default: float, minimum: float = 0.0) -> float:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        value = float(raw)
+        return value if value >= minimum else default
+    except ValueError:
+        return default
+
+
+def _bool_env(name: str, default: bool = False) -> bool:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    return raw.strip().lower() in {"1", "true", "yes", "y"}
+
+
+def _normalize_score(raw: float, scale: float) -> float:
+    score = raw * scale
+    return max(0.0, min(10.0, score))
+
+
+def load_catalog(data_path: str, state_dir: str) -> Tuple[CompiledSearchPlan, Optional[TermYieldLedger]]:
+    """
+    Open the term-yield ledger and load the search plan with the run's settings.
+
+    Terms without new detections in the last DAILYMOTION_TERM_PRUNE_RUNS runs
+    are demoted (or skipped, until their last run is
+    DAILYMOTION_TERM_PRUNE_RETRY_DAYS old and they get another chance).
+    Returns the compiled plan and the ledger (None when DAILYMOTION_TERM_YIELD
+    is off); the caller closes the ledger.
+    """
+    term_yield = open_term_yield(state_dir, _bool_env('DAILYMOTION_TERM_YIELD', True))
+    term_prune_runs = _int_env('DAILYMOTION_TERM_PRUNE_RUNS', 0, minimum=0)
+    term_prune_mode = 'skip' if os.environ.get('DAILYMOTION_TERM_PRUNE_MODE', 'demote').strip().lower() == 'skip' else 'demote'
+    term_retry_days = _int_env('DAILYMOTION_TERM_PRUNE_RETRY_DAYS', 14)
+    low_yield_terms = set()
+    if term_yield is not None:
+        retry_since = dt.date.today() - dt.timedelta(days=term_retry_days)
+        low_yield_terms = term_yield.zero_yield_terms(term_prune_runs, since=retry_since.isoformat())
+    if low_yield_terms:
+        action = 'Skipping' if term_prune_mode == 'skip' else 'Demoting'
+        print(f'{action} {len(low_yield_terms)} terms without new detections in their last {term_prune_runs} runs')
+
+    # Terms, aliases and their match forms are compiled once per catalog + settings
+    catalog, plan_cached = load_search_plan(
+        data_path,
+        state_dir,
+        include_ep_patterns=_bool_env('DAILYMOTION_INCLUDE_EP_PATTERNS', False),
+        max_aliases=_int_env('DAILYMOTION_MAX_ALIASES', 10),
+        min_alias_length=_int_env('DAILYMOTION_MIN_ALIAS_LENGTH', 6, minimum=0),
+        low_yield_terms=low_yield_terms,
+        low_yield_mode=term_prune_mode,
+        enabled=_bool_env('DAILYMOTION_PLAN_CACHE', True),
+    )
+    print(f'Search plan {catalog.key[:12]} ({"cached" if plan_cached else "compiled"}): {len(catalog.keywords_by_sid)} series')
+    return catalog, term_yield
+
+
+def dedupe_hits(all_hits: List[Dict]) -> Dict[str, Dict]:
+    """Collapse hits on `dailymotion:{id}`; a video found via several series' terms stays a candidate for all of them."""
+    dedup: Dict[str, Dict] = {}
+    for h in all_hits:
+        vid = h.get('id')
+        if not vid:
+            continue
+        key = f'dailymotion:{vid}'
+        if key not in dedup:
+            dedup[key] = h
+        else:
+            merged = dedup[key].setdefault('__series_ids', [])
+            for other in h.get('__series_ids', []):
+                if other not in merged:
+                    merged.append(other)
+    return dedup
+
+
+class SearchPhase:
+    """
+    Query planning, scheduling, searching and attribution for one run.
+
+    Settings come from the DAILYMOTION_* environment like the rest of the
+    pipeline; the ones whose defaults differ between the pipelines
+    (per-term limit, sleep, score threshold) are passed in.
+
+    Args:
+        catalog: Compiled search plan (see load_catalog)
+        keywords_by_sid: Search terms of the series this run searches
+        aliases_by_sid: Aliases of the series candidates are attributed to
+        titles_by_sid: Canonical titles (for progress output)
+        state_dir: STATE_DIR (watermarks, checkpoint, score cache)
+        out_dir: REPORT_DIR (search schedule)
+        term_yield: Ledger feeding the scheduler and recording this run, or None
+        shard: (i, n) when this runner searches one shard; its checkpoint,
+            watermarks and schedule get per-shard file names
+    """
+
+    def __init__(
+        self,
+        catalog: CompiledSearchPlan,
+        keywords_by_sid: Dict[str, List[str]],
+        aliases_by_sid: Dict[str, List[str]],
+        titles_by_sid: Dict[str, str],
+        *,
+        state_dir: str,
+        out_dir: str,
+        term_yield: Optional[TermYieldLedger],
+        per_term_limit: int,
+        sleep_sec: float,
+        score_scale: float,
+        min_score: float,
+        shard: Optional[Shard] = None,
+    ):
+        self.catalog = catalog
+        self.keywords_by_sid = keywords_by_sid
+        self.aliases_by_sid = aliases_by_sid
+        self.titles_by_sid = titles_by_sid
+        self.state_dir = state_dir
+        self.out_dir = out_dir
+        self.term_yield = term_yield
+        self.per_term_limit = per_term_limit
+        self.sleep_sec = sleep_sec
+        self.score_scale = score_scale
+        self.min_score = min_score
+        self.shard = shard
+
+        self.primary_aliases = _int_env('DAILYMOTION_PRIMARY_ALIASES', 2, minimum=0)
+        self.primary_per_term_limit = _int_env('DAILYMOTION_PRIMARY_PER_TERM_LIMIT', max(per_term_limit, 1), minimum=1)
+        self.concurrent_search = _bool_env('DAILYMOTION_CONCURRENT_SEARCH', False)
+        self.search_concurrency = _int_env('DAILYMOTION_SEARCH_CONCURRENCY', 4)
+        self.requests_per_sec = _float_env('DAILYMOTION_REQUESTS_PER_SEC', 5.0, minimum=0.1)
+
+        # Incremental mode: only fetch uploads newer than each term's watermark,
+        # with a periodic full relevance sweep to catch anything missed
+        self.watermarks: Optional[WatermarkStore] = None
+        self.full_sweep = True
+        self.watermark_overlap_sec = _int_env('DAILYMOTION_WATERMARK_OVERLAP_SEC', 21600, minimum=0)
+        if _bool_env('DAILYMOTION_INCREMENTAL', False):
+            self.watermarks = WatermarkStore(os.path.join(state_dir, shard_state_name('dailymotion_watermarks.json', shard)))
+            self.full_sweep = self.watermarks.needs_full_sweep(dt.date.today(), _int_env('DAILYMOTION_FULL_SWEEP_DAYS', 7))
+
+        # Stop paging a term once a page has fewer than N titles passing the score filter (0 = off)
+        self.early_stop_min_yield = _int_env('DAILYMOTION_EARLY_STOP_MIN_YIELD', 0, minimum=0)
+        self.prefetch_pages = _bool_env('DAILYMOTION_PREFETCH_PAGES', False)
+
+        self.plan = None
+        self.matchers = None
+        self.checkpoint = None
+        self.all_hits: List[Dict] = []
+        # term -> how its paging ended ('complete', 'limit', 'early_stop', 'failed')
+        self.outcomes: Dict[str, str] = {}
+
+    def _schedule(self) -> None:
+        # With a request budget (or a deadline), page depth follows each series'
+        # recent new-detection rate and freshness instead of the fixed limits
+        request_budget = _int_env('DAILYMOTION_REQUEST_BUDGET', 0, minimum=0)
+        deadline_sec = _float_env('DAILYMOTION_DEADLINE_SEC', 0.0)
+        if deadline_sec > 0:
+            if self.concurrent_search:
+                pages_per_sec = self.requests_per_sec
+            else:
+                pages_per_sec = 1.0 / (self.sleep_sec + _float_env('DAILYMOTION_SCHEDULE_PAGE_SEC', 0.5, minimum=0.01))
+            deadline_budget = budget_from_deadline(deadline_sec, pages_per_sec)
+            request_budget = min(request_budget, deadline_budget) if request_budget else deadline_budget
+        if request_budget <= 0:
+            return
+        history_runs = _int_env('DAILYMOTION_SCHEDULE_HISTORY_RUNS', 7)
+        schedule = schedule_query_plan(
+            self.plan,
+            self.keywords_by_sid,
+            budget_pages=request_budget,
+            min_pages_per_series=_int_env('DAILYMOTION_SCHEDULE_MIN_PAGES', 2, minimum=0),
+            max_term_limit=_int_env('DAILYMOTION_SCHEDULE_MAX_TERM_LIMIT', 1000, minimum=100),
+            history=self.term_yield.history(history_runs) if self.term_yield is not None else {},
+        )
+        print(format_schedule(schedule, self.titles_by_sid))
+        save_schedule(schedule, os.path.join(self.out_dir, shard_state_name(f'search_schedule_{dt.date.today().isoformat()}.json', self.shard)))
+
+    def page_filter(self, term: str, items: List[Dict]) -> int:
+        # Count titles on this page that would pass the score filter for any interested series
+        sids = self.plan.interested.get(query_key(term), [])
+        scored = best_series_scores([(item.get('title', ''), sids) for item in items], self.matchers)
+        return sum(1 for _, raw in scored if _normalize_score(raw, self.score_scale) >= self.min_score)
+
+    def _created_after(self, terms: List[str]) -> Optional[Dict[str, int]]:
+        if self.watermarks is None or self.full_sweep:
+            return None
+        return self.watermarks.created_after(terms, self.watermark_overlap_sec)
+
+    def run_search(self, terms: List[str], limit: int, outcomes: Dict[str, str]) -> List[Dict]:
+        return search_videos(
+            terms, per_term_limit=limit, sleep_sec=self.sleep_sec, created_after=self._created_after(terms),
+            page_filter=self.page_filter if self.early_stop_min_yield > 0 else None,
+            min_page_yield=self.early_stop_min_yield, prefetch=self.prefetch_pages, outcomes=outcomes,
+        )
+
+    def submit_series(self, pool: ThreadPoolExecutor, sid: str) -> List[Tuple[str, Future]]:
+        """Queue every term group of a series on the shared pool (concurrent mode), as (term, future)."""
+        futures: List[Tuple[str, Future]] = []
+        # Primary terms get higher limit (the plan keeps the limit per term)
+        for limit, group in self.plan.groups(sid):
+            futures.extend(zip(group, submit_search(
+                pool, group, limit, self._created_after(group),
+                self.page_filter if self.early_stop_min_yield > 0 else None,
+                self.early_stop_min_yield, self.prefetch_pages,
+            )))
+        return futures
+
+    def _observe(self, hits: List[Dict], outcomes: Dict[str, str]) -> None:
+        # Terms that did not page to the end keep their watermark (see WatermarkStore.observe)
+        self.outcomes.update(outcomes)
+        if self.watermarks is not None:
+            truncated = {h.get('__source_term') for h in hits if outcomes.get(h.get('__source_term')) != 'complete'}
+            self.watermarks.observe(hits, truncated)
+
+    def search(self) -> List[Dict]:
+        """Search every series (restoring those a checkpoint already holds). Returns the raw hits."""
+        total_series = len(self.keywords_by_sid)
+        if self.concurrent_search:
+            pacing = f'concurrent x{self.search_concurrency} at {self.requests_per_sec:.1f} req/s'
+        else:
+            pacing = f'sleep {self.sleep_sec:.2f}s'
+        if self.watermarks is not None:
+            pacing += ', full sweep' if self.full_sweep else ', incremental since last run'
+        print(
+            f'Searching Dailymotion for {total_series} series (primary limit {self.primary_per_term_limit} '
+            f'for first {self.primary_aliases} aliases, default limit {self.per_term_limit} per term, {pacing})'
+        )
+
+        # Identical normalized terms across series are queried once and fanned out
+        self.plan = build_query_plan(
+            self.keywords_by_sid,
+            primary_aliases=self.primary_aliases,
+            primary_per_term_limit=self.primary_per_term_limit,
+            per_term_limit=self.per_term_limit,
+        )
+        self._schedule()
+
+        # Aliases are normalized once per run, not once per scored candidate
+        self.matchers = self.catalog.matchers(self.aliases_by_sid)
+
+        # Completed series are checkpointed; a rerun on the same day with the same
+        # plan restores them instead of searching again
+        self.checkpoint = open_search_checkpoint(
+            self.state_dir,
+            dt.date.today().isoformat(),
+            f'{self.catalog.key}:{self.plan.fingerprint()}',
+            _bool_env('DAILYMOTION_CHECKPOINT', True),
+            self.shard,
+        )
+        checkpoint = self.checkpoint
+        if checkpoint is not None and checkpoint.completed:
+            print(f'Resuming search: {len(checkpoint.completed)}/{total_series} series restored from {checkpoint.path}')
+
+        # Concurrent mode queues every series' terms on one pool up front, so
+        # workers never sit idle between term groups or series; results are
+        # still collected (and checkpointed) series by series, in order
+        pool: Optional[ThreadPoolExecutor] = None
+        pending: Dict[str, List[Tuple[str, Future]]] = {}
+        if self.concurrent_search:
+            # _http_get() takes a token from the shared limiter before every request
+            get_rate_limiter(self.requests_per_sec)
+            pool = ThreadPoolExecutor(max_workers=self.search_concurrency, thread_name_prefix='dm-search')
+            for sid in self.keywords_by_sid:
+                if checkpoint is None or sid not in checkpoint.completed:
+                    pending[sid] = self.submit_series(pool, sid)
+        try:
+            self._search_series(pending)
+        finally:
+            if pool is not None:
+                pool.shutdown(cancel_futures=True)
+
+        print(f'Collected {len(self.all_hits)} raw candidates')
+        if self.plan.duplicates:
+            print(f'Query planner skipped {len(self.plan.duplicates)} duplicate term queries (~{self.plan.saved_calls()} API calls saved)')
+
+        if self.watermarks is not None:
+            if self.full_sweep:
+                self.watermarks.mark_full_sweep(dt.date.today())
+            self.watermarks.save()
+        return self.all_hits
+
+    def _search_series(self, pending: Dict[str, List[Tuple[str, Future]]]) -> None:
+        checkpoint = self.checkpoint
+        total_series = len(self.keywords_by_sid)
+        for idx, (sid, terms) in enumerate(self.keywords_by_sid.items(), start=1):
+            aliases = self.aliases_by_sid.get(sid, [])
+            title_hint = self.titles_by_sid.get(sid) or (aliases[0] if aliases else sid)
+            shared = self.plan.shared_terms(sid)
+            shared_note = f' ({shared} shared with other series)' if shared else ''
+            print(f'[{idx}/{total_series}] {title_hint} -> {len(terms)} terms{shared_note}')
+
+            if checkpoint is not None and sid in checkpoint.completed:
+                series_hits = checkpoint.completed[sid]
+                self._observe(series_hits, checkpoint.outcomes)
+                print(f'  Restored {len(series_hits)} candidates from checkpoint')
+            else:
+                series_hits = []
+                outcomes: Dict[str, str] = {}
+                if sid in pending:
+                    for term, future in pending.pop(sid):
+                        hits, outcomes[term] = future.result()
+                        series_hits.extend(hits)
+                else:
+                    # Primary terms get higher limit (the plan keeps the limit per term)
+                    for limit, group in self.plan.groups(sid):
+                        series_hits.extend(self.run_search(group, limit, outcomes))
+                self._observe(series_hits, outcomes)
+                if checkpoint is not None:
+                    checkpoint.append(sid, series_hits, outcomes)
+                if series_hits:
+                    print(f'  Retrieved {len(series_hits)} candidates')
+
+            self.plan.fan_out(series_hits)
+            for h in series_hits:
+                h['__series_id'] = sid
+            self.all_hits.extend(series_hits)
+
+    def attribute(self, dedup: Dict[str, Dict]) -> List[Tuple[str, float]]:
+        """
+        (series_id, raw score) for each deduped candidate, in order.
+
+        Each candidate goes to whichever series matches its title best: the
+        series whose terms found it, plus any the alias n-gram index shortlists
+        (reuploads often surface under another series' term). Candidates of a
+        series are scored in one batch.
+        """
+        # Also score each candidate against the top-k series whose aliases it resembles (0 = off)
+        attribution_top_k = _int_env('DAILYMOTION_ATTRIBUTION_TOP_K', 3, minimum=0)
+        index = AliasNgramIndex(self.matchers) if attribution_top_k > 0 else None
+        to_score = []
+        for h in dedup.values():
+            title = h.get('title', '')
+            sids = list(h.get('__series_ids') or [h.get('__series_id')])
+            if index is not None:
+                sids += [s for s in index.shortlist(title, attribution_top_k) if s not in sids]
+            to_score.append((title, sids))
+
+        # Reuse raw scores of (title, series) pairs already scored in earlier runs
+        score_cache = open_score_cache(
+            self.state_dir,
+            _bool_env('DAILYMOTION_SCORE_CACHE', True),
+            _int_env('DAILYMOTION_SCORE_CACHE_MAX_ROWS', 200000),
+        )
+        # Score on a process pool once there are enough candidates (0/1 = in-process)
+        attributed = score_candidates(
+            to_score, self.aliases_by_sid, matchers=self.matchers,
+            workers=_int_env('DAILYMOTION_SCORING_WORKERS', 0, minimum=0),
+            min_parallel=_int_env('DAILYMOTION_SCORING_PARALLEL_MIN', 2000, minimum=0),
+            cache=score_cache,
+        )
+        if score_cache is not None:
+            print(score_cache.summary())
+            score_cache.close()
+        reattributed = sum(
+            1 for h, (sid, _) in zip(dedup.values(), attributed)
+            if sid not in (h.get('__series_ids') or [h.get('__series_id')])
+        )
+        if reattributed:
+            print(f'{reattributed} candidates attributed to a series other than the one that found them')
+        return attributed
+
+    def finish(self, run_date: str, passing_keys: Set[str], new_keys: Set[str]) -> None:
+        """Record this run's term yield and drop the checkpoint once the results are stored."""
+        if self.term_yield is not None:
+            # Failed queries say nothing about a term's yield; leave them out of the ledger
+            queried = [
+                term for terms in self.plan.series_terms.values() for term, _ in terms
+                if self.outcomes.get(term, 'failed') != 'failed'
+            ]
+            self.term_yield.record_run(run_date, queried, self.all_hits, passing_keys, new_keys)
+            self.term_yield.close()
+        if self.checkpoint is not None:
+            self.checkpoint.clear()
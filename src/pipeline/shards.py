@@ -0,0 +1,82 @@
+from __future__ import annotations
+import glob
+import hashlib
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+Shard = Tuple[int, int]
+
+
+def parse_shard(raw: Optional[str]) -> Optional[Shard]:
+    """Parse DAILYMOTION_SHARD="i/n" (1 <= i <= n) into (i, n); None when unset."""
+    if not raw or not raw.strip():
+        return None
+    try:
+        index, count = (int(part) for part in raw.strip().split('/'))
+    except ValueError:
+        raise ValueError(f'DAILYMOTION_SHARD must look like i/n, got {raw!r}')
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f'DAILYMOTION_SHARD index must be within 1..n, got {raw!r}')
+    return index, count
+
+
+def shard_of(series_id: str, count: int) -> int:
+    """Shard (1..count) a series belongs to; stable across runs, machines and catalog order."""
+    digest = hashlib.sha1(series_id.encode('utf-8')).hexdigest()
+    return int(digest[:15], 16) % count + 1
+
+
+def shard_state_name(name: str, shard: Optional[Shard]) -> str:
+    """Per-shard name of a state file: 'x.json' -> 'x_{i}of{n}.json' (unchanged when not sharded).
+
+    Shards sharing a STATE_DIR would otherwise clear each other's checkpoint
+    and overwrite each other's watermarks.
+    """
+    if shard is None:
+        return name
+    stem, ext = os.path.splitext(name)
+    return f'{stem}_{shard[0]}of{shard[1]}{ext}'
+
+
+def shard_path(out_dir: str, today_s: str, shard: Shard) -> str:
+    index, count = shard
+    return os.path.join(out_dir, f'dailymotion_shard_{index}of{count}_{today_s}.jsonl')
+
+
+def write_shard(candidates: Iterable[Dict], out_dir: str, today_s: str, shard: Shard) -> str:
+    """Write one shard's filtered candidates (key, video, scores, series) as JSONL. Returns the path."""
+    path = shard_path(out_dir, today_s, shard)
+    tmp = f'{path}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        for c in candidates:
+            record = {k: c[k] for k in ('key', 'video', 'raw_score', 'score', 'sid')}
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+    os.replace(tmp, path)
+    return path
+
+
+def find_shards(out_dir: str, today_s: str) -> List[str]:
+    return sorted(glob.glob(os.path.join(out_dir, f'dailymotion_shard_*of*_{today_s}.jsonl')))
+
+
+def merge_shards(paths: Iterable[str]) -> List[Dict]:
+    """
+    Dedupe shard candidates on `dailymotion:{id}`.
+
+    A video found by several shards keeps its best-scoring attribution (ties
+    go to the lower series_id), so the result does not depend on the order
+    shards finished or are listed in.
+    """
+    best: Dict[str, Dict] = {}
+    for path in sorted(paths):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                c = json.loads(line)
+                prev = best.get(c['key'])
+                if prev is None or (c['score'], prev['sid'] or '') > (prev['score'], c['sid'] or ''):
+                    best[c['key']] = c
+    return [best[key] for key in sorted(best)]
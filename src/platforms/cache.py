@@ -0,0 +1,137 @@
+from __future__ import annotations
+import hashlib
+import json
+import os
+import threading
+import time
+import urllib.parse
+from typing import Dict, Optional
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form of a URL for cache keys (lowercase host, sorted query params)."""
+    parts = urllib.parse.urlsplit(url)
+    query = urllib.parse.urlencode(sorted(urllib.parse.parse_qsl(parts.query, keep_blank_values=True)))
+    return urllib.parse.urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ''))
+
+
+class ResponseCache:
+    """
+    Content-addressed on-disk cache of decoded JSON responses.
+
+    Each entry is stored as `<sha256 of normalized URL>.json`. Entries older
+    than `ttl_sec` are ignored (and removed). The file mtime doubles as the
+    LRU clock: hits touch the file, and when the directory grows past
+    `max_bytes` the least recently used entries are deleted first.
+
+    Args:
+        directory: Cache directory (created if missing)
+        ttl_sec: Entry lifetime in seconds
+        max_bytes: Size bound for all entries together
+        refresh: Ignore existing entries but still store fresh responses
+    """
+
+    def __init__(self, directory: str, ttl_sec: float, max_bytes: int, refresh: bool = False):
+        self.directory = directory
+        self.ttl_sec = ttl_sec
+        self.max_bytes = max_bytes
+        self.refresh = refresh
+        self._lock = threading.Lock()
+        self._sizes: Optional[Dict[str, int]] = None
+        self._total = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, url: str) -> str:
+        key = hashlib.sha256(normalize_url(url).encode('utf-8')).hexdigest()
+        return os.path.join(self.directory, f'{key}.json')
+
+    def _load_sizes(self) -> None:
+        # Called with the lock held; scans the directory once per process
+        if self._sizes is not None:
+            return
+        self._sizes = {}
+        self._total = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            try:
+                size = os.path.getsize(os.path.join(self.directory, name))
+            except OSError:
+                continue
+            self._sizes[name] = size
+            self._total += size
+
+    def get(self, url: str) -> Optional[Dict]:
+        if self.refresh:
+            return None
+        path = self._path(url)
+        try:
+            age = time.time() - os.path.getmtime(path)
+        except OSError:
+            return None
+        if age > self.ttl_sec:
+            self._remove(path)
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            self._remove(path)
+            return None
+        if time.time() - payload.get('stored_at', 0) > self.ttl_sec:
+            self._remove(path)
+            return None
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        return payload.get('data')
+
+    def put(self, url: str, data: Dict) -> None:
+        path = self._path(url)
+        body = json.dumps(
+            {'url': normalize_url(url), 'stored_at': time.time(), 'data': data},
+            ensure_ascii=False,
+        ).encode('utf-8')
+        if len(body) > self.max_bytes:
+            return
+        tmp = f'{path}.{threading.get_ident()}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(body)
+        os.replace(tmp, path)
+        name = os.path.basename(path)
+        with self._lock:
+            self._load_sizes()
+            self._total += len(body) - self._sizes.get(name, 0)
+            self._sizes[name] = len(body)
+            if self._total > self.max_bytes:
+                self._evict()
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        name = os.path.basename(path)
+        with self._lock:
+            if self._sizes is not None and name in self._sizes:
+                self._total -= self._sizes.pop(name)
+
+    def _evict(self) -> None:
+        # Called with the lock held; drop least recently used entries down to 90% of the bound
+        target = int(self.max_bytes * 0.9)
+        entries = []
+        for name in self._sizes:
+            try:
+                entries.append((os.path.getmtime(os.path.join(self.directory, name)), name))
+            except OSError:
+                entries.append((0.0, name))
+        entries.sort()
+        for _, name in entries:
+            if self._total <= target:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+            self._total -= self._sizes.pop(name)
@@ -1,22 +1,216 @@
 from __future__ import annotations
 import os
+import threading
 import time
-from typing import Dict, Iterable, List, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 import json
+import urllib.error
 import urllib.parse
-import urllib.request
 
+from src.platforms.cache import ResponseCache
+from src.platforms.http_session import get_session
+from src.platforms.ratelimit import AdaptiveRateLimiter, RetryPolicy, parse_retry_after
 
-DAILYMOTION_API = "https://api.dailymotion.com/videos"
 
+# Override DAILYMOTION_API_BASE to point the client at a local stand-in (see src/bench/dailymotion_standin.py)
+DAILYMOTION_API_BASE = os.environ.get('DAILYMOTION_API_BASE', 'https://api.dailymotion.com').rstrip('/')
+DAILYMOTION_API = f"{DAILYMOTION_API_BASE}/videos"
 
-def _http_get(url: str, timeout: int = 15) -> Dict:
-    req = urllib.request.Request(url, headers={
-        'User-Agent': 'col-piracy/0.1 (+internal)'
-    })
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        return json.loads(resp.read().decode('utf-8'))
+# 5xx and 429 are transient; everything else (404, 403, ...) is a real answer
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+# Answers callers classify (removed, private, forbidden) rather than failures
+_EXPECTED_STATUS = {401, 403, 404}
+
+_RATE_LIMITER: Optional[AdaptiveRateLimiter] = None
+_RATE_LIMITER_LOCK = threading.Lock()
+_RETRY_POLICY: Optional[RetryPolicy] = None
+
+_RESPONSE_CACHE: Optional[ResponseCache] = None
+_RESPONSE_CACHE_LOADED = False
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+# page_filter(term, items) -> number of items that would pass scoring
+PageFilter = Callable[[str, List[Dict]], int]
+
+_STATS_LOCK = threading.Lock()
+_REQUEST_STATS: Dict[str, Dict[str, int]] = {}
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _env_bool(name: str, default: bool = False) -> bool:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    return raw.strip().lower() in {"1", "true", "yes", "y"}
+
+
+def get_rate_limiter(requests_per_sec: Optional[float] = None) -> AdaptiveRateLimiter:
+    """
+    Return the process-wide limiter shared by every Dailymotion call.
+
+    The initial rate comes from DAILYMOTION_REQUESTS_PER_SEC (default 5.0);
+    passing `requests_per_sec` reconfigures the ceiling.
+    """
+    global _RATE_LIMITER
+    with _RATE_LIMITER_LOCK:
+        if _RATE_LIMITER is None:
+            rate = requests_per_sec or _env_float('DAILYMOTION_REQUESTS_PER_SEC', 5.0)
+            _RATE_LIMITER = AdaptiveRateLimiter(rate)
+        elif requests_per_sec is not None and _RATE_LIMITER.max_rate != requests_per_sec:
+            _RATE_LIMITER.set_rate(requests_per_sec)
+        return _RATE_LIMITER
+
+
+def _retry_policy() -> RetryPolicy:
+    global _RETRY_POLICY
+    if _RETRY_POLICY is None:
+        try:
+            max_retries = int(os.environ.get('DAILYMOTION_MAX_RETRIES', '4'))
+        except ValueError:
+            max_retries = 4
+        _RETRY_POLICY = RetryPolicy(
+            max_retries=max_retries,
+            base_delay=_env_float('DAILYMOTION_RETRY_BASE_SEC', 1.0),
+            max_delay=_env_float('DAILYMOTION_RETRY_MAX_SEC', 60.0),
+        )
+    return _RETRY_POLICY
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Return the on-disk search page cache, or None when it is disabled.
+
+    Enabled with DAILYMOTION_CACHE=true; entries live under
+    STATE_DIR/http_cache/dailymotion. DAILYMOTION_CACHE_REFRESH=true skips
+    reading cached pages but still stores the fresh responses.
+    """
+    global _RESPONSE_CACHE, _RESPONSE_CACHE_LOADED
+    with _RESPONSE_CACHE_LOCK:
+        if not _RESPONSE_CACHE_LOADED:
+            _RESPONSE_CACHE_LOADED = True
+            if _env_bool('DAILYMOTION_CACHE', False):
+                _RESPONSE_CACHE = ResponseCache(
+                    os.path.join(os.environ.get('STATE_DIR', 'state'), 'http_cache', 'dailymotion'),
+                    ttl_sec=_env_float('DAILYMOTION_CACHE_TTL_SEC', 43200.0),
+                    max_bytes=int(_env_float('DAILYMOTION_CACHE_MAX_MB', 200.0) * 1024 * 1024),
+                    refresh=_env_bool('DAILYMOTION_CACHE_REFRESH', False),
+                )
+        return _RESPONSE_CACHE
+
+
+def _count(endpoint: str, name: str, n: int = 1) -> None:
+    with _STATS_LOCK:
+        counters = _REQUEST_STATS.setdefault(
+            endpoint,
+            {'requests': 0, 'retries': 0, 'throttled': 0, 'failed': 0, 'cache_hits': 0,
+             'early_stops': 0, 'pages_saved': 0, 'prefetch_wasted': 0},
+        )
+        counters[name] = counters.get(name, 0) + n
+
+
+def get_request_stats() -> Dict[str, Dict[str, int]]:
+    """Per-endpoint counters (requests, retries, throttled, failed, cache hits, early stops) for this process."""
+    with _STATS_LOCK:
+        return {endpoint: dict(counters) for endpoint, counters in _REQUEST_STATS.items()}
+
+
+def format_request_stats() -> str:
+    """Human-readable summary of get_request_stats() for end-of-run logs."""
+    stats = get_request_stats()
+    if not stats:
+        return 'Dailymotion API: no requests made'
+    lines = ['Dailymotion API requests:']
+    for endpoint in sorted(stats):
+        c = stats[endpoint]
+        line = (
+            f"  {endpoint}: {c['requests']} requests, {c['retries']} retries, "
+            f"{c['throttled']} throttled (429), {c['failed']} failed"
+        )
+        if c.get('cache_hits'):
+            line += f", {c['cache_hits']} served from cache"
+        if c.get('early_stops'):
+            line += f", {c['early_stops']} low-yield terms stopped early (~{c['pages_saved']} pages saved)"
+        if c.get('prefetch_wasted'):
+            line += f", {c['prefetch_wasted']} prefetched pages discarded"
+        lines.append(line)
+    limiter = _RATE_LIMITER
+    if limiter is not None:
+        lines.append(f'  final rate: {limiter.rate:.2f}/{limiter.max_rate:.2f} req/s')
+    return '\n'.join(lines)
+
+
+def _http_get(
+    url: str,
+    timeout: int = 15,
+    endpoint: str = 'other',
+    cacheable: bool = False,
+    before_request: Optional[Callable[[], None]] = None,
+) -> Dict:
+    """
+    GET a Dailymotion URL and decode JSON, with shared pacing and retries.
+
+    Every attempt takes a token from the shared adaptive limiter. 429 and 5xx
+    responses and connection errors are retried with exponential backoff and
+    jitter (honoring Retry-After); a 429 also slows the limiter down for all
+    callers. Other HTTP errors are raised immediately. 401/403/404 are raised
+    for the caller to classify and are not counted as failed requests.
+
+    With `cacheable=True` and the response cache enabled, a fresh cached
+    response is returned without touching the network or the rate limiter.
+    `before_request` is called once before going to the network (callers use
+    it for their own pacing, which a cache hit then skips as well).
+    """
+    cache = get_response_cache() if cacheable else None
+    if cache is not None:
+        cached = cache.get(url)
+        if cached is not None:
+            _count(endpoint, 'cache_hits')
+            return cached
+
+    if before_request is not None:
+        before_request()
+    limiter = get_rate_limiter()
+    policy = _retry_policy()
+    attempt = 0
+    while True:
+        limiter.acquire()
+        _count(endpoint, 'requests')
+        retry_after: Optional[float] = None
+        try:
+            # Pooled keep-alive session shared by search, status and geo calls
+            _, _, body = get_session().get(url, timeout=timeout)
+            data = json.loads(body.decode('utf-8'))
+        except urllib.error.HTTPError as e:
+            if e.code in _EXPECTED_STATUS:
+                raise
+            if e.code not in _RETRYABLE_STATUS or attempt >= policy.max_retries:
+                _count(endpoint, 'failed')
+                raise
+            retry_after = parse_retry_after(e.headers.get('Retry-After') if e.headers else None)
+            if e.code == 429:
+                _count(endpoint, 'throttled')
+                limiter.on_throttle(retry_after)
+        except (urllib.error.URLError, TimeoutError, ConnectionError):
+            if attempt >= policy.max_retries:
+                _count(endpoint, 'failed')
+                raise
+        else:
+            limiter.on_success()
+            if cache is not None:
+                cache.put(url, data)
+            return data
+
+        _count(endpoint, 'retries')
+        time.sleep(policy.delay(attempt, retry_after))
+        attempt += 1
 
 
 def parse_geoblocking(geoblocking: List) -> tuple:
@@ -72,10 +266,10 @@ def check_video_geo_availability(video_id: str, regions: List[str], sleep_sec: f
             'fields': 'id',
             'ams_country': region,
         })
-        url = f"https://api.dailymotion.com/video/{video_id}?{q}"
+        url = f"{DAILYMOTION_API_BASE}/video/{video_id}?{q}"
 
         try:
-            _http_get(url)
+            _http_get(url, endpoint='geo')
             availability[region] = True
         except urllib.error.HTTPError as e:
             if e.code in (403, 451):
@@ -97,6 +291,44 @@ def check_video_geo_availability(video_id: str, regions: List[str], sleep_sec: f
     return availability
 
 
+STATUS_FIELDS = [
+    'id', 'private', 'password_protected', 'status', 'published',
+    'geoblocking', 'views_total', 'updated_time', 'duration'
+]
+
+# Dailymotion caps list endpoints at 100 items per page
+STATUS_BATCH_SIZE = 100
+
+
+def _status_from_data(data: Dict) -> Dict:
+    return {
+        'exists': True,
+        'private': data.get('private', False),
+        'password_protected': data.get('password_protected', False),
+        'status': data.get('status', ''),
+        'published': data.get('published', False),
+        'geoblocking': data.get('geoblocking', []),
+        'views_total': data.get('views_total', 0),
+        'updated_time': data.get('updated_time', ''),
+        'duration': data.get('duration', 0),
+    }
+
+
+def _forbidden_status() -> Dict:
+    # Private videos (and some region locked content) respond with 403, so treat as private
+    return {
+        'exists': True,
+        'private': True,
+        'password_protected': False,
+        'status': 'forbidden',
+        'published': False,
+        'geoblocking': [],
+        'views_total': 0,
+        'updated_time': '',
+        'duration': 0,
+    }
+
+
 def get_video_status(video_id: str) -> Dict:
     """
     Check the status of a specific video by ID (includes geo-blocking info).
@@ -116,42 +348,17 @@ def get_video_status(video_id: str) -> Dict:
         - updated_time: str
         - duration: int
     """
-    fields = [
-        'id', 'private', 'password_protected', 'status', 'published',
-        'geoblocking', 'views_total', 'updated_time', 'duration'
-    ]
-    q = urllib.parse.urlencode({'fields': ','.join(fields)})
-    url = f"https://api.dailymotion.com/video/{video_id}?{q}"
+    q = urllib.parse.urlencode({'fields': ','.join(STATUS_FIELDS)})
+    url = f"{DAILYMOTION_API_BASE}/video/{video_id}?{q}"
 
     try:
-        data = _http_get(url)
-        return {
-            'exists': True,
-            'private': data.get('private', False),
-            'password_protected': data.get('password_protected', False),
-            'status': data.get('status', ''),
-            'published': data.get('published', False),
-            'geoblocking': data.get('geoblocking', []),
-            'views_total': data.get('views_total', 0),
-            'updated_time': data.get('updated_time', ''),
-            'duration': data.get('duration', 0),
-        }
+        data = _http_get(url, endpoint='status')
+        return _status_from_data(data)
     except urllib.error.HTTPError as e:
         if e.code == 404:
             return {'exists': False}
         if e.code in (401, 403):
-            # Private videos (and some region locked content) respond with 403, so treat as private
-            return {
-                'exists': True,
-                'private': True,
-                'password_protected': False,
-                'status': 'forbidden',
-                'published': False,
-                'geoblocking': [],
-                'views_total': 0,
-                'updated_time': '',
-                'duration': 0,
-            }
+            return _forbidden_status()
         # Fail fast - don't catch other errors
         raise
     except Exception:
@@ -159,7 +366,229 @@ def get_video_status(video_id: str) -> Dict:
         raise
 
 
-def search_videos(terms: Iterable[str], per_term_limit: int = 10, sleep_sec: float = 0.5) -> List[Dict]:
+def get_video_statuses(video_ids: Iterable[str], verify_missing: bool = False) -> Dict[str, Dict]:
+    """
+    Batch version of get_video_status() using `/videos?ids=...`.
+
+    Up to STATUS_BATCH_SIZE ids are looked up per request. Ids that are not
+    returned by the list endpoint are treated as removed (`{'exists': False}`).
+    Private or forbidden videos can also be missing from list responses, so
+    with `verify_missing=True` each missing id is confirmed with a single-id
+    get_video_status() call (404 -> removed, 401/403 -> private). A batch that
+    is rejected with 400/401/403 as a whole falls back to single-id calls.
+    An id whose single-id call fails is left out of the result (status
+    unknown) instead of failing the rest of its batch.
+
+    Args:
+        video_ids: Dailymotion video IDs
+        verify_missing: Confirm ids missing from the batch response one by one
+
+    Returns:
+        Dict mapping video_id to the same status dict get_video_status() returns
+        (ids that could not be resolved are missing)
+    """
+    ids: List[str] = []
+    seen = set()
+    for vid in video_ids:
+        if vid and vid not in seen:
+            seen.add(vid)
+            ids.append(vid)
+
+    statuses: Dict[str, Dict] = {}
+
+    def lookup(vid: str) -> None:
+        try:
+            statuses[vid] = get_video_status(vid)
+        except Exception as e:
+            print(f"  Warning: Status check failed for video {vid}: {e}")
+
+    for i in range(0, len(ids), STATUS_BATCH_SIZE):
+        chunk = ids[i:i + STATUS_BATCH_SIZE]
+        q = urllib.parse.urlencode({
+            'ids': ','.join(chunk),
+            'fields': ','.join(STATUS_FIELDS),
+            'limit': len(chunk),
+        })
+        url = f"{DAILYMOTION_API}?{q}"
+
+        try:
+            data = _http_get(url, endpoint='status_batch')
+        except urllib.error.HTTPError as e:
+            if e.code not in (400, 401, 403):
+                raise
+            for vid in chunk:
+                lookup(vid)
+            continue
+
+        found: Dict[str, Dict] = {}
+        for item in data.get('list', []) or []:
+            vid = item.get('id')
+            if vid in seen:
+                found[vid] = _status_from_data(item)
+
+        for vid in chunk:
+            if vid in found:
+                statuses[vid] = found[vid]
+            elif verify_missing:
+                lookup(vid)
+            else:
+                statuses[vid] = {'exists': False}
+
+    return statuses
+
+
+SEARCH_FIELDS = [
+    'id', 'title', 'url', 'owner.username', 'owner.id', 'duration', 'created_time', 'views_total'
+]
+
+_PREFETCH_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_PREFETCH_LOCK = threading.Lock()
+
+
+def _prefetch_executor() -> ThreadPoolExecutor:
+    global _PREFETCH_EXECUTOR
+    with _PREFETCH_LOCK:
+        if _PREFETCH_EXECUTOR is None:
+            _PREFETCH_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix='dm-prefetch')
+        return _PREFETCH_EXECUTOR
+
+
+def _search_url(term: str, page: int, page_size: int, created_after: Optional[int]) -> str:
+    params = {
+        'search': term,
+        'fields': ','.join(SEARCH_FIELDS),
+        'limit': page_size,
+        'page': page,
+        'sort': 'relevance',
+    }
+    if created_after is not None:
+        params['sort'] = 'recent'
+        params['created_after'] = created_after
+    q = urllib.parse.urlencode(params)
+    return f"{DAILYMOTION_API}?{q}"
+
+
+def _search_term(
+    term: str,
+    per_term_limit: int,
+    wait: Callable[[int], None],
+    created_after: Optional[int] = None,
+    page_filter: Optional[PageFilter] = None,
+    min_page_yield: int = 0,
+    prefetch: bool = False,
+) -> Tuple[List[Dict], str]:
+    """
+    Page through search results for a single term.
+
+    Returns the hits and how paging ended: 'complete' (results ran out),
+    'limit' (per_term_limit reached), 'early_stop' or 'failed' (a page
+    request failed). Anything but 'complete' means older or less relevant
+    results were left unfetched.
+
+    With `created_after` set, only uploads newer than that unix timestamp are
+    requested, newest first (incremental mode); otherwise results are
+    relevance-sorted.
+
+    `wait(page)` is called before every page request that goes to the network
+    (cache hits skip it) and is where callers apply their own pacing.
+
+    With `page_filter` and `min_page_yield` > 0, each page of a
+    relevance-sorted query is passed to `page_filter(term, items)`, which
+    returns how many items would pass scoring; paging stops once a page
+    yields fewer than `min_page_yield`. Incremental queries are never
+    stopped early: newest-first order says nothing about later pages.
+
+    With `prefetch=True`, page N+1 is requested as soon as page N reports
+    `has_more` (and the limit is not reached yet), so it downloads while page
+    N is tagged and scored. At most one page per term is in flight, requests
+    still go through the shared rate limiter, and a prefetch is cancelled if
+    the term stops early (one that is already running still costs its
+    request, and is not counted as a saved page).
+    """
+    results: List[Dict] = []
+    # Calculate how many pages we need (max 100 per page)
+    page_size = min(per_term_limit, 100)
+    total_needed = per_term_limit
+    total_fetched = 0
+    page = 1
+
+    def fetch(page_no: int) -> Dict:
+        url = _search_url(term, page_no, page_size, created_after)
+        return _http_get(url, endpoint='search', cacheable=True, before_request=lambda: wait(page_no))
+
+    pending: Optional[Future] = None
+    outcome = 'limit'
+    while total_fetched < total_needed:
+        try:
+            if pending is not None:
+                data = pending.result()
+                pending = None
+            else:
+                data = fetch(page)
+        except Exception as e:
+            # Retries are exhausted (or the error is permanent); surface but continue
+            print(f"Dailymotion query failed for term='{term}' page={page}: {e}")
+            outcome = 'failed'
+            break
+
+        items = data.get('list', []) or []
+        if not items:
+            # No more results
+            outcome = 'complete'
+            break
+
+        # Check if there are more pages
+        has_more = data.get('has_more', False)
+        more_needed = len(items) < total_needed - total_fetched
+        if prefetch and has_more and more_needed:
+            pending = _prefetch_executor().submit(fetch, page + 1)
+
+        page_items: List[Dict] = []
+        for item in items:
+            item['__source_term'] = term
+            item['__page'] = page
+            page_items.append(item)
+            total_fetched += 1
+
+            if total_fetched >= total_needed:
+                break
+        results.extend(page_items)
+
+        if total_fetched >= total_needed:
+            outcome = 'complete' if not has_more and len(page_items) == len(items) else 'limit'
+            break
+        if not has_more:
+            outcome = 'complete'
+            break
+
+        # Relevance-sorted: a page with too few passing titles means later pages rarely help
+        if page_filter is not None and min_page_yield > 0 and created_after is None:
+            if page_filter(term, page_items) < min_page_yield:
+                remaining_pages = -(-(total_needed - total_fetched) // page_size)
+                _count('search', 'early_stops')
+                if pending is not None and not pending.cancel():
+                    # Already on the wire; its response is dropped and the page was not saved
+                    _count('search', 'prefetch_wasted')
+                    remaining_pages -= 1
+                _count('search', 'pages_saved', remaining_pages)
+                outcome = 'early_stop'
+                break
+
+        page += 1
+
+    return results, outcome
+
+
+def search_videos(
+    terms: Iterable[str],
+    per_term_limit: int = 10,
+    sleep_sec: float = 0.5,
+    created_after: Optional[Dict[str, int]] = None,
+    page_filter: Optional[PageFilter] = None,
+    min_page_yield: int = 0,
+    prefetch: bool = False,
+    outcomes: Optional[Dict[str, str]] = None,
+) -> List[Dict]:
     """
     Search for videos on Dailymotion.
 
@@ -167,6 +596,13 @@ def search_videos(terms: Iterable[str], per_term_limit: int = 10, sleep_sec: flo
         terms: Search terms to query
         per_term_limit: Total number of results to fetch per term (will use pagination if > 100)
         sleep_sec: Sleep time between API calls
+        created_after: Optional per-term unix timestamps; terms listed here only
+            fetch uploads newer than their timestamp (see WatermarkStore)
+        page_filter: Optional callback counting the items of a page that pass scoring
+        min_page_yield: Stop paging a term once a page yields fewer passing items
+        prefetch: Request the next page while the current one is processed
+        outcomes: Optional dict filled with term -> how its paging ended
+            ('complete', 'limit', 'early_stop' or 'failed')
 
     Returns:
         List of video dictionaries
@@ -175,59 +611,113 @@ def search_videos(terms: Iterable[str], per_term_limit: int = 10, sleep_sec: flo
         Dailymotion API limit is 100 per page. If per_term_limit > 100,
         will automatically fetch multiple pages.
     """
-    fields = [
-        'id', 'title', 'url', 'owner.username', 'owner.id', 'duration', 'created_time', 'views_total'
-    ]
-    results: List[Dict] = []
+    used_network = [False]
+
+    def wait(page: int) -> None:
+        used_network[0] = True
+        if page > 1:
+            time.sleep(sleep_sec)
 
+    bounds = created_after or {}
+    results: List[Dict] = []
     for term in terms:
-        # Calculate how many pages we need (max 100 per page)
-        page_size = min(per_term_limit, 100)
-        total_needed = per_term_limit
-        total_fetched = 0
-        page = 1
-
-        while total_fetched < total_needed:
-            # Build query for this page
-            q = urllib.parse.urlencode({
-                'search': term,
-                'fields': ','.join(fields),
-                'limit': page_size,
-                'page': page,
-                'sort': 'relevance',
-            })
-            url = f"{DAILYMOTION_API}?{q}"
-
-            try:
-                data = _http_get(url)
-            except Exception as e:
-                # Surface but continue
-                print(f"Dailymotion query failed for term='{term}' page={page}: {e}")
-                break
+        used_network[0] = False
+        hits, outcome = _search_term(
+            term, per_term_limit, wait, bounds.get(term), page_filter, min_page_yield, prefetch
+        )
+        if outcomes is not None:
+            outcomes[term] = outcome
+        results.extend(hits)
+        # Sleep between terms (already slept between pages); cached terms need no pause
+        if hits and used_network[0]:
+            time.sleep(sleep_sec)
 
-            items = data.get('list', []) or []
-            if not items:
-                # No more results
-                break
+    return results
 
-            for item in items:
-                item['__source_term'] = term
-                results.append(item)
-                total_fetched += 1
 
-                if total_fetched >= total_needed:
-                    break
+def _no_wait(page: int) -> None:
+    # Concurrent searches are paced by the shared limiter alone
+    pass
 
-            # Check if there are more pages
-            has_more = data.get('has_more', False)
-            if not has_more or total_fetched >= total_needed:
-                break
 
-            page += 1
-            time.sleep(sleep_sec)
+def submit_search(
+    pool: ThreadPoolExecutor,
+    terms: Iterable[str],
+    per_term_limit: int = 10,
+    created_after: Optional[Dict[str, int]] = None,
+    page_filter: Optional[PageFilter] = None,
+    min_page_yield: int = 0,
+    prefetch: bool = False,
+) -> List[Future]:
+    """
+    Queue terms on a caller-owned thread pool; one future per term, resolving to (hits, outcome).
 
-        # Sleep between terms (already slept between pages)
-        if total_fetched > 0:
-            time.sleep(sleep_sec)
+    Lets a caller keep a single pool busy across groups of terms with
+    different limits (and across series) instead of starting a pool per
+    search_videos_concurrent() call. Requests are paced by the shared limiter
+    only, so set its rate with get_rate_limiter() first. Arguments are the
+    same as search_videos_concurrent(); outcomes are those of search_videos().
+    """
+    bounds = created_after or {}
+    return [
+        pool.submit(
+            _search_term, term, per_term_limit, _no_wait, bounds.get(term),
+            page_filter, min_page_yield, prefetch,
+        )
+        for term in terms
+    ]
+
+
+def search_videos_concurrent(
+    terms: Iterable[str],
+    per_term_limit: int = 10,
+    concurrency: int = 4,
+    requests_per_sec: float = 5.0,
+    created_after: Optional[Dict[str, int]] = None,
+    page_filter: Optional[PageFilter] = None,
+    min_page_yield: int = 0,
+    prefetch: bool = False,
+    outcomes: Optional[Dict[str, str]] = None,
+) -> List[Dict]:
+    """
+    Concurrent variant of search_videos().
+
+    Terms are paged in parallel on a thread pool; every page request takes a
+    token from the shared process-wide bucket instead of sleeping, so the
+    global request rate stays at `requests_per_sec` regardless of concurrency.
+
+    Args:
+        terms: Search terms to query
+        per_term_limit: Total number of results to fetch per term
+        concurrency: Number of terms paged at the same time
+        requests_per_sec: Global request rate shared by all workers
+        created_after: Optional per-term unix timestamps (incremental mode)
+        page_filter: Optional callback counting passing items per page (must be thread-safe)
+        min_page_yield: Stop paging a term once a page yields fewer passing items
+        prefetch: Keep the next page of each term in flight while the current one is processed
+        outcomes: Optional dict filled with term -> how its paging ended (see search_videos())
+
+    Returns:
+        List of video dictionaries, in the same order as search_videos()
+        (grouped by term in input order, then by page)
+    """
+    term_list = list(terms)
+    if not term_list:
+        return []
+
+    # _http_get() takes a token from the shared limiter before every request
+    get_rate_limiter(requests_per_sec)
+
+    results: List[Dict] = []
+    workers = max(1, min(concurrency, len(term_list)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = submit_search(
+            pool, term_list, per_term_limit, created_after, page_filter, min_page_yield, prefetch
+        )
+        for term, future in zip(term_list, futures):
+            hits, outcome = future.result()
+            if outcomes is not None:
+                outcomes[term] = outcome
+            results.extend(hits)
 
     return results
@@ -0,0 +1,212 @@
+from __future__ import annotations
+import email.message
+import gzip
+import http.client
+import io
+import os
+import queue
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+import zlib
+from typing import Dict, Optional, Tuple
+
+
+# Errors that mean a pooled keep-alive connection went stale between requests
+_STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+_REDIRECT_CODES = {301, 302, 303, 307, 308}
+
+
+class _HostPool:
+    """Idle keep-alive connections for one (scheme, host, port) plus a cap on open ones."""
+
+    def __init__(self, scheme: str, host: str, port: Optional[int], max_connections: int):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.idle: "queue.LifoQueue[http.client.HTTPConnection]" = queue.LifoQueue()
+        self.slots = threading.BoundedSemaphore(max_connections)
+
+    def new_connection(self, timeout: float) -> http.client.HTTPConnection:
+        if self.scheme == 'https':
+            return http.client.HTTPSConnection(self.host, self.port, timeout=timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+
+    def checkout(self, timeout: float) -> Tuple[http.client.HTTPConnection, bool]:
+        """Return (connection, reused)."""
+        self.slots.acquire()
+        try:
+            conn = self.idle.get_nowait()
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            return conn, True
+        except queue.Empty:
+            return self.new_connection(timeout), False
+
+    def checkin(self, conn: http.client.HTTPConnection, reusable: bool) -> None:
+        if reusable:
+            self.idle.put(conn)
+        else:
+            conn.close()
+        self.slots.release()
+
+    def close(self) -> None:
+        while True:
+            try:
+                self.idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class HTTPSession:
+    """
+    Thread-safe pooled HTTP client with keep-alive and gzip support.
+
+    Connections are reused per host, and at most `max_per_host` requests are
+    in flight to the same host at once. Non-2xx responses raise
+    urllib.error.HTTPError so callers can keep inspecting `e.code` exactly as
+    they did with urllib.request.urlopen().
+
+    If an HTTP(S) proxy is configured in the environment, requests fall back
+    to urllib (which honors proxies) instead of the direct connection pool.
+    """
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None, max_per_host: int = 8):
+        self.headers = {'Accept-Encoding': 'gzip', 'Connection': 'keep-alive'}
+        self.headers.update(headers or {})
+        self.max_per_host = max(1, max_per_host)
+        self._pools: Dict[Tuple[str, str, Optional[int]], _HostPool] = {}
+        self._lock = threading.Lock()
+        self._proxies = urllib.request.getproxies()
+
+    def _pool_for(self, scheme: str, host: str, port: Optional[int]) -> _HostPool:
+        key = (scheme, host, port)
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = _HostPool(scheme, host, port, self.max_per_host)
+                self._pools[key] = pool
+            return pool
+
+    def _uses_proxy(self, scheme: str, host: str) -> bool:
+        if scheme not in self._proxies:
+            return False
+        return not urllib.request.proxy_bypass(host)
+
+    @staticmethod
+    def _decode(body: bytes, encoding: Optional[str]) -> bytes:
+        encoding = (encoding or '').lower()
+        if encoding == 'gzip':
+            return gzip.decompress(body)
+        if encoding == 'deflate':
+            return zlib.decompress(body)
+        return body
+
+    def _get_via_urllib(self, url: str, headers: Dict[str, str], timeout: float) -> Tuple[int, Dict[str, str], bytes]:
+        req = urllib.request.Request(url, headers=headers)
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            body = self._decode(resp.read(), resp.headers.get('Content-Encoding'))
+            return resp.status, dict(resp.headers.items()), body
+
+    def _get_once(self, url: str, headers: Dict[str, str], timeout: float) -> Tuple[int, Dict[str, str], bytes]:
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ('http', 'https'):
+            raise ValueError(f'Unsupported URL scheme: {url}')
+        if self._uses_proxy(scheme, parts.hostname or ''):
+            return self._get_via_urllib(url, headers, timeout)
+
+        pool = self._pool_for(scheme, parts.hostname or '', parts.port)
+        path = parts.path or '/'
+        if parts.query:
+            path = f'{path}?{parts.query}'
+
+        conn, reused = pool.checkout(timeout)
+        reusable = False
+        try:
+            try:
+                conn.request('GET', path, headers=headers)
+                resp = conn.getresponse()
+            except _STALE_ERRORS:
+                if not reused:
+                    raise
+                # Server closed an idle keep-alive connection; retry once on a fresh one
+                conn.close()
+                conn = pool.new_connection(timeout)
+                conn.request('GET', path, headers=headers)
+                resp = conn.getresponse()
+            raw = resp.read()
+            reusable = not resp.will_close
+            resp_headers = dict(resp.getheaders())
+            body = self._decode(raw, resp.getheader('Content-Encoding'))
+            return resp.status, resp_headers, body
+        finally:
+            pool.checkin(conn, reusable)
+
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None, timeout: float = 15) -> Tuple[int, Dict[str, str], bytes]:
+        """
+        Issue a GET request.
+
+        Returns:
+            Tuple of (status, response_headers, decoded_body)
+
+        Raises:
+            urllib.error.HTTPError: for 4xx/5xx responses
+            urllib.error.URLError: for connection-level failures
+        """
+        merged = dict(self.headers)
+        merged.update(headers or {})
+        for _ in range(5):
+            try:
+                status, resp_headers, body = self._get_once(url, merged, timeout)
+            except (OSError, http.client.HTTPException) as e:
+                if isinstance(e, urllib.error.URLError):
+                    raise
+                raise urllib.error.URLError(e) from e
+            if status in _REDIRECT_CODES:
+                location = resp_headers.get('Location') or resp_headers.get('location')
+                if location:
+                    url = urllib.parse.urljoin(url, location)
+                    continue
+            if status >= 400:
+                hdrs = email.message.Message()
+                for k, v in resp_headers.items():
+                    hdrs[k] = v
+                raise urllib.error.HTTPError(url, status, http.client.responses.get(status, ''), hdrs, io.BytesIO(body))
+            return status, resp_headers, body
+        raise urllib.error.URLError(f'Too many redirects for {url}')
+
+    def close(self) -> None:
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.close()
+
+
+_SESSION: Optional[HTTPSession] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def get_session() -> HTTPSession:
+    """Return the process-wide session used by platform clients."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            try:
+                max_per_host = int(os.environ.get('HTTP_MAX_CONNECTIONS_PER_HOST', '8'))
+            except ValueError:
+                max_per_host = 8
+            _SESSION = HTTPSession(
+                headers={'User-Agent': 'col-piracy/0.1 (+internal)'},
+                max_per_host=max_per_host,
+            )
+        return _SESSION
@@ -0,0 +1,165 @@
+from __future__ import annotations
+import datetime as dt
+import email.utils
+import random
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket used to pace API calls across worker threads.
+
+    Args:
+        rate: Tokens added per second (i.e. sustained requests per second)
+        capacity: Maximum burst size (defaults to max(1, rate))
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self._lock = threading.Lock()
+        self.rate = max(float(rate), 0.01)
+        self.capacity = float(capacity) if capacity is not None else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._last
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._last = now
+
+    def set_rate(self, rate: float) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(float(rate), 0.01)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until `tokens` are available. Returns seconds spent waiting."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class AdaptiveRateLimiter(TokenBucket):
+    """
+    Token bucket whose rate backs off on throttling and recovers when healthy.
+
+    After a 429 the rate is multiplied by `decrease_factor` (never below
+    `min_rate`) and, if the server sent Retry-After, every caller is held
+    until that moment. 429s arriving before the Retry-After moment or
+    within one refill interval of the last decrease answer requests sent at
+    the old rate, so they do not lower it again (N workers hitting the same
+    limit back off once, not N times). After `recover_after` consecutive successes the rate
+    climbs back by `increase_step` * max_rate, up to the configured maximum.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        min_rate: float = 0.2,
+        decrease_factor: float = 0.5,
+        increase_step: float = 0.1,
+        recover_after: int = 20,
+    ):
+        super().__init__(rate)
+        self.max_rate = self.rate
+        self.min_rate = min(min_rate, self.max_rate)
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.recover_after = max(1, recover_after)
+        self._successes = 0
+        self._blocked_until = 0.0
+        self._cooldown_until = 0.0
+
+    def set_rate(self, rate: float) -> None:
+        super().set_rate(rate)
+        with self._lock:
+            self.max_rate = self.rate
+            self.min_rate = min(self.min_rate, self.max_rate)
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        waited = 0.0
+        while True:
+            with self._lock:
+                delay = self._blocked_until - time.monotonic()
+            if delay <= 0:
+                break
+            time.sleep(delay)
+            waited += delay
+        return waited + super().acquire(tokens)
+
+    def on_throttle(self, retry_after: Optional[float] = None) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._successes = 0
+            # Drop any saved-up burst so the slowdown takes effect immediately
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+            if now < self._cooldown_until:
+                return
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self._cooldown_until = max(self._blocked_until, now + 1.0 / self.rate)
+
+    def on_success(self) -> None:
+        with self._lock:
+            if self.rate >= self.max_rate:
+                return
+            self._successes += 1
+            if self._successes >= self.recover_after:
+                self._successes = 0
+                self._refill(time.monotonic())
+                self.rate = min(self.max_rate, self.rate + self.max_rate * self.increase_step)
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter, honoring server Retry-After hints.
+
+    Args:
+        max_retries: Retries after the first attempt
+        base_delay: Delay scale in seconds for the first retry
+        max_delay: Upper bound for any single wait
+    """
+
+    def __init__(self, max_retries: int = 4, base_delay: float = 1.0, max_delay: float = 60.0):
+        self.max_retries = max(0, max_retries)
+        self.base_delay = max(0.0, base_delay)
+        self.max_delay = max(self.base_delay, max_delay)
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Seconds to wait before retry number `attempt` (0-based)."""
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        if retry_after is not None:
+            return min(self.max_delay, max(retry_after, backoff))
+        return backoff
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when is None:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=dt.timezone.utc)
+    return max(0.0, (when - dt.datetime.now(dt.timezone.utc)).total_seconds())
@@ -0,0 +1,79 @@
+from __future__ import annotations
+import datetime as dt
+import json
+import os
+import threading
+from typing import Collection, Dict, Iterable, Optional
+
+
+class WatermarkStore:
+    """
+    Per-term `created_time` watermarks for incremental searches.
+
+    The JSON file holds the newest upload time seen for each search term and
+    the date of the last full (non-incremental) sweep:
+
+        {"last_full_sweep": "2025-01-31", "terms": {"<term>": 1738300000}}
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self.terms: Dict[str, int] = {}
+        self.last_full_sweep: Optional[str] = None
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+            self.terms = {str(k): int(v) for k, v in (raw.get('terms') or {}).items()}
+            self.last_full_sweep = raw.get('last_full_sweep')
+
+    def needs_full_sweep(self, today: dt.date, every_days: int) -> bool:
+        """True if no full sweep ran within the last `every_days` days."""
+        if not self.last_full_sweep:
+            return True
+        try:
+            last = dt.date.fromisoformat(self.last_full_sweep)
+        except ValueError:
+            return True
+        return (today - last).days >= every_days
+
+    def mark_full_sweep(self, today: dt.date) -> None:
+        self.last_full_sweep = today.isoformat()
+
+    def created_after(self, terms: Iterable[str], overlap_sec: int = 0) -> Dict[str, int]:
+        """Map each term that has a watermark to the `created_after` bound to query with."""
+        with self._lock:
+            return {
+                term: max(0, self.terms[term] - overlap_sec) for term in terms if term in self.terms
+            }
+
+    def observe(self, hits: Iterable[Dict], truncated: Collection[str] = ()) -> None:
+        """
+        Advance watermarks from search hits (uses `__source_term` and `created_time`).
+
+        Terms in `truncated` stopped paging before their results ran out (limit
+        reached, early stop or a failed page). Their unfetched results can be
+        older than the newest hit, so their watermarks are left unchanged and
+        the next run asks for the same window again.
+        """
+        with self._lock:
+            for h in hits:
+                term = h.get('__source_term')
+                created = h.get('created_time')
+                if not term or created is None or term in truncated:
+                    continue
+                try:
+                    created = int(created)
+                except (TypeError, ValueError):
+                    continue
+                if created > self.terms.get(term, 0):
+                    self.terms[term] = created
+
+    def save(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        tmp = f'{self.path}.tmp'
+        with self._lock:
+            payload = {'last_full_sweep': self.last_full_sweep, 'terms': self.terms}
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
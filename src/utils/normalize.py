@@ -1,5 +1,7 @@
 import re
 import unicodedata
+from functools import lru_cache
+from typing import Dict
 
 
 _APOSTROPHES = {
@@ -10,32 +12,61 @@ _APOSTROPHES = {
     "ʻ": "'",
 }
 
+# Common ascii punctuation plus quotes/middle dot, replaced by spaces in normalize_for_match
+_MATCH_PUNCT_RE = re.compile(r"[\.,;:!\?\-_/\\\(\)\[\]\{\}\|\*\^\$`~\"'“”‘’·]+")
+_ALIAS_SPLIT_RE = re.compile(r"[\n,;，、/\\\|]+")
+
+# Titles and aliases repeat heavily across expansion, scoring, import and dedupe
+_MEMO_SIZE = 65536
+
+
+def _normalize_text_uncached(s: str) -> str:
+    # Normalize unicode width/compatibility
+    s = unicodedata.normalize("NFKC", s)
+    # Standardize apostrophes (str.replace beats str.translate here; most titles have none)
+    for k, v in _APOSTROPHES.items():
+        if k in s:
+            s = s.replace(k, v)
+    # Collapse whitespace; split() uses the same whitespace set as `\s`
+    return " ".join(s.split())
+
+
+_normalize_text = lru_cache(maxsize=_MEMO_SIZE)(_normalize_text_uncached)
+
+
+@lru_cache(maxsize=_MEMO_SIZE)
+def _normalize_for_match(s: str) -> str:
+    # Lowercase for Latin; keep CJK scripts untouched but casefold safe.
+    # Full-width spaces were already folded by NFKC and the whitespace collapse.
+    s = _normalize_text_uncached(s).casefold()
+    # Strip common punctuation, then collapse the spaces it leaves behind
+    return " ".join(_MATCH_PUNCT_RE.sub(" ", s).split())
+
 
 def normalize_text(s: str) -> str:
     if s is None:
         return ""
-    # Normalize unicode width/compatibility
-    s = unicodedata.normalize("NFKC", str(s))
-    # Standardize apostrophes
-    for k, v in _APOSTROPHES.items():
-        s = s.replace(k, v)
-    # Collapse whitespace
-    s = re.sub(r"\s+", " ", s)
-    s = s.strip()
-    return s
+    return _normalize_text(str(s))
 
 
 def normalize_for_match(s: str) -> str:
-    s = normalize_text(s)
-    # Lowercase for Latin; keep CJK scripts untouched but casefold safe
-    s = s.casefold()
-    # Remove leading/trailing punctuation and collapse multiple punctuation
-    s = re.sub(r"[\u3000\s]+", " ", s)  # full-width space -> normal
-    s = re.sub(r"[\p{P}\p{S}]+", " ", s) if hasattr(re, "_pattern_type") else s
-    # Fallback punctuation strip: remove common ascii punct
-    s = re.sub(r"[\.,;:!\?\-_/\\\(\)\[\]\{\}\|\*\^\$`~\"'“”‘’·]+", " ", s)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    if s is None:
+        return ""
+    return _normalize_for_match(str(s))
+
+
+def normalize_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Hit/miss counts of the normalization memos."""
+    stats = {}
+    for name, fn in (("normalize_text", _normalize_text), ("normalize_for_match", _normalize_for_match)):
+        info = fn.cache_info()
+        stats[name] = {"hits": info.hits, "misses": info.misses, "size": info.currsize, "max_size": info.maxsize}
+    return stats
+
+
+def clear_normalize_cache() -> None:
+    _normalize_text.cache_clear()
+    _normalize_for_match.cache_clear()
 
 
 def split_aliases(raw: str) -> list[str]:
@@ -43,6 +74,5 @@ def split_aliases(raw: str) -> list[str]:
         return []
     raw = normalize_text(raw)
     # Split on common separators including CJK punctuation
-    parts = re.split(r"[\n,;，、/\\\|]+", raw)
+    parts = _ALIAS_SPLIT_RE.split(raw)
     return [p.strip() for p in parts if p and p.strip()]
-
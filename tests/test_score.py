@@ -0,0 +1,77 @@
+import json
+import os
+import re
+
+import pytest
+
+import src.matching.score as score
+from src.matching.score import SeriesMatcher
+
+FIXTURE = os.path.join(os.path.dirname(__file__), '..', 'src', 'bench', 'fixtures', 'fuzzy_pairs.jsonl')
+
+
+def _fixture():
+    with open(FIXTURE, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+@pytest.mark.parametrize('rapidfuzz', [True, False], ids=['rapidfuzz', 'fallback'])
+def test_pruned_scores_match_unpruned(rapidfuzz, monkeypatch):
+    if not rapidfuzz:
+        monkeypatch.setattr(score, '_rf_fuzz', None)
+    rows = _fixture()[:200]
+    aliases = sorted({r['alias'] for r in rows})
+    for i, r in enumerate(rows):
+        # The matching alias among a few unrelated ones, so pruning has something to skip
+        series = [r['alias']] + aliases[i % len(aliases):][:3]
+        pruned = SeriesMatcher(series, prune=True)
+        full = SeriesMatcher(series, prune=False)
+        assert pruned.score(r['title']) == full.score(r['title']), r['title']
+
+
+def _regex_scan(t_norm, aliases):
+    # Reference: `\bkw\b` for latin boost words, plain substring for CJK/Thai ones and aliases
+    boosts = sum(
+        1 for kw in score._BOOST_PATTERNS
+        if (re.search(rf'\b{re.escape(kw)}\b', t_norm) if score._word_bounded(kw) else kw in t_norm)
+    )
+    return boosts, any(a in t_norm for a in aliases)
+
+
+@pytest.mark.parametrize('title, expected', [
+    ('my love ep 12', (1, True)),
+    ('my love episode 12', (1, True)),
+    ('my love ep12', (0, True)),
+    ('my love episodes', (0, True)),
+    ('my love ep episode full hd', (4, True)),
+    ('my love_ep 3', (0, True)),
+    ('deep love', (0, False)),
+    ('my love 第12集 完整版', (3, True)),
+    ('我的爱第12話', (2, False)),
+    ('รักนี้ตอนที่1', (1, False)),
+])
+def test_scan_boost_word_boundaries(title, expected):
+    matcher = SeriesMatcher(['my love'])
+    assert matcher.scan(title) == expected
+    assert matcher.scan(title) == _regex_scan(title, matcher.norms)
+
+
+def test_scan_matches_regex_reference():
+    rows = _fixture()
+    matcher = SeriesMatcher([r['alias'] for r in rows[:50]])
+    for r in rows:
+        assert matcher.scan(r['title']) == _regex_scan(r['title'], matcher.norms), r['title']
+
+
+def test_py_fallback_matches_recorded_rapidfuzz():
+    for r in _fixture():
+        assert score._py_ratio(r['title'], r['alias']) == pytest.approx(r['ratio'], abs=1e-9), r['title']
+        assert score._py_partial_ratio(r['title'], r['alias']) == pytest.approx(r['partial_ratio'], abs=1e-9), r['title']
+
+
+def test_py_partial_ratio_score_cutoff():
+    fuzz = pytest.importorskip('rapidfuzz.fuzz')
+    for r in _fixture()[:200]:
+        for cutoff in (70.0, 80.0, 90.0, 95.0):
+            expected = fuzz.partial_ratio(r['title'], r['alias'], score_cutoff=cutoff)
+            assert score._py_partial_ratio(r['title'], r['alias'], cutoff) == pytest.approx(expected, abs=1e-9), r['title']
@@ -0,0 +1,60 @@
+import urllib.error
+import urllib.parse
+
+import src.platforms.dailymotion as dailymotion
+from src.platforms.watermarks import WatermarkStore
+
+
+def _hit(term, created):
+    return {'id': f'x{created}', '__source_term': term, 'created_time': created}
+
+
+def _fake_search(pages, fail_on_page=None):
+    """_http_get stand-in serving `pages` (lists of created_time values, newest first)."""
+    def fake_http_get(url, **kwargs):
+        page = int(urllib.parse.parse_qs(url.split('?', 1)[1])['page'][0])
+        if page == fail_on_page:
+            raise urllib.error.URLError('connection reset')
+        items = [{'id': f'x{t}', 'title': 't', 'created_time': t} for t in pages[page - 1]]
+        return {'list': items, 'has_more': page < len(pages)}
+    return fake_http_get
+
+
+def test_observe_advances_complete_terms(tmp_path):
+    store = WatermarkStore(str(tmp_path / 'watermarks.json'))
+    store.terms['a'] = 100
+    store.observe([_hit('a', 150), _hit('a', 300), _hit('b', 200)])
+    assert store.terms == {'a': 300, 'b': 200}
+
+
+def test_observe_keeps_watermark_of_truncated_terms(tmp_path):
+    store = WatermarkStore(str(tmp_path / 'watermarks.json'))
+    store.terms['a'] = 100
+    store.observe([_hit('a', 300), _hit('b', 200), _hit('c', 50)], truncated={'a', 'b'})
+    # 'a' keeps its old watermark, 'b' gets none; the next run asks for the same window
+    assert store.terms == {'a': 100, 'c': 50}
+
+
+def test_search_outcomes_mark_limit_and_failure(monkeypatch):
+    outcomes = {}
+    monkeypatch.setattr(dailymotion, '_http_get', _fake_search([[500, 400], [300, 200]]))
+    dailymotion.search_videos(['limited'], per_term_limit=2, sleep_sec=0, outcomes=outcomes)
+    dailymotion.search_videos(['full'], per_term_limit=10, sleep_sec=0, outcomes=outcomes)
+    monkeypatch.setattr(dailymotion, '_http_get', _fake_search([[500, 400], [300, 200]], fail_on_page=2))
+    dailymotion.search_videos(['broken'], per_term_limit=10, sleep_sec=0, outcomes=outcomes)
+    assert outcomes == {'limited': 'limit', 'full': 'complete', 'broken': 'failed'}
+
+
+def test_incremental_search_does_not_skip_unfetched_uploads(tmp_path, monkeypatch):
+    store = WatermarkStore(str(tmp_path / 'watermarks.json'))
+    store.terms['term'] = 100
+    # Newest first: the limit cuts the term off after the first page
+    monkeypatch.setattr(dailymotion, '_http_get', _fake_search([[500, 400], [300, 200]]))
+    outcomes = {}
+    hits = dailymotion.search_videos(
+        ['term'], per_term_limit=2, sleep_sec=0,
+        created_after=store.created_after(['term']), outcomes=outcomes,
+    )
+    store.observe(hits, truncated={t for t, o in outcomes.items() if o != 'complete'})
+    # Uploads at 300 and 200 were never fetched, so the watermark must not jump to 500
+    assert store.terms['term'] == 100